@@ -1,12 +1,53 @@
-from .dto import TimePointDTO, FitModelRequest, FitModelResponse
+from .dto import (
+    FitModelRequest,
+    FitModelResponse,
+    RefitModelRequest,
+    BatchFitItemResult,
+    PredictRequest,
+    PredictResponse,
+    SeriesColumns,
+    PanelFitRequest,
+    PanelFitResponse,
+    BatchPredictRequest,
+    BatchPredictResponse,
+    BacktestRequest,
+    BacktestFold,
+    BacktestResponse,
+    ParamRange,
+    TuneRequest,
+    TuneTrial,
+    TuneResponse,
+)
 from .use_cases.fit_model import FitModelUseCase
-from .services.metrics import MAECalculator, RMSECalculator
 
 __all__ = [
-    "TimePointDTO",
     "FitModelRequest",
     "FitModelResponse",
+    "RefitModelRequest",
+    "BatchFitItemResult",
+    "PredictRequest",
+    "PredictResponse",
+    "SeriesColumns",
+    "PanelFitRequest",
+    "PanelFitResponse",
+    "BatchPredictRequest",
+    "BatchPredictResponse",
+    "BacktestRequest",
+    "BacktestFold",
+    "BacktestResponse",
+    "ParamRange",
+    "TuneRequest",
+    "TuneTrial",
+    "TuneResponse",
     "FitModelUseCase",
     "MAECalculator",
     "RMSECalculator"
 ]
+
+
+def __getattr__(name: str):
+    # Калькуляторы метрик загружаются при первом обращении, а не при импорте пакета
+    if name in ("MAECalculator", "RMSECalculator"):
+        from .services import metrics
+        return getattr(metrics, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,25 +1,181 @@
-from dataclasses import dataclass
-from typing import List, Dict, Any
-from datetime import datetime
-
-@dataclass
-class TimePointDTO:
-    timestamp: datetime
-    endogenous: float
-    exogenous: Dict[str, float]
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Union
+import numpy as np
 
 @dataclass
 class FitModelRequest:
     time_series_id: str
-    points: List[TimePointDTO]
+    timestamps: np.ndarray  # int64, наносекунды с начала эпохи
+    endogenous: np.ndarray  # float64, (n,)
+    exogenous: np.ndarray  # float64, (n, n_exog), столбцы в порядке exogenous_names
+    exogenous_names: List[str]
     horizon: int
     strategy: str  # 'direct', 'recursive', 'multioutput'
     lags: int
     catboost_params: Dict[str, Any]
     metrics: List[str]
+    model_response: str = "inline"  # 'inline', 'omit', 'link'
 
 @dataclass
 class FitModelResponse:
     model_id: str
-    model_base64: str
+    model_base64: Optional[str]  # только при model_response='inline'
+    metrics: Dict[str, float]
+    model_format: str = "cbm"
+    compression: str = "none"
+    model_response: str = "inline"
+    timings: Optional[Dict[str, float]] = None  # этап -> секунды; None, если не замерялись
+
+@dataclass
+class TrainingResult:
+    model_bytes: bytes
+    metrics: Dict[str, float]
+    snapshot: Optional[Dict[str, Any]] = None  # хвост ряда для дообучения (series_snapshot)
+    timings: Dict[str, float] = field(default_factory=dict)  # этап -> секунды (StageTimer)
+    model_format: Optional[str] = None  # формат model_bytes (IModelSerializer.format_of); None — model_format сериализатора
+
+@dataclass
+class RefitModelRequest:
+    model_id: str
+    timestamps: np.ndarray  # только новые точки
+    endogenous: np.ndarray
+    exogenous: np.ndarray
+    exogenous_names: List[str]
+    catboost_params: Dict[str, Any]  # поверх сохранённых с моделью; iterations — число новых деревьев (по умолчанию 100)
+    metrics: Optional[List[str]] = None  # по умолчанию — метрики исходной модели
+    model_response: str = "inline"
+
+@dataclass
+class PanelTrainingResult(TrainingResult):
+    series_metrics: Dict[str, Dict[str, float]] = field(default_factory=dict)  # series_id -> метрики
+
+@dataclass
+class BatchFitItemResult:
+    index: int
+    time_series_id: str
+    model_id: Optional[str] = None
+    model_base64: Optional[str] = None
+    metrics: Optional[Dict[str, float]] = None
+    error: Optional[str] = None
+    model_format: Optional[str] = None
+    compression: Optional[str] = None
+
+@dataclass
+class PredictRequest:
+    model_id: str
+    timestamps: np.ndarray
+    endogenous: np.ndarray
+    exogenous: np.ndarray
+    exogenous_names: List[str]
+
+@dataclass
+class PredictResponse:
+    model_id: str
+    forecast: List[float]
+
+@dataclass
+class SeriesColumns:
+    series_id: str
+    timestamps: np.ndarray
+    endogenous: np.ndarray
+    exogenous: np.ndarray
+    exogenous_names: List[str]
+
+@dataclass
+class PanelFitRequest:
+    time_series_id: str  # идентификатор панели; сохраняется в метаданных модели как series_id
+    series: List[SeriesColumns]
+    exogenous_names: List[str]  # общие для всех рядов панели
+    horizon: int
+    strategy: str
+    lags: int
+    catboost_params: Dict[str, Any]
+    metrics: List[str]
+    model_response: str = "inline"
+
+@dataclass
+class PanelFitResponse:
+    fit: FitModelResponse  # metrics — среднее по рядам панели
+    series_metrics: Dict[str, Dict[str, float]]
+
+@dataclass
+class BatchPredictRequest:
+    model_id: str
+    series: List[SeriesColumns]
+
+@dataclass
+class BatchPredictResponse:
+    model_id: str
+    forecasts: Dict[str, List[float]]  # series_id -> прогноз
+
+@dataclass
+class BacktestRequest:
+    time_series_id: str
+    timestamps: np.ndarray
+    endogenous: np.ndarray
+    exogenous: np.ndarray
+    exogenous_names: List[str]
+    horizon: int
+    strategy: str
+    lags: int
+    catboost_params: Dict[str, Any]
+    metrics: List[str]
+    n_folds: int = 3
+    step: Optional[int] = None  # сдвиг точки отсечения между фолдами; по умолчанию horizon
+    window: Optional[int] = None  # длина скользящего окна обучения в точках; None — расширяющееся окно
+
+@dataclass
+class BacktestFold:
+    index: int
+    cutoff: int  # метка времени первой точки тестового периода, нс
+    train_size: int  # число обучающих примеров
     metrics: Dict[str, float]
+
+@dataclass
+class BacktestResponse:
+    time_series_id: str
+    folds: List[BacktestFold]
+    metrics: Dict[str, float]  # среднее по фолдам
+    metrics_std: Dict[str, float]  # стандартное отклонение по фолдам
+    metrics_by_step: Dict[str, List[float]]  # по шагам горизонта на всех фолдах
+
+@dataclass
+class ParamRange:
+    low: float
+    high: float
+    log: bool = False  # выбирать равномерно в логарифмической шкале
+
+@dataclass
+class TuneRequest:
+    time_series_id: str
+    timestamps: np.ndarray
+    endogenous: np.ndarray
+    exogenous: np.ndarray
+    exogenous_names: List[str]
+    horizon: int
+    strategy: str
+    lags: int
+    catboost_params: Dict[str, Any]  # общие параметры всех попыток
+    metrics: List[str]
+    search_space: Dict[str, Union[List[Any], ParamRange]]  # параметр -> список значений или диапазон
+    n_trials: int = 9
+    reduction_factor: int = 3  # во сколько раз сокращается число попыток на каждом раунде
+    validation_fraction: float = 0.2  # доля последних обучающих примеров для валидации
+    early_stopping_rounds: int = 20
+    seed: int = 0
+    model_response: str = "inline"
+
+@dataclass
+class TuneTrial:
+    index: int
+    params: Dict[str, Any]
+    score: Optional[float] = None  # лучшее значение метрики на валидации
+    best_iteration: Optional[int] = None
+    rounds: int = 0  # число пройденных раундов отбора
+
+@dataclass
+class TuneResponse:
+    fit: FitModelResponse  # лучшая модель, сохранённая в репозиторий
+    best_params: Dict[str, Any]
+    best_score: float
+    trials: List[TuneTrial]
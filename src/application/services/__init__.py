@@ -1,17 +1,20 @@
-from src.application.services.metrics import (
-    MAECalculator,
-    RMSECalculator,
-    MSECalculator,
-    MAPECalculator,
-    SMAPECalculator,
-    R2Calculator,
-    MaxErrorCalculator
+# Калькуляторы метрик (src.application.services.metrics) не импортируются здесь:
+# их загружает MetricFactory при первом обращении к метрике
+from src.application.services.metrics_engine import (
+    Residuals,
+    ResidualMetricCalculator,
+    MetricsReport,
+    MetricsEngine,
 )
+from src.application.services.training import ModelTrainingService
+from src.application.services.backtest import BacktestService
+from src.application.services.tuning import TuningService
 
-__all__ = ["MAECalculator",
-    "RMSECalculator",
-    "MSECalculator",
-    "MAPECalculator",
-    "SMAPECalculator",
-    "R2Calculator",
-    "MaxErrorCalculator"]
+__all__ = [
+    "Residuals",
+    "ResidualMetricCalculator",
+    "MetricsReport",
+    "MetricsEngine",
+    "ModelTrainingService",
+    "BacktestService",
+    "TuningService"]
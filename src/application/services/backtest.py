@@ -0,0 +1,154 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from src.domain import TimeSeries, ForecastHorizon, LagCount
+from src.domain import ITrainer, IForecastStrategy, StrategyFactory, MetricFactory
+from src.application.dto import BacktestRequest
+from src.application.services.training import training_params
+from src.application.services.metrics_engine import MetricsEngine, MetricsReport
+
+
+@dataclass
+class BacktestPlan:
+    """
+    Подготовленные данные бэктеста: матрица признаков всего ряда и границы фолдов.
+
+    Для фолда j обучающая выборка — строки x[starts[j]:stops[j]] (срез без копирования),
+    тестовый период — точки [cutoffs[j], cutoffs[j] + horizon).
+    """
+    series: TimeSeries
+    strategy: IForecastStrategy
+    x: np.ndarray
+    y: np.ndarray
+    cutoffs: List[int]
+    starts: List[int]
+    stops: List[int]
+    params: Dict[str, Any]
+
+
+class BacktestService:
+    """
+    Оценка модели скользящим началом прогноза (rolling-origin): для каждого фолда
+    модель обучается только на данных до точки отсечения и прогнозирует следующие
+    horizon точек.
+
+    Матрица признаков строится один раз для всего ряда; обучающая выборка фолда —
+    её срез. fit_fold не хранит состояния, поэтому фолды можно обучать в рабочих
+    процессах пула независимо друг от друга.
+    """
+
+    def __init__(
+        self,
+        strategy_factory: StrategyFactory,
+        trainer: ITrainer,
+        metric_factory: MetricFactory,
+    ):
+        self.strategy_factory = strategy_factory
+        self.trainer = trainer
+        self.metric_factory = metric_factory
+        self.metrics_engine = MetricsEngine(metric_factory)
+
+    def plan(self, request: BacktestRequest) -> BacktestPlan:
+        """
+        Строит матрицу признаков и раскладывает ряд на фолды.
+
+        Точки отсечения идут с шагом step (по умолчанию horizon) так, что тестовый
+        период последнего фолда заканчивается на последней точке ряда.
+
+        Исключения
+        ----------
+        ValueError
+            Если стратегия или метрика не зарегистрированы, или если ряда
+            не хватает на запрошенное число фолдов.
+        """
+        strategy = self.strategy_factory.get(request.strategy)
+        if not strategy:
+            raise ValueError(f"Unknown strategy: {request.strategy}")
+        self.metrics_engine.resolve(request.metrics)
+
+        series = TimeSeries(
+            request.timestamps,
+            request.endogenous,
+            request.exogenous,
+            request.exogenous_names,
+            series_id=request.time_series_id,
+        )
+        horizon = ForecastHorizon(request.horizon)
+        lags = LagCount(request.lags)
+        step = request.step or request.horizon
+
+        n = len(series)
+        cutoffs = [n - horizon.value - (request.n_folds - 1 - j) * step for j in range(request.n_folds)]
+        stops = [strategy.train_rows(cutoff, horizon, lags) for cutoff in cutoffs]
+        # Строка k соответствует позиции lags + k, поэтому окно из window точек
+        # до cutoff начинается со строки cutoff - window
+        starts = [max(cutoff - request.window, 0) if request.window else 0 for cutoff in cutoffs]
+        if cutoffs[0] < max(lags.value, 1) or any(start >= stop for start, stop in zip(starts, stops)):
+            raise ValueError(
+                f"Not enough points for {request.n_folds} folds with step {step}: have {n}"
+            )
+
+        x, y = strategy.prepare_train_data(series, horizon, lags)
+        return BacktestPlan(
+            series=series,
+            strategy=strategy,
+            x=x,
+            y=y,
+            cutoffs=cutoffs,
+            starts=starts,
+            stops=stops,
+            params=training_params(request.strategy, request.catboost_params),
+        )
+
+    def fold_args(self, plan: BacktestPlan, request: BacktestRequest, fold: int) -> tuple:
+        """Возвращает аргументы fit_fold для фолда: срезы матриц и хвост ряда перед точкой отсечения."""
+        cutoff, start, stop = plan.cutoffs[fold], plan.starts[fold], plan.stops[fold]
+        context_start = max(cutoff - max(request.lags, 1), 0)
+        context = TimeSeries(
+            plan.series.timestamps[context_start:cutoff],
+            plan.series.endogenous[context_start:cutoff],
+            plan.series.exogenous[context_start:cutoff],
+            plan.series.exogenous_names,
+            series_id=plan.series.series_id,
+        )
+        return (
+            request.strategy,
+            plan.x[start:stop],
+            plan.y[start:stop],
+            plan.params,
+            context,
+            request.horizon,
+            request.lags,
+        )
+
+    def fit_fold(
+        self,
+        strategy_name: str,
+        x_train: np.ndarray,
+        y_train: np.ndarray,
+        params: Dict[str, Any],
+        context: TimeSeries,
+        horizon: int,
+        lags: int,
+    ) -> np.ndarray:
+        """
+        Обучает модель фолда и прогнозирует horizon точек после конца context.
+
+        Возвращает
+        -------
+        np.ndarray
+            Прогноз длины horizon.
+        """
+        strategy = self.strategy_factory[strategy_name]
+        model = self.trainer.train(x_train, y_train, params)
+        return strategy.forecast(model, context, ForecastHorizon(horizon), LagCount(lags))
+
+    def evaluate(self, plan: BacktestPlan, predictions: List[np.ndarray], metrics: List[str]) -> MetricsReport:
+        """
+        Вычисляет метрики всех фолдов одним проходом: per_series — по фолдам,
+        per_step — по шагам горизонта на всех фолдах вместе.
+        """
+        y_pred = np.stack(predictions)
+        y_true = sliding_window_view(plan.series.endogenous, y_pred.shape[1])[plan.cutoffs]
+        return self.metrics_engine.evaluate(y_true, y_pred, metrics, per_step=True)
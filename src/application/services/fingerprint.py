@@ -0,0 +1,48 @@
+import hashlib
+import json
+import numpy as np
+from src.application.dto import FitModelRequest
+from src.application.services.training import training_params
+
+# Меняется при изменении способа обучения или состава отпечатка, чтобы не использовать старые записи кэша
+FINGERPRINT_VERSION = 2
+
+
+def fit_request_fingerprint(request: FitModelRequest, model_format: str, compression: str) -> str:
+    """
+    Возвращает стабильный отпечаток (sha256) запроса на обучение.
+
+    В отпечаток входят всё, от чего зависит результат: ряд (в порядке времени),
+    имена экзогенных признаков, стратегия, горизонт, лаги, метрики, итоговые
+    параметры CatBoost и формат сериализации. random_seed всегда входит явно:
+    если он не задан, подставляется значение CatBoost по умолчанию (0), так что
+    одинаковые запросы детерминированно дают одну и ту же модель. model_response
+    на результат не влияет и в отпечаток не входит.
+    """
+    params = training_params(request.strategy, request.catboost_params)
+    params.setdefault("random_seed", 0)
+    header = {
+        "version": FINGERPRINT_VERSION,
+        "series_id": request.time_series_id,
+        "strategy": request.strategy,
+        "horizon": request.horizon,
+        "lags": request.lags,
+        "metrics": sorted(set(request.metrics)),
+        "exogenous_names": list(request.exogenous_names),
+        "catboost_params": params,
+        "model_format": model_format,
+        "compression": compression,
+    }
+    digest = hashlib.sha256(
+        json.dumps(header, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    )
+
+    timestamps = np.asarray(request.timestamps, dtype=np.int64)
+    endogenous = np.asarray(request.endogenous, dtype=np.float64)
+    exogenous = np.asarray(request.exogenous, dtype=np.float64)
+    if len(timestamps) > 1 and not np.all(timestamps[1:] > timestamps[:-1]):
+        order = np.argsort(timestamps, kind="stable")
+        timestamps, endogenous, exogenous = timestamps[order], endogenous[order], exogenous[order]
+    for array in (timestamps, endogenous, exogenous):
+        digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest()
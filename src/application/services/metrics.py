@@ -1,50 +1,68 @@
+from typing import Optional
 import numpy as np
-from src.domain.interfaces import IMetricCalculator
+# Движок метрик живёт отдельно, чтобы сервисы обучения не загружали калькуляторы
+# при импорте (их загружает MetricFactory); здесь он доступен для совместимости
+from src.application.services.metrics_engine import (
+    Residuals,
+    ResidualMetricCalculator,
+    MetricsReport,
+    MetricsEngine,
+)
 
-class MAECalculator(IMetricCalculator):
+
+def _masked_mean(values: np.ndarray, mask: np.ndarray, axis: Optional[int]) -> np.ndarray:
+    """Среднее values по элементам mask вдоль axis; там, где таких элементов нет, — NaN."""
+    total = np.sum(values, axis=axis, where=mask)
+    count = np.sum(mask, axis=axis)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(count > 0, total / np.maximum(count, 1), np.nan)
+
+
+class MAECalculator(ResidualMetricCalculator):
     """Средняя абсолютная ошибка (Mean Absolute Error)."""
-    def calculate(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
-        return float(np.mean(np.abs(y_true - y_pred)))
+    def calculate_many(self, residuals: Residuals, axis: Optional[int]) -> np.ndarray:
+        return np.mean(residuals.abs_error, axis=axis)
 
-class RMSECalculator(IMetricCalculator):
+class RMSECalculator(ResidualMetricCalculator):
     """Среднеквадратичная ошибка (Root Mean Squared Error)."""
-    def calculate(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
-        return float(np.sqrt(np.mean((y_true - y_pred) ** 2)))
+    def calculate_many(self, residuals: Residuals, axis: Optional[int]) -> np.ndarray:
+        return np.sqrt(np.mean(residuals.squared_error, axis=axis))
 
-class MSECalculator(IMetricCalculator):
+class MSECalculator(ResidualMetricCalculator):
     """Среднеквадратичная ошибка (Mean Squared Error)."""
-    def calculate(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
-        return float(np.mean((y_true - y_pred) ** 2))
+    def calculate_many(self, residuals: Residuals, axis: Optional[int]) -> np.ndarray:
+        return np.mean(residuals.squared_error, axis=axis)
 
-class MAPECalculator(IMetricCalculator):
+class MAPECalculator(ResidualMetricCalculator):
     """Средняя абсолютная процентная ошибка (Mean Absolute Percentage Error)."""
-    def calculate(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
-        # Избегаем деления на ноль: добавляем эпсилон или игнорируем нулевые значения
-        mask = y_true != 0
-        if not np.any(mask):
-            return np.nan
-        return float(np.mean(np.abs((y_true[mask] - y_pred[mask]) / y_true[mask]))) * 100
-
-class SMAPECalculator(IMetricCalculator):
+    def calculate_many(self, residuals: Residuals, axis: Optional[int]) -> np.ndarray:
+        # Избегаем деления на ноль: нулевые истинные значения не учитываются
+        mask = residuals.y_true != 0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ratio = residuals.abs_error / residuals.abs_true
+        return _masked_mean(ratio, mask, axis) * 100
+
+class SMAPECalculator(ResidualMetricCalculator):
     """Симметричная средняя абсолютная процентная ошибка (Symmetric Mean Absolute Percentage Error)."""
-    def calculate(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
-        denominator = (np.abs(y_true) + np.abs(y_pred)) / 2
+    def calculate_many(self, residuals: Residuals, axis: Optional[int]) -> np.ndarray:
+        denominator = (residuals.abs_true + np.abs(residuals.y_pred)) / 2
         # Избегаем деления на ноль
         mask = denominator != 0
-        if not np.any(mask):
-            return np.nan
-        return float(np.mean(np.abs(y_true[mask] - y_pred[mask]) / denominator[mask])) * 100
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ratio = residuals.abs_error / denominator
+        return _masked_mean(ratio, mask, axis) * 100
 
-class R2Calculator(IMetricCalculator):
+class R2Calculator(ResidualMetricCalculator):
     """Коэффициент детерминации R²."""
-    def calculate(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
-        ss_res = np.sum((y_true - y_pred) ** 2)
-        ss_tot = np.sum((y_true - np.mean(y_true)) ** 2)
-        if ss_tot == 0:
-            return 1.0  # все значения одинаковы
-        return float(1 - ss_res / ss_tot)
-
-class MaxErrorCalculator(IMetricCalculator):
+    def calculate_many(self, residuals: Residuals, axis: Optional[int]) -> np.ndarray:
+        y_true = residuals.y_true
+        ss_res = np.sum(residuals.squared_error, axis=axis)
+        ss_tot = np.sum((y_true - np.mean(y_true, axis=axis, keepdims=True)) ** 2, axis=axis)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # все значения одинаковы — считаем R² равным 1
+            return np.where(ss_tot == 0, 1.0, 1 - ss_res / ss_tot)
+
+class MaxErrorCalculator(ResidualMetricCalculator):
     """Максимальная абсолютная ошибка."""
-    def calculate(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
-        return float(np.max(np.abs(y_true - y_pred)))
+    def calculate_many(self, residuals: Residuals, axis: Optional[int]) -> np.ndarray:
+        return np.max(residuals.abs_error, axis=axis)
@@ -0,0 +1,132 @@
+from abc import abstractmethod
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Dict, List, Optional
+import numpy as np
+from src.domain.interfaces import IMetricCalculator, MetricFactory
+
+
+class Residuals:
+    """
+    Истинные и предсказанные значения вместе с производными от них массивами.
+
+    Ошибки, их модули и квадраты вычисляются один раз при первом обращении
+    и переиспользуются всеми метриками. Массивы могут быть любой формы;
+    для пакетной оценки — (число рядов или фолдов, horizon).
+    """
+
+    def __init__(self, y_true: np.ndarray, y_pred: np.ndarray):
+        self.y_true = np.asarray(y_true, dtype=np.float64)
+        self.y_pred = np.asarray(y_pred, dtype=np.float64)
+        if self.y_true.shape != self.y_pred.shape:
+            raise ValueError(
+                f"y_true and y_pred must have the same shape, got {self.y_true.shape} and {self.y_pred.shape}"
+            )
+
+    @cached_property
+    def error(self) -> np.ndarray:
+        return self.y_true - self.y_pred
+
+    @cached_property
+    def abs_error(self) -> np.ndarray:
+        return np.abs(self.error)
+
+    @cached_property
+    def squared_error(self) -> np.ndarray:
+        return self.error ** 2
+
+    @cached_property
+    def abs_true(self) -> np.ndarray:
+        return np.abs(self.y_true)
+
+
+class ResidualMetricCalculator(IMetricCalculator):
+    """
+    Метрика, вычисляемая векторно по предрассчитанным Residuals.
+    calculate — частный случай calculate_many для одной пары массивов.
+    """
+    def calculate(self, y_true: np.ndarray, y_pred: np.ndarray) -> float:
+        return float(self.calculate_many(Residuals(y_true, y_pred), axis=None))
+
+    @abstractmethod
+    def calculate_many(self, residuals: Residuals, axis: Optional[int]) -> np.ndarray:
+        pass
+
+
+@dataclass
+class MetricsReport:
+    """
+    Результат пакетной оценки.
+
+    per_series — значение каждой метрики для каждой строки (ряда или фолда), форма (n,);
+    per_step — значение по всем строкам для каждого шага горизонта, форма (horizon,).
+    """
+    per_series: Dict[str, np.ndarray]
+    per_step: Dict[str, np.ndarray] = field(default_factory=dict)
+
+
+class MetricsEngine:
+    """
+    Вычисляет набор метрик сразу для многих прогнозов.
+
+    Принимает матрицы формы (число рядов или фолдов, horizon): ошибки считаются
+    один раз, а каждая метрика получается одной векторной операцией по всем строкам.
+    Калькуляторы без calculate_many вызываются построчно.
+    """
+
+    def __init__(self, metric_factory: MetricFactory):
+        self.metric_factory = metric_factory
+
+    def resolve(self, names: List[str]) -> Dict[str, IMetricCalculator]:
+        """
+        Возвращает калькуляторы по именам метрик.
+
+        Исключения
+        ----------
+        ValueError
+            Если метрика не зарегистрирована.
+        """
+        calculators = {}
+        for name in names:
+            calculator = self.metric_factory.get(name)
+            if not calculator:
+                raise ValueError(f"Unknown metric: {name}")
+            calculators[name] = calculator
+        return calculators
+
+    def evaluate(
+        self, y_true: np.ndarray, y_pred: np.ndarray, names: List[str], per_step: bool = False
+    ) -> MetricsReport:
+        """
+        Вычисляет метрики names для каждой строки y_true / y_pred
+        и, если per_step, для каждого шага горизонта.
+
+        Параметры
+        ----------
+        y_true, y_pred : np.ndarray
+            Истинные и предсказанные значения формы (n, horizon); одномерные
+            массивы считаются одной строкой.
+        names : List[str]
+            Имена метрик.
+        per_step : bool
+            Вычислять ли разбивку по шагам горизонта.
+        """
+        calculators = self.resolve(names)
+        residuals = Residuals(np.atleast_2d(y_true), np.atleast_2d(y_pred))
+        report = MetricsReport(per_series={
+            name: self._calculate(calculator, residuals, axis=1) for name, calculator in calculators.items()
+        })
+        if per_step:
+            report.per_step = {
+                name: self._calculate(calculator, residuals, axis=0) for name, calculator in calculators.items()
+            }
+        return report
+
+    @staticmethod
+    def _calculate(calculator: IMetricCalculator, residuals: Residuals, axis: int) -> np.ndarray:
+        if isinstance(calculator, ResidualMetricCalculator):
+            return np.asarray(calculator.calculate_many(residuals, axis), dtype=np.float64)
+        y_true, y_pred = residuals.y_true, residuals.y_pred
+        if axis == 0:
+            y_true, y_pred = y_true.T, y_pred.T
+        return np.array([calculator.calculate(t, p) for t, p in zip(y_true, y_pred)], dtype=np.float64)
@@ -0,0 +1,27 @@
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+
+class StageTimer:
+    """
+    Замеряет длительность этапов обработки запроса (в секундах).
+
+    Повторный замер этапа с тем же именем прибавляется к уже накопленному.
+    Объект передаётся вместе с результатом обучения из рабочего процесса,
+    поэтому хранит только словарь timings.
+    """
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name: str, seconds: float) -> None:
+        self.timings[name] = self.timings.get(name, 0.0) + seconds
@@ -0,0 +1,311 @@
+import logging
+import numpy as np
+from typing import Any, Dict, List, Optional, Tuple
+from src.domain import TimeSeries, TrainingCost
+from src.domain import ForecastHorizon, LagCount
+from src.domain import ITrainer, IModelSerializer, StrategyFactory, MetricFactory
+from src.application.dto import FitModelRequest, TrainingResult, PanelFitRequest, PanelTrainingResult
+from src.application.services.metrics_engine import MetricsEngine
+from src.application.services.timing import StageTimer
+
+logger = logging.getLogger(__name__)
+
+# Значение iterations в CatBoost по умолчанию
+DEFAULT_ITERATIONS = 1000
+
+
+def training_params(strategy: str, catboost_params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Возвращает параметры CatBoost для стратегии: для multioutput, обучающей
+    одну модель на весь горизонт, по умолчанию MultiRMSE. Для direct функция
+    потерь остаётся одномерной, и тренер обучает отдельную модель на каждый шаг.
+    """
+    params = dict(catboost_params)
+    if strategy == "multioutput":
+        params.setdefault("loss_function", "MultiRMSE")
+    return params
+
+
+def training_cost(
+    strategy: str, horizon: int, n_rows: int, n_features: int, catboost_params: Dict[str, Any]
+) -> TrainingCost:
+    """
+    Оценивает ресурсы одного обучения на матрице n_rows × n_features.
+    Для direct с одномерной функцией потерь обучается модель на каждый шаг горизонта.
+    """
+    params = training_params(strategy, catboost_params)
+    per_step = strategy == "direct" and not str(params.get("loss_function", "RMSE")).startswith("Multi")
+    iterations = int(params.get("iterations") or DEFAULT_ITERATIONS)
+    threads = params.get("thread_count")
+    return TrainingCost(
+        rows=max(n_rows, 1),
+        features=max(n_features, 1),
+        work=max(n_rows, 1) * max(n_features, 1) * iterations * (horizon if per_step else 1),
+        threads=threads if threads is not None and threads > 0 else None,
+    )
+
+
+def request_cost(request: FitModelRequest) -> TrainingCost:
+    """Оценка ресурсов обучения по запросу /fit: строка на точку ряда после первых lags, признаки — лаги и экзогенные."""
+    return training_cost(
+        request.strategy,
+        request.horizon,
+        len(request.timestamps) - request.lags,
+        request.lags + len(request.exogenous_names),
+        request.catboost_params,
+    )
+
+
+def combined_cost(costs: List[TrainingCost]) -> TrainingCost:
+    """Оценка задачи, которая выполняет несколько обучений подряд: работа суммируется, память — по наибольшему."""
+    largest = max(costs, key=lambda cost: cost.rows * cost.features)
+    threads = [cost.threads for cost in costs if cost.threads is not None]
+    return TrainingCost(
+        rows=largest.rows,
+        features=largest.features,
+        work=sum(cost.work for cost in costs),
+        threads=max(threads) if threads else None,
+    )
+
+
+def series_snapshot(series: TimeSeries, start: int) -> Dict[str, Any]:
+    """
+    Сохраняет хвост ряда начиная с позиции start в виде, пригодном для JSON.
+
+    Если start — число обучающих строк модели, то prepare_train_data для снимка
+    с дописанными точками строит ровно те строки, которых модель ещё не видела:
+    строка k соответствует позиции lags + k, а снимок начинается за lags позиций
+    до первой необученной строки.
+    """
+    return {
+        "timestamps": series.timestamps[start:].tolist(),
+        "endogenous": series.endogenous[start:].tolist(),
+        "exogenous": series.exogenous[start:].tolist(),
+    }
+
+
+def snapshot_columns(snapshot: Dict[str, Any], n_exogenous: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Восстанавливает колонки (метки времени, эндогенная, экзогенные) из series_snapshot."""
+    timestamps = np.asarray(snapshot["timestamps"], dtype=np.int64)
+    endogenous = np.asarray(snapshot["endogenous"], dtype=np.float64)
+    exogenous = np.asarray(snapshot["exogenous"], dtype=np.float64).reshape(len(timestamps), n_exogenous)
+    return timestamps, endogenous, exogenous
+
+
+class ModelTrainingService:
+    """
+    CPU-ёмкая часть обучения: построение ряда, подготовка признаков, обучение,
+    прогноз на тестовый период, расчёт метрик и сериализация модели.
+    Сериализация выполняется здесь же, чтобы из рабочего процесса передавались
+    уже готовые (при необходимости сжатые) байты модели.
+
+    Не зависит от репозитория и не хранит состояния между вызовами, поэтому
+    может передаваться в рабочие процессы пула обучения.
+    """
+
+    def __init__(
+        self,
+        strategy_factory: StrategyFactory,
+        trainer: ITrainer,
+        metric_factory: MetricFactory,
+        serializer: IModelSerializer,
+    ):
+        self.strategy_factory = strategy_factory
+        self.trainer = trainer
+        self.metric_factory = metric_factory
+        self.serializer = serializer
+        self.metrics_engine = MetricsEngine(metric_factory)
+
+    def train(self, request: FitModelRequest) -> TrainingResult:
+        """
+        Обучает модель по запросу и вычисляет метрики на последних horizon точках.
+
+        Параметры
+        ----------
+        request : FitModelRequest
+            DTO с данными временного ряда, параметрами обучения и списком метрик.
+
+        Возвращает
+        -------
+        TrainingResult
+            Сериализованная модель, вычисленные метрики, снимок ряда для дообучения
+            и длительности этапов (build_series, prepare_train_data, train, forecast,
+            metrics, serialize).
+
+        Исключения
+        ----------
+        ValueError
+            Если запрошенная стратегия или метрика не зарегистрированы,
+            или если данные не проходят валидацию в стратегии.
+        """
+        timer = StageTimer()
+        series, strategy, horizon, lags = self._prepare(request, timer)
+        params = training_params(request.strategy, request.catboost_params)
+        with timer.stage("prepare_train_data"):
+            x_train, y_train = strategy.prepare_train_data(series, horizon, lags)
+        with timer.stage("train"):
+            model = self.trainer.train(x_train, y_train, params)
+        return self._result(request, model, strategy, series, len(x_train), timer)
+
+    def refit(
+        self, request: FitModelRequest, model_bytes: bytes, model_format: str, compression: str
+    ) -> TrainingResult:
+        """
+        Дообучает сохранённую модель на новых точках (warm start).
+
+        request содержит снимок ряда, сохранённый с моделью, и дописанные к нему
+        новые точки. Снимок начинается так, что prepare_train_data строит только
+        строки, которых модель ещё не видела; обучение продолжается от сохранённой
+        модели, и catboost_params['iterations'] задаёт число добавляемых деревьев.
+
+        Исключения
+        ----------
+        ValueError
+            См. train.
+        """
+        timer = StageTimer()
+        series, strategy, horizon, lags = self._prepare(request, timer)
+        params = training_params(request.strategy, request.catboost_params)
+        with timer.stage("prepare_train_data"):
+            x_train, y_train = strategy.prepare_train_data(series, horizon, lags)
+        with timer.stage("deserialize"):
+            init_model = self.serializer.deserialize(model_bytes, model_format, compression)
+        with timer.stage("train"):
+            model = self.trainer.train(x_train, y_train, params, init_model=init_model)
+        return self._result(request, model, strategy, series, len(x_train), timer)
+
+    def train_panel(self, request: PanelFitRequest) -> PanelTrainingResult:
+        """
+        Обучает одну глобальную модель на панели рядов.
+
+        Матрицы признаков рядов строятся стратегией (prepare_train_data) и
+        складываются в один набор данных; идентификатор ряда добавляется
+        категориальным признаком. Метрики считаются на последних horizon точках
+        каждого ряда по прогнозу всех рядов одним пакетом (forecast_many);
+        metrics — среднее по рядам.
+
+        Исключения
+        ----------
+        ValueError
+            См. train; также если стратегия не поддерживает панельные модели,
+            идентификаторы рядов повторяются или экзогенные признаки рядов различаются.
+        """
+        strategy = self.strategy_factory.get(request.strategy)
+        if not strategy:
+            raise ValueError(f"Unknown strategy: {request.strategy}")
+        if not strategy.supports_panel:
+            raise ValueError(f"Strategy {request.strategy} does not support panel models")
+        self.metrics_engine.resolve(request.metrics)
+
+        ids = [item.series_id for item in request.series]
+        if len(ids) != len(set(ids)):
+            raise ValueError("Duplicate series ids in panel")
+        horizon, lags = ForecastHorizon(request.horizon), LagCount(request.lags)
+
+        series_list, xs, ys = [], [], []
+        for item in request.series:
+            if item.exogenous_names != request.exogenous_names:
+                raise ValueError(
+                    f"Series {item.series_id}: exogenous features {item.exogenous_names} "
+                    f"do not match the panel's {request.exogenous_names}"
+                )
+            series = TimeSeries(
+                item.timestamps, item.endogenous, item.exogenous, item.exogenous_names, series_id=item.series_id
+            )
+            try:
+                x, y = strategy.prepare_train_data(series, horizon, lags)
+            except ValueError as e:
+                raise ValueError(f"Series {item.series_id}: {e}") from e
+            series_list.append(series)
+            xs.append(x)
+            ys.append(y)
+
+        # Идентификатор ряда для каждой строки; строки одного ряда ссылаются на одну строку Python
+        categories = np.repeat(np.asarray(ids, dtype=object), [len(x) for x in xs])
+        params = training_params(request.strategy, request.catboost_params)
+        model = self.trainer.train(np.concatenate(xs), np.concatenate(ys), params, categories=categories)
+
+        y_true = np.stack([strategy.extract_test_values(series, horizon) for series in series_list])
+        y_pred = np.stack(strategy.forecast_many(model, series_list, horizon, lags, categories=ids))
+        report = self.metrics_engine.evaluate(y_true, y_pred, request.metrics)
+        return PanelTrainingResult(
+            model_bytes=self.serializer.serialize(model),
+            model_format=self.serializer.format_of(model),
+            metrics={name: float(np.mean(values)) for name, values in report.per_series.items()},
+            series_metrics={
+                series_id: {name: float(values[i]) for name, values in report.per_series.items()}
+                for i, series_id in enumerate(ids)
+            },
+        )
+
+    def _prepare(
+        self, request: FitModelRequest, timer: StageTimer
+    ) -> Tuple[TimeSeries, Any, ForecastHorizon, LagCount]:
+        with timer.stage("build_series"):
+            series = TimeSeries(
+                request.timestamps,
+                request.endogenous,
+                request.exogenous,
+                request.exogenous_names,
+                series_id=request.time_series_id,
+            )
+
+        strategy = self.strategy_factory.get(request.strategy)
+        if not strategy:
+            raise ValueError(f"Unknown strategy: {request.strategy}")
+
+        # Неизвестные метрики отклоняем до обучения
+        self.metrics_engine.resolve(request.metrics)
+        return series, strategy, ForecastHorizon(request.horizon), LagCount(request.lags)
+
+    def _result(
+        self,
+        request: FitModelRequest,
+        model: Any,
+        strategy: Any,
+        series: TimeSeries,
+        n_rows: int,
+        timer: StageTimer,
+    ) -> TrainingResult:
+        """Считает метрики на последних horizon точках и сериализует модель вместе со снимком ряда."""
+        horizon, lags = ForecastHorizon(request.horizon), LagCount(request.lags)
+        with timer.stage("forecast"):
+            y_true = strategy.extract_test_values(series, horizon)
+            y_pred = strategy.forecast(model, series, horizon, lags)
+
+        with timer.stage("metrics"):
+            report = self.metrics_engine.evaluate(y_true, y_pred, request.metrics)
+            metrics = {name: float(values[0]) for name, values in report.per_series.items()}
+
+        with timer.stage("serialize"):
+            model_bytes = self.serializer.serialize(model)
+        return TrainingResult(
+            model_bytes=model_bytes,
+            model_format=self.serializer.format_of(model),
+            metrics=metrics,
+            snapshot=series_snapshot(series, n_rows),
+            timings=timer.timings,
+        )
+
+    def train_many(
+        self, requests: List[FitModelRequest]
+    ) -> List[Tuple[Optional[TrainingResult], Optional[str]]]:
+        """
+        Обучает модели для нескольких запросов подряд, изолируя ошибки.
+
+        Возвращает
+        -------
+        List[Tuple[Optional[TrainingResult], Optional[str]]]
+            Для каждого запроса — пара (результат, None) при успехе
+            или (None, текст ошибки) при неудаче.
+        """
+        outcomes = []
+        for request in requests:
+            try:
+                outcomes.append((self.train(request), None))
+            except ValueError as e:
+                outcomes.append((None, str(e)))
+            except Exception:
+                logger.exception("Unhandled exception while training series %s", request.time_series_id)
+                outcomes.append((None, "Internal server error"))
+        return outcomes
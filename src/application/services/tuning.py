@@ -0,0 +1,164 @@
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from src.domain import TimeSeries, ForecastHorizon, LagCount
+from src.domain import ITrainer, IModelSerializer, StrategyFactory, MetricFactory
+from src.application.dto import TuneRequest, ParamRange, TrainingResult
+from src.application.services.training import DEFAULT_ITERATIONS, training_params, series_snapshot
+from src.application.services.metrics_engine import MetricsEngine
+
+# Параметры, которые можно перебирать, и те из них, что принимают только целые значения
+TUNABLE_PARAMS = ("iterations", "depth", "learning_rate", "l2_leaf_reg")
+INTEGER_PARAMS = ("iterations", "depth")
+
+
+@dataclass
+class TunePlan:
+    """
+    Подготовленные данные подбора: матрица признаков, разделённая на обучающую
+    и валидационную части (последние примеры по времени), и кандидаты параметров.
+    """
+    series: TimeSeries
+    x_train: np.ndarray
+    y_train: np.ndarray
+    x_val: np.ndarray
+    y_val: np.ndarray
+    base_params: Dict[str, Any]
+    candidates: List[Dict[str, Any]]
+
+
+class TuningService:
+    """
+    Подбор гиперпараметров CatBoost для ряда.
+
+    Матрица признаков строится стратегией один раз; все попытки обучаются на её
+    срезах с ранней остановкой по валидационной части. run_trial не хранит
+    состояния, поэтому попытки можно выполнять в рабочих процессах пула.
+    """
+
+    def __init__(
+        self,
+        strategy_factory: StrategyFactory,
+        trainer: ITrainer,
+        metric_factory: MetricFactory,
+        serializer: IModelSerializer,
+    ):
+        self.strategy_factory = strategy_factory
+        self.trainer = trainer
+        self.metric_factory = metric_factory
+        self.serializer = serializer
+        self.metrics_engine = MetricsEngine(metric_factory)
+
+    def plan(self, request: TuneRequest) -> TunePlan:
+        """
+        Строит матрицу признаков, выделяет валидационную часть и выбирает
+        n_trials кандидатов из search_space (с генератором, инициализированным seed).
+
+        Исключения
+        ----------
+        ValueError
+            Если стратегия или метрика не зарегистрированы, параметр нельзя перебирать
+            или обучающих примеров не хватает на разделение.
+        """
+        strategy = self.strategy_factory.get(request.strategy)
+        if not strategy:
+            raise ValueError(f"Unknown strategy: {request.strategy}")
+        self.metrics_engine.resolve(request.metrics)
+        unknown = [name for name in request.search_space if name not in TUNABLE_PARAMS]
+        if unknown:
+            raise ValueError(f"Parameter cannot be tuned: {unknown[0]}")
+
+        series = TimeSeries(
+            request.timestamps,
+            request.endogenous,
+            request.exogenous,
+            request.exogenous_names,
+            series_id=request.time_series_id,
+        )
+        x, y = strategy.prepare_train_data(series, ForecastHorizon(request.horizon), LagCount(request.lags))
+        n_val = max(int(round(len(x) * request.validation_fraction)), 1)
+        if len(x) - n_val < 1:
+            raise ValueError(f"Not enough training samples for a validation split: have {len(x)}")
+
+        rng = np.random.default_rng(request.seed)
+        candidates = [self._sample(request.search_space, rng) for _ in range(request.n_trials)]
+        return TunePlan(
+            series=series,
+            x_train=x[:-n_val],
+            y_train=y[:-n_val],
+            x_val=x[-n_val:],
+            y_val=y[-n_val:],
+            base_params=training_params(request.strategy, request.catboost_params),
+            candidates=candidates,
+        )
+
+    @staticmethod
+    def _sample(space: Dict[str, Any], rng: np.random.Generator) -> Dict[str, Any]:
+        params = {}
+        for name, spec in space.items():
+            if isinstance(spec, ParamRange):
+                if spec.log:
+                    value = math.exp(rng.uniform(math.log(spec.low), math.log(spec.high)))
+                else:
+                    value = rng.uniform(spec.low, spec.high)
+            else:
+                value = spec[rng.integers(len(spec))]
+            params[name] = int(round(value)) if name in INTEGER_PARAMS else float(value)
+        return params
+
+    @staticmethod
+    def trial_params(
+        plan: TunePlan, candidate: Dict[str, Any], fraction: float, early_stopping_rounds: int
+    ) -> Dict[str, Any]:
+        """
+        Параметры попытки на раунде с долей бюджета fraction: число итераций
+        кандидата (или базовое) умножается на fraction.
+        """
+        params = {**plan.base_params, **candidate}
+        iterations = params.get("iterations", DEFAULT_ITERATIONS)
+        params["iterations"] = max(int(round(iterations * fraction)), 1)
+        params["early_stopping_rounds"] = early_stopping_rounds
+        return params
+
+    def run_trial(
+        self,
+        x_train: np.ndarray,
+        y_train: np.ndarray,
+        x_val: np.ndarray,
+        y_val: np.ndarray,
+        params: Dict[str, Any],
+        final: Optional[Tuple[str, TimeSeries, int, int, List[str]]] = None,
+    ) -> Tuple[float, int, Optional[TrainingResult]]:
+        """
+        Обучает модель попытки с ранней остановкой по (x_val, y_val).
+
+        Параметры
+        ----------
+        final : Optional[Tuple[str, TimeSeries, int, int, List[str]]]
+            Для попыток последнего раунда — (стратегия, ряд, horizon, lags, метрики):
+            тогда модель оценивается на тестовом периоде, как в /fit, и сериализуется.
+
+        Возвращает
+        -------
+        Tuple[float, int, Optional[TrainingResult]]
+            Лучшее значение метрики на валидации, номер лучшей итерации
+            и, для последнего раунда, сериализованная модель с метриками.
+        """
+        model = self.trainer.train(x_train, y_train, params, eval_set=(x_val, y_val))
+        score, best_iteration = self.trainer.best_score(model)
+        if final is None:
+            return score, best_iteration, None
+
+        strategy_name, series, horizon, lags, metrics = final
+        strategy = self.strategy_factory[strategy_name]
+        y_true = strategy.extract_test_values(series, ForecastHorizon(horizon))
+        y_pred = strategy.forecast(model, series, ForecastHorizon(horizon), LagCount(lags))
+        report = self.metrics_engine.evaluate(y_true, y_pred, metrics)
+        result = TrainingResult(
+            model_bytes=self.serializer.serialize(model),
+            model_format=self.serializer.format_of(model),
+            metrics={name: float(values[0]) for name, values in report.per_series.items()},
+            snapshot=series_snapshot(series, len(x_train)),
+        )
+        return score, best_iteration, result
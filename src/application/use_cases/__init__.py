@@ -1,3 +1,21 @@
 from .fit_model import FitModelUseCase
+from .training_jobs import TrainingJobsUseCase
+from .batch_fit import BatchFitModelUseCase
+from .manage_models import ManageModelsUseCase
+from .predict import PredictUseCase
+from .backtest import BacktestModelUseCase
+from .tune import TuneModelUseCase
+from .refit import RefitModelUseCase
+from .fit_panel import FitPanelUseCase
 
-__all__ = ["FitModelUseCase"]
+__all__ = [
+    "FitModelUseCase",
+    "TrainingJobsUseCase",
+    "BatchFitModelUseCase",
+    "ManageModelsUseCase",
+    "PredictUseCase",
+    "BacktestModelUseCase",
+    "TuneModelUseCase",
+    "RefitModelUseCase",
+    "FitPanelUseCase",
+]
@@ -0,0 +1,84 @@
+import asyncio
+from contextlib import aclosing
+from typing import List, Optional
+import numpy as np
+from src.domain import ITrainer, ITrainingExecutor, StrategyFactory, MetricFactory
+from src.application.dto import BacktestRequest, BacktestResponse, BacktestFold
+from src.application.services.backtest import BacktestService
+from src.application.services.training import training_cost
+
+
+class BacktestModelUseCase:
+    """
+    Сценарий использования для оценки модели на нескольких фолдах со скользящим
+    началом прогноза. Модели фолдов не сохраняются.
+
+    Признаки строятся один раз в текущем процессе (в пуле потоков, не блокируя
+    цикл событий); если передан executor, фолды обучаются в пуле обучения
+    параллельно, а фолды, не поместившиеся в очередь пула, ждут места.
+    Без executor фолды обучаются последовательно.
+    """
+
+    def __init__(
+        self,
+        strategy_factory: StrategyFactory,
+        trainer: ITrainer,
+        metric_factory: MetricFactory,
+        executor: Optional[ITrainingExecutor] = None,
+        retry_delay: float = 0.5,
+    ):
+        self.executor = executor
+        self.retry_delay = retry_delay
+        self.backtest_service = BacktestService(strategy_factory, trainer, metric_factory)
+
+    async def execute(self, request: BacktestRequest) -> BacktestResponse:
+        """
+        Выполняет бэктест по запросу.
+
+        Возвращает
+        -------
+        BacktestResponse
+            Метрики каждого фолда, их среднее и стандартное отклонение по фолдам
+            и метрики по шагам горизонта на всех фолдах.
+
+        Исключения
+        ----------
+        ValueError
+            Если стратегия или метрика не зарегистрированы, или ряда не хватает на фолды.
+        """
+        service = self.backtest_service
+        if self.executor is None:
+            plan = service.plan(request)
+            fold_args = [service.fold_args(plan, request, fold) for fold in range(request.n_folds)]
+            predictions = [service.fit_fold(*args) for args in fold_args]
+        else:
+            plan = await asyncio.to_thread(service.plan, request)
+            fold_args = [service.fold_args(plan, request, fold) for fold in range(request.n_folds)]
+            costs = [
+                training_cost(request.strategy, request.horizon, len(args[1]), plan.x.shape[1], plan.params)
+                for args in fold_args
+            ]
+            predictions: List[np.ndarray] = [None] * len(fold_args)
+            # Ошибка фолда или отмена запроса закрывает генератор — задачи не остаются в очереди пула
+            completed = self.executor.as_completed(service.fit_fold, fold_args, costs, self.retry_delay)
+            async with aclosing(completed):
+                async for fold, future in completed:
+                    predictions[fold] = future.result()
+
+        report = service.evaluate(plan, predictions, request.metrics)
+        folds = [
+            BacktestFold(
+                index=fold,
+                cutoff=int(plan.series.timestamps[cutoff]),
+                train_size=plan.stops[fold] - plan.starts[fold],
+                metrics={name: float(values[fold]) for name, values in report.per_series.items()},
+            )
+            for fold, cutoff in enumerate(plan.cutoffs)
+        ]
+        return BacktestResponse(
+            time_series_id=request.time_series_id,
+            folds=folds,
+            metrics={name: float(np.mean(values)) for name, values in report.per_series.items()},
+            metrics_std={name: float(np.std(values)) for name, values in report.per_series.items()},
+            metrics_by_step={name: values.tolist() for name, values in report.per_step.items()},
+        )
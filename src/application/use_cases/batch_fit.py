@@ -0,0 +1,117 @@
+import asyncio
+import logging
+from contextlib import aclosing
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from src.domain import ITrainingExecutor
+from src.application import FitModelRequest, FitModelResponse, BatchFitItemResult
+from src.application.dto import TrainingResult
+from src.application.services.training import ModelTrainingService, request_cost, combined_cost
+from src.application.use_cases.fit_model import FitModelUseCase
+
+logger = logging.getLogger(__name__)
+
+
+class BatchFitModelUseCase:
+    """
+    Сценарий использования для обучения моделей на множестве рядов за один запрос.
+
+    Запросы делятся на пачки по chunk_size рядов; каждая пачка обучается одной
+    задачей пула (ModelTrainingService.train_many), что снижает накладные расходы
+    на передачу данных между процессами. Пачки отправляются в пул, пока в нём
+    есть место, а результаты отдаются по мере готовности. Ошибка в одном ряду
+    не влияет на остальные. Ряды, найденные в кэше обучения FitModelUseCase,
+    отдаются сразу и в пул не отправляются.
+    """
+
+    def __init__(
+        self,
+        fit_use_case: FitModelUseCase,
+        training_service: ModelTrainingService,
+        executor: Optional[ITrainingExecutor] = None,
+        chunk_size: int = 8,
+        retry_delay: float = 0.5,
+    ):
+        self.fit_use_case = fit_use_case
+        self.training_service = training_service
+        self.executor = executor
+        self.chunk_size = chunk_size
+        self.retry_delay = retry_delay
+
+    async def execute(self, requests: List[FitModelRequest]) -> AsyncIterator[BatchFitItemResult]:
+        """
+        Обучает модели для всех запросов и асинхронно отдаёт результаты.
+
+        Параметры
+        ----------
+        requests : List[FitModelRequest]
+            Запросы на обучение; index в результатах — позиция в этом списке.
+
+        Возвращает
+        -------
+        AsyncIterator[BatchFitItemResult]
+            Результаты в порядке завершения обучения (не в порядке запросов).
+        """
+        training = self.training_service
+        cache_keys: Dict[int, Optional[str]] = {}
+        to_train = []
+        # Отпечатки запросов и чтение кэша (в том числе с диска) — в пуле потоков
+        lookups = await asyncio.to_thread(lambda: [self.fit_use_case.lookup(request) for request in requests])
+        for index, (request, (cache_key, response)) in enumerate(zip(requests, lookups)):
+            if response is None:
+                cache_keys[index] = cache_key
+                to_train.append(index)
+                continue
+            yield self._item(index, request, response)
+
+        chunks = [to_train[start:start + self.chunk_size] for start in range(0, len(to_train), self.chunk_size)]
+
+        if self.executor is None:
+            for chunk in chunks:
+                outcomes = training.train_many([requests[i] for i in chunk])
+                for result in self._collect(requests, chunk, outcomes, cache_keys):
+                    yield result
+            return
+
+        calls = [([requests[i] for i in chunk],) for chunk in chunks]
+        costs = [combined_cost([request_cost(requests[i]) for i in chunk]) for chunk in chunks]
+        # Клиент отключился или произошла ошибка — генератор закрывается, задачи не остаются в очереди пула
+        completed = self.executor.as_completed(training.train_many, calls, costs, self.retry_delay)
+        async with aclosing(completed):
+            async for position, future in completed:
+                chunk = chunks[position]
+                try:
+                    outcomes = future.result()
+                except Exception:
+                    logger.exception("Training chunk failed")
+                    outcomes = [(None, "Internal server error")] * len(chunk)
+                for result in await asyncio.to_thread(self._collect, requests, chunk, outcomes, cache_keys):
+                    yield result
+
+    def _collect(
+        self,
+        requests: List[FitModelRequest],
+        chunk: List[int],
+        outcomes: List[Tuple[Optional[TrainingResult], Optional[str]]],
+        cache_keys: Dict[int, Optional[str]],
+    ) -> List[BatchFitItemResult]:
+        results = []
+        for index, (result, error) in zip(chunk, outcomes):
+            request = requests[index]
+            if result is None:
+                results.append(BatchFitItemResult(index, request.time_series_id, error=error))
+                continue
+            response = self.fit_use_case.save(request, result, cache_key=cache_keys[index])
+            results.append(self._item(index, request, response))
+        return results
+
+    @staticmethod
+    def _item(index: int, request: FitModelRequest, response: FitModelResponse) -> BatchFitItemResult:
+        return BatchFitItemResult(
+            index,
+            request.time_series_id,
+            model_id=response.model_id,
+            model_base64=response.model_base64,
+            metrics=response.metrics,
+            model_format=response.model_format,
+            compression=response.compression,
+        )
@@ -1,10 +1,23 @@
+import asyncio
+import time
 import uuid
 import base64
-import pickle
-from src.domain import TimeSeries, TimePoint
-from src.domain import ForecastHorizon, LagCount
-from src.domain import ITrainer, IModelRepository, StrategyFactory, MetricFactory
-from src.application import FitModelRequest, FitModelResponse
+from typing import Any, Dict, Optional, Tuple, Union
+from src.domain.entities import utc_now
+from src.domain import (
+    ITrainer,
+    IModelRepository,
+    IModelSerializer,
+    ITrainingExecutor,
+    ITrainingCache,
+    StrategyFactory,
+    MetricFactory,
+)
+from src.application import FitModelRequest, FitModelResponse, PanelFitRequest
+from src.application.dto import TrainingResult
+from src.application.services.training import ModelTrainingService, request_cost
+from src.application.services.fingerprint import fit_request_fingerprint
+from src.application.services.timing import StageTimer
 
 
 class FitModelUseCase:
@@ -19,6 +32,13 @@ class FitModelUseCase:
       - вычисления метрик на тестовом периоде,
       - сериализации и сохранения модели.
     Зависимости (стратегии, тренер, репозиторий, фабрика метрик) внедряются через конструктор.
+    CPU-ёмкие шаги выполняет ModelTrainingService; если передан executor,
+    execute_async отправляет их в пул обучения, а сохранение выполняется в текущем процессе.
+    Если передан training_cache, повторный запрос с тем же отпечатком (данные,
+    параметры, формат модели) не обучается заново: возвращается ранее обученная модель.
+    Ответ содержит длительности этапов (timings): этапы обучения из
+    ModelTrainingService, cache_lookup, queue_wait (ожидание в пуле и передача
+    данных между процессами) и save.
     """
 
     def __init__(
@@ -27,11 +47,22 @@ class FitModelUseCase:
         trainer: ITrainer,
         model_repo: IModelRepository,
         metric_factory: MetricFactory,
+        serializer: IModelSerializer,
+        executor: Optional[ITrainingExecutor] = None,
+        training_cache: Optional[ITrainingCache] = None,
+        training_service: Optional[ModelTrainingService] = None,
     ):
         self.strategy_factory = strategy_factory
         self.trainer = trainer
         self.model_repo = model_repo
         self.metric_factory = metric_factory
+        self.serializer = serializer
+        self.executor = executor
+        self.training_cache = training_cache
+        # Сервис обучения общий с другими сценариями; без него создаётся из тех же зависимостей
+        self.training_service = training_service or ModelTrainingService(
+            strategy_factory, trainer, metric_factory, serializer
+        )
 
     def execute(self, request: FitModelRequest) -> FitModelResponse:
         """
@@ -45,7 +76,8 @@ class FitModelUseCase:
         Возвращает
         -------
         FitModelResponse
-            DTO с идентификатором модели, её представлением в base64 и вычисленными метриками.
+            DTO с идентификатором модели, вычисленными метриками и, если
+            request.model_response == 'inline', представлением модели в base64.
 
         Исключения
         ----------
@@ -53,48 +85,165 @@ class FitModelUseCase:
             Если запрошенная стратегия или метрика не зарегистрированы,
             или если данные не проходят валидацию в стратегии.
         """
-        points = [TimePoint(p.timestamp, p.endogenous, p.exogenous) for p in request.points]
-        series = TimeSeries(points, request.time_series_id)
-
-        strategy = self.strategy_factory.get(request.strategy)
-        if not strategy:
-            raise ValueError(f"Unknown strategy: {request.strategy}")
-
-        horizon = ForecastHorizon(request.horizon)
-        lags = LagCount(request.lags)
-
-        if request.strategy in ("direct", "multioutput"):
-            if "loss_function" not in request.catboost_params:
-                request.catboost_params["loss_function"] = "MultiRMSE"
-
-        x_train, y_train = strategy.prepare_train_data(series, horizon, lags)
-        model = self.trainer.train(x_train, y_train, request.catboost_params)
-
-        y_true = strategy.extract_test_values(series, horizon)
-        y_pred = strategy.forecast(model, series, horizon, lags)
+        timer = StageTimer()
+        cache_key, response = self._lookup(request, timer)
+        if response is None:
+            result = self.training_service.train(request)
+            response = self.save(request, result, cache_key=cache_key)
+        return self._with_timings(response, timer)
+
+    async def execute_async(
+        self, request: FitModelRequest, wait_for_queue: bool = False, retry_delay: float = 0.5
+    ) -> FitModelResponse:
+        """
+        Асинхронный вариант execute: обучение выполняется в пуле executor,
+        а отпечаток запроса, поиск в training_cache (в том числе чтение с диска)
+        и сохранение модели — в пуле потоков, не блокируя цикл событий. С wait_for_queue=True при заполненной очереди
+        пула задача ждёт места (проверка раз в retry_delay секунд), а не отклоняется.
 
-        metrics = {}
-        for metric_name in request.metrics:
-            calculator = self.metric_factory.get(metric_name)
-            if not calculator:
-                raise ValueError(f"Unknown metric: {metric_name}")
-            metrics[metric_name] = calculator.calculate(y_true, y_pred)
+        Исключения
+        ----------
+        TrainingQueueFullError
+            Если очередь пула обучения заполнена и wait_for_queue=False.
+        ValueError
+            См. execute.
+        """
+        if self.executor is None:
+            return self.execute(request)
+        timer = StageTimer()
+        cache_key, response = await asyncio.to_thread(self._lookup, request, timer)
+        if response is None:
+            start = time.perf_counter()
+            cost = request_cost(request)
+            if wait_for_queue:
+                result = await self.executor.run_queued(
+                    self.training_service.train, request, cost=cost, retry_delay=retry_delay
+                )
+            else:
+                result = await self.executor.run(self.training_service.train, request, cost=cost)
+            elapsed = time.perf_counter() - start
+            timer.add("queue_wait", max(elapsed - sum(result.timings.values()), 0.0))
+            response = await asyncio.to_thread(self.save, request, result, cache_key=cache_key)
+        return self._with_timings(response, timer)
+
+    def _lookup(
+        self, request: FitModelRequest, timer: StageTimer
+    ) -> Tuple[Optional[str], Optional[FitModelResponse]]:
+        if self.training_cache is None:
+            return None, None
+        with timer.stage("cache_lookup"):
+            return self.lookup(request)
+
+    @staticmethod
+    def _with_timings(response: FitModelResponse, timer: StageTimer) -> FitModelResponse:
+        response.timings = {**timer.timings, **(response.timings or {})}
+        return response
+
+    def lookup(self, request: FitModelRequest) -> Tuple[Optional[str], Optional[FitModelResponse]]:
+        """
+        Ищет результат обучения в training_cache.
 
-        model_bytes = pickle.dumps(model)
-        model_base64 = base64.b64encode(model_bytes).decode('utf-8')
+        Возвращает
+        -------
+        Tuple[Optional[str], Optional[FitModelResponse]]
+            Ключ кэша (None, если кэш не подключён) и ответ, если запись найдена.
+            При попадании возвращается тот же model_id; если модель успела
+            удалиться из репозитория, она сохраняется заново под этим идентификатором.
+        """
+        if self.training_cache is None:
+            return None, None
+        cache_key = fit_request_fingerprint(request, self.serializer.model_format, self.serializer.compression)
+        entry = self.training_cache.get(cache_key)
+        if entry is None:
+            return cache_key, None
+
+        model_bytes, payload = entry
+        result = TrainingResult(
+            model_bytes=model_bytes,
+            metrics=payload["metrics"],
+            snapshot=payload.get("snapshot"),
+            model_format=payload.get("model_format"),
+        )
+        model_id = payload["model_id"]
+        if not self.model_repo.exists(model_id):
+            self._store(model_id, request, result)
+        return cache_key, self._response(model_id, request, result)
 
+    def save(
+        self,
+        request: Union[FitModelRequest, PanelFitRequest],
+        result: TrainingResult,
+        parent_model_id: Optional[str] = None,
+        cache_key: Optional[str] = None,
+        extra_metadata: Optional[Dict[str, Any]] = None,
+    ) -> FitModelResponse:
+        """
+        Сохраняет обученную модель в репозиторий и формирует ответ.
+        parent_model_id указывается для модели, дообученной от сохранённой;
+        с cache_key (см. lookup) результат дополнительно кладётся в training_cache;
+        extra_metadata дописывается к метаданным модели.
+        """
+        start = time.perf_counter()
         model_id = str(uuid.uuid4())
+        self._store(model_id, request, result, parent_model_id, extra_metadata)
+        if cache_key is not None and self.training_cache is not None:
+            self.training_cache.put(
+                cache_key,
+                result.model_bytes,
+                {
+                    "model_id": model_id,
+                    "metrics": result.metrics,
+                    "snapshot": result.snapshot,
+                    "model_format": result.model_format,
+                },
+            )
+        timings = {**result.timings, "save": time.perf_counter() - start}
+        return self._response(model_id, request, result, timings)
+
+    def _store(
+        self,
+        model_id: str,
+        request: Union[FitModelRequest, PanelFitRequest],
+        result: TrainingResult,
+        parent_model_id: Optional[str] = None,
+        extra_metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
         metadata = {
             "series_id": request.time_series_id,
             "horizon": request.horizon,
             "lags": request.lags,
             "strategy": request.strategy,
-            "metrics": metrics,
+            "exogenous_names": request.exogenous_names,
+            "model_format": result.model_format or self.serializer.model_format,
+            "compression": self.serializer.compression,
+            "catboost_params": request.catboost_params,
+            "metrics": result.metrics,
+            "created_at": utc_now().isoformat(),
         }
-        self.model_repo.save(model_id, model_bytes, metadata)
-
+        if result.snapshot is not None:
+            metadata["snapshot"] = result.snapshot
+        if parent_model_id is not None:
+            metadata["parent_model_id"] = parent_model_id
+        if extra_metadata:
+            metadata.update(extra_metadata)
+        self.model_repo.save(model_id, result.model_bytes, metadata)
+
+    def _response(
+        self,
+        model_id: str,
+        request: Union[FitModelRequest, PanelFitRequest],
+        result: TrainingResult,
+        timings: Optional[Dict[str, float]] = None,
+    ) -> FitModelResponse:
+        model_base64 = None
+        if request.model_response == "inline":
+            model_base64 = base64.b64encode(result.model_bytes).decode('utf-8')
         return FitModelResponse(
             model_id=model_id,
             model_base64=model_base64,
-            metrics=metrics,
+            metrics=result.metrics,
+            model_format=result.model_format or self.serializer.model_format,
+            compression=self.serializer.compression,
+            model_response=request.model_response,
+            timings=timings,
         )
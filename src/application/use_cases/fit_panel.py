@@ -0,0 +1,57 @@
+from typing import Optional
+from src.domain import ITrainingExecutor, TrainingCost
+from src.application.dto import PanelFitRequest, PanelFitResponse
+from src.application.services.training import ModelTrainingService, training_cost
+from src.application.use_cases.fit_model import FitModelUseCase
+
+
+class FitPanelUseCase:
+    """
+    Сценарий использования для обучения одной глобальной модели на панели рядов.
+
+    Вместо отдельной модели на каждый ряд обучается одна модель CatBoost на
+    объединённых матрицах признаков всех рядов с идентификатором ряда в качестве
+    категориального признака. Модель сохраняется как при /fit с отметкой panel
+    в метаданных; прогноз для рядов панели выполняется одним пакетом через
+    /predict/batch.
+    """
+
+    def __init__(
+        self,
+        fit_use_case: FitModelUseCase,
+        training_service: ModelTrainingService,
+        executor: Optional[ITrainingExecutor] = None,
+    ):
+        self.fit_use_case = fit_use_case
+        self.training_service = training_service
+        self.executor = executor
+
+    async def execute(self, request: PanelFitRequest) -> PanelFitResponse:
+        """
+        Обучает и сохраняет панельную модель.
+
+        Исключения
+        ----------
+        ValueError
+            Если стратегия или метрика не зарегистрированы, стратегия не
+            поддерживает панельные модели, идентификаторы рядов
+            повторяются, экзогенные признаки рядов различаются или ряд не проходит
+            валидацию в стратегии.
+        TrainingQueueFullError
+            Если очередь пула обучения заполнена.
+        """
+        if self.executor is None:
+            result = self.training_service.train_panel(request)
+        else:
+            result = await self.executor.run(self.training_service.train_panel, request, cost=self._cost(request))
+        fit = self.fit_use_case.save(
+            request, result, extra_metadata={"panel": True, "n_series": len(request.series)}
+        )
+        return PanelFitResponse(fit=fit, series_metrics=result.series_metrics)
+
+    @staticmethod
+    def _cost(request: PanelFitRequest) -> TrainingCost:
+        """Оценка ресурсов: строки всех рядов в одной матрице, признаки — лаги, экзогенные и идентификатор ряда."""
+        n_rows = sum(max(len(item.timestamps) - request.lags, 0) for item in request.series)
+        n_features = request.lags + len(request.exogenous_names) + 1
+        return training_cost(request.strategy, request.horizon, n_rows, n_features, request.catboost_params)
@@ -0,0 +1,36 @@
+from typing import Any, Dict, List, Optional, Tuple
+from src.domain import IModelRepository, IModelCache
+
+
+class ManageModelsUseCase:
+    """Сценарий использования для просмотра и удаления сохранённых моделей."""
+
+    def __init__(self, model_repo: IModelRepository, model_cache: Optional[IModelCache] = None):
+        self.model_repo = model_repo
+        self.model_cache = model_cache
+
+    def list_models(self, series_id: Optional[str] = None) -> List[Tuple[str, Dict[str, Any]]]:
+        """Возвращает пары (model_id, метаданные), при необходимости только для указанного ряда."""
+        return self.model_repo.list(series_id)
+
+    def get_metadata(self, model_id: str) -> Dict[str, Any]:
+        """Возвращает метаданные модели (без чтения её байтов); бросает KeyError, если её нет."""
+        return self.model_repo.load_metadata(model_id)
+
+    def get_blob(self, model_id: str) -> Tuple[bytes, Dict[str, Any]]:
+        """Возвращает сохранённые байты модели (как есть, без распаковки) и метаданные."""
+        return self.model_repo.load(model_id)
+
+    def get_blob_file(self, model_id: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Возвращает путь к файлу с сохранёнными байтами модели и метаданные, не
+        читая файл; None, если хранилище держит модели в памяти (тогда байты
+        отдаёт get_blob). Бросает KeyError, если модели нет.
+        """
+        return self.model_repo.blob_file(model_id)
+
+    def delete(self, model_id: str) -> None:
+        """Удаляет модель; бросает KeyError, если её нет."""
+        self.model_repo.delete(model_id)
+        if self.model_cache is not None:
+            self.model_cache.invalidate(model_id)
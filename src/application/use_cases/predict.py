@@ -0,0 +1,155 @@
+from typing import Any, Dict, List, Optional, Tuple
+from src.domain import TimeSeries
+from src.domain import ForecastHorizon, LagCount
+from src.domain import IModelRepository, IModelCache, IModelSerializer, StrategyFactory, ModelNotFoundError
+from src.application import PredictRequest, PredictResponse, BatchPredictRequest, BatchPredictResponse
+
+
+class PredictUseCase:
+    """
+    Сценарий использования для прогноза сохранённой моделью.
+
+    Загружает модель из репозитория (или берёт уже десериализованную из кэша),
+    строит ряд из переданных последних точек и выполняет прогноз стратегией,
+    с которой модель обучалась, на сохранённые горизонт и число лагов.
+    Панельная модель (см. FitPanelUseCase) различает ряды по идентификатору,
+    поэтому прогноз по ней выполняется только через execute_batch.
+    """
+
+    def __init__(
+        self,
+        strategy_factory: StrategyFactory,
+        model_repo: IModelRepository,
+        serializer: IModelSerializer,
+        model_cache: Optional[IModelCache] = None,
+    ):
+        self.strategy_factory = strategy_factory
+        self.model_repo = model_repo
+        self.serializer = serializer
+        self.model_cache = model_cache
+
+    def execute(self, request: PredictRequest) -> PredictResponse:
+        """
+        Выполняет прогноз по запросу.
+
+        Параметры
+        ----------
+        request : PredictRequest
+            DTO с идентификатором модели и последними точками ряда.
+
+        Возвращает
+        -------
+        PredictResponse
+            DTO с прогнозом на сохранённый горизонт.
+
+        Исключения
+        ----------
+        ModelNotFoundError
+            Если модель с указанным идентификатором не найдена.
+        ValueError
+            Если точек меньше, чем лагов у модели, экзогенные признаки
+            не совпадают с использованными при обучении или модель панельная.
+        """
+        model, metadata = self._load(request.model_id)
+        if metadata.get("panel"):
+            raise ValueError(f"Model {request.model_id} is a panel model; use /predict/batch with series ids")
+        strategy, horizon, lags = self._resolve(metadata)
+        series = self._build_series(
+            request.timestamps,
+            request.endogenous,
+            request.exogenous,
+            request.exogenous_names,
+            metadata,
+            lags,
+            metadata.get("series_id"),
+        )
+        forecast = strategy.forecast(model, series, horizon, lags)
+        return PredictResponse(model_id=request.model_id, forecast=[float(v) for v in forecast])
+
+    def execute_batch(self, request: BatchPredictRequest) -> BatchPredictResponse:
+        """
+        Выполняет прогноз одной сохранённой моделью для нескольких рядов.
+
+        Стратегия получает все ряды сразу (forecast_many) и может обработать их
+        одним вызовом модели. Результат совпадает с вызовом execute для каждого ряда.
+        Для панельной модели идентификаторы рядов передаются категориальным признаком.
+
+        Исключения
+        ----------
+        ModelNotFoundError
+            Если модель с указанным идентификатором не найдена.
+        ValueError
+            Если какой-либо ряд не подходит модели (см. execute) или идентификаторы рядов повторяются.
+        """
+        ids = [item.series_id for item in request.series]
+        if len(ids) != len(set(ids)):
+            raise ValueError("Duplicate series ids in batch")
+
+        model, metadata = self._load(request.model_id)
+        strategy, horizon, lags = self._resolve(metadata)
+        series_list = [
+            self._build_series(
+                item.timestamps,
+                item.endogenous,
+                item.exogenous,
+                item.exogenous_names,
+                metadata,
+                lags,
+                item.series_id,
+            )
+            for item in request.series
+        ]
+        categories = ids if metadata.get("panel") else None
+        forecasts = strategy.forecast_many(model, series_list, horizon, lags, categories=categories)
+        return BatchPredictResponse(
+            model_id=request.model_id,
+            forecasts={
+                series_id: [float(v) for v in forecast]
+                for series_id, forecast in zip(ids, forecasts)
+            },
+        )
+
+    def _resolve(self, metadata: Dict[str, Any]) -> Tuple[Any, ForecastHorizon, LagCount]:
+        strategy = self.strategy_factory.get(metadata["strategy"])
+        if not strategy:
+            raise ValueError(f"Unknown strategy: {metadata['strategy']}")
+        return strategy, ForecastHorizon(metadata["horizon"]), LagCount(metadata["lags"])
+
+    def _build_series(
+        self,
+        timestamps,
+        endogenous,
+        exogenous,
+        exogenous_names: List[str],
+        metadata: Dict[str, Any],
+        lags: LagCount,
+        series_id: Optional[str],
+    ) -> TimeSeries:
+        """Проверяет, что точки подходят модели, и строит из них ряд."""
+        expected_names = metadata.get("exogenous_names")
+        if expected_names is not None and list(expected_names) != exogenous_names:
+            raise ValueError(
+                f"Exogenous features {exogenous_names} do not match the model's {expected_names}"
+            )
+        if len(timestamps) < lags.value:
+            raise ValueError(f"Not enough points: need {lags.value}, have {len(timestamps)}")
+        return TimeSeries(timestamps, endogenous, exogenous, exogenous_names, series_id=series_id)
+
+    def _load(self, model_id: str) -> Tuple[Any, Dict[str, Any]]:
+        if self.model_cache is not None:
+            cached = self.model_cache.get(model_id)
+            if cached is not None:
+                return cached
+        try:
+            model_bytes, metadata = self.model_repo.load(model_id)
+        except KeyError:
+            raise ModelNotFoundError(f"Model {model_id} not found") from None
+        # Модели, сохранённые до появления поля model_format, хранятся в pickle
+        model = self.serializer.deserialize(
+            model_bytes,
+            metadata.get("model_format", "pickle"),
+            metadata.get("compression", "none"),
+        )
+        if self.model_cache is not None:
+            self.model_cache.put(model_id, model, metadata, len(model_bytes))
+        return model, metadata
@@ -0,0 +1,105 @@
+from typing import Optional
+import numpy as np
+from src.domain import IModelRepository, ITrainingExecutor, ModelNotFoundError
+from src.application.dto import FitModelRequest, FitModelResponse, RefitModelRequest
+from src.application.services.training import ModelTrainingService, snapshot_columns, request_cost
+from src.application.use_cases.fit_model import FitModelUseCase
+
+# Число добавляемых деревьев, если iterations не задан в запросе. Сохранённое
+# iterations исходной модели не наследуется: иначе каждое дообучение удваивало
+# бы размер ансамбля.
+REFIT_DEFAULT_ITERATIONS = 100
+
+
+class RefitModelUseCase:
+    """
+    Сценарий использования для дообучения сохранённой модели на новых точках ряда.
+
+    Новые точки дописываются к снимку ряда, сохранённому вместе с моделью;
+    признаки строятся только для новых строк, а обучение продолжается от
+    сохранённой модели (warm start). Результат сохраняется как новая модель
+    со ссылкой на исходную (parent_model_id); исходная модель не меняется.
+
+    Параметры CatBoost берутся у исходной модели и дополняются параметрами
+    запроса, кроме iterations: это число добавляемых деревьев, по умолчанию
+    REFIT_DEFAULT_ITERATIONS.
+    """
+
+    def __init__(
+        self,
+        fit_use_case: FitModelUseCase,
+        training_service: ModelTrainingService,
+        model_repo: IModelRepository,
+        executor: Optional[ITrainingExecutor] = None,
+    ):
+        self.fit_use_case = fit_use_case
+        self.training_service = training_service
+        self.model_repo = model_repo
+        self.executor = executor
+
+    async def execute(self, request: RefitModelRequest) -> FitModelResponse:
+        """
+        Дообучает модель по запросу.
+
+        Исключения
+        ----------
+        ModelNotFoundError
+            Если модель с указанным идентификатором не найдена.
+        ValueError
+            Если у модели нет снимка ряда, экзогенные признаки не совпадают
+            с использованными при обучении или новые точки не идут после снимка.
+        TrainingQueueFullError
+            Если очередь пула обучения заполнена.
+        """
+        try:
+            model_bytes, metadata = self.model_repo.load(request.model_id)
+        except KeyError:
+            raise ModelNotFoundError(f"Model {request.model_id} not found") from None
+        fit_request = self._build_request(request, metadata)
+        args = (
+            fit_request,
+            model_bytes,
+            metadata.get("model_format", "pickle"),
+            metadata.get("compression", "none"),
+        )
+
+        if self.executor is None:
+            result = self.training_service.refit(*args)
+        else:
+            result = await self.executor.run(self.training_service.refit, *args, cost=request_cost(fit_request))
+        return self.fit_use_case.save(fit_request, result, parent_model_id=request.model_id)
+
+    @staticmethod
+    def _build_request(request: RefitModelRequest, metadata: dict) -> FitModelRequest:
+        snapshot = metadata.get("snapshot")
+        if snapshot is None:
+            raise ValueError(f"Model {request.model_id} has no stored series snapshot and cannot be refitted")
+
+        exogenous_names = list(metadata.get("exogenous_names") or [])
+        if request.exogenous_names != exogenous_names:
+            raise ValueError(
+                f"Exogenous features {request.exogenous_names} do not match "
+                f"the model's features {exogenous_names}"
+            )
+
+        timestamps, endogenous, exogenous = snapshot_columns(snapshot, len(exogenous_names))
+        if len(timestamps) and request.timestamps.min() <= timestamps[-1]:
+            raise ValueError("New points must come after the last point the model was trained on")
+
+        return FitModelRequest(
+            time_series_id=metadata.get("series_id"),
+            timestamps=np.concatenate([timestamps, request.timestamps]),
+            endogenous=np.concatenate([endogenous, request.endogenous]),
+            exogenous=np.concatenate([exogenous, request.exogenous]),
+            exogenous_names=exogenous_names,
+            horizon=metadata["horizon"],
+            strategy=metadata["strategy"],
+            lags=metadata["lags"],
+            catboost_params={
+                **metadata.get("catboost_params", {}),
+                "iterations": REFIT_DEFAULT_ITERATIONS,
+                **request.catboost_params,
+            },
+            metrics=request.metrics or list(metadata.get("metrics", {})),
+            model_response=request.model_response,
+        )
@@ -0,0 +1,104 @@
+import asyncio
+import logging
+import uuid
+from dataclasses import asdict
+from typing import Set
+from src.domain import TrainingJob, JobStatus, ITrainingJobRepository, TrainingQueueFullError
+from src.domain.entities import utc_now
+from src.application import FitModelRequest
+from src.application.use_cases.fit_model import FitModelUseCase
+
+logger = logging.getLogger(__name__)
+
+
+class TrainingJobsUseCase:
+    """
+    Сценарий использования для фонового обучения моделей.
+
+    submit регистрирует задачу в хранилище и сразу возвращает её; само обучение
+    выполняется через FitModelUseCase.execute_async в фоновой задаче asyncio.
+    Фоновая задача переживает запрос, поэтому fit_use_case должен жить столько
+    же, сколько сценарий (в DI — уровень приложения), а не создаваться на запрос.
+    Одновременно выполняется не более max_running задач, ещё max_queued ждут
+    своей очереди; сверх этого submit бросает TrainingQueueFullError.
+    """
+
+    def __init__(
+        self,
+        fit_use_case: FitModelUseCase,
+        job_repo: ITrainingJobRepository,
+        max_running: int,
+        max_queued: int,
+        retry_delay: float = 0.5,
+    ):
+        self.fit_use_case = fit_use_case
+        self.job_repo = job_repo
+        self.max_running = max_running
+        self.max_queued = max_queued
+        self.retry_delay = retry_delay
+        self._semaphore = asyncio.Semaphore(max_running)
+        self._tasks: Set[asyncio.Task] = set()
+
+    def submit(self, request: FitModelRequest) -> TrainingJob:
+        """
+        Создаёт задачу обучения и запускает её в фоне.
+
+        Должен вызываться из работающего цикла событий.
+
+        Исключения
+        ----------
+        TrainingQueueFullError
+            Если число незавершённых задач достигло max_running + max_queued.
+        """
+        if len(self._tasks) >= self.max_running + self.max_queued:
+            raise TrainingQueueFullError(
+                f"Training job queue is full ({len(self._tasks)} jobs in progress)"
+            )
+        job = TrainingJob(job_id=str(uuid.uuid4()), series_id=request.time_series_id)
+        self.job_repo.save(job)
+
+        task = asyncio.get_running_loop().create_task(self._run(job, request))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    @property
+    def pending(self) -> int:
+        """Число незавершённых задач (выполняющихся и ожидающих)."""
+        return len(self._tasks)
+
+    def get(self, job_id: str) -> TrainingJob:
+        """Возвращает задачу по идентификатору; бросает KeyError, если её нет."""
+        return self.job_repo.get(job_id)
+
+    def shutdown(self) -> None:
+        """Отменяет незавершённые задачи."""
+        for task in list(self._tasks):
+            task.cancel()
+
+    async def _run(self, job: TrainingJob, request: FitModelRequest) -> None:
+        async with self._semaphore:
+            job.status = JobStatus.RUNNING
+            job.started_at = utc_now()
+            self.job_repo.save(job)
+            try:
+                # Пул обучения общий с синхронным /fit: если он занят, задача ждёт места
+                response = await self.fit_use_case.execute_async(
+                    request, wait_for_queue=True, retry_delay=self.retry_delay
+                )
+                job.result = asdict(response)
+                job.status = JobStatus.DONE
+            except ValueError as e:
+                job.status = JobStatus.FAILED
+                job.error = str(e)
+            except asyncio.CancelledError:
+                job.status = JobStatus.FAILED
+                job.error = "Job was cancelled"
+                raise
+            except Exception:
+                logger.exception("Unhandled exception in training job %s", job.job_id)
+                job.status = JobStatus.FAILED
+                job.error = "Internal server error"
+            finally:
+                job.finished_at = utc_now()
+                self.job_repo.save(job)
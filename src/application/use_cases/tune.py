@@ -0,0 +1,124 @@
+import math
+from contextlib import aclosing, nullcontext
+from typing import Any, Callable, List, Optional, Tuple
+from src.domain import ITrainingExecutor, TrainingCost
+from src.application.dto import FitModelRequest, TuneRequest, TuneResponse, TuneTrial
+from src.application.services.training import training_cost
+from src.application.services.tuning import TuningService
+from src.application.use_cases.fit_model import FitModelUseCase
+
+
+class TuneModelUseCase:
+    """
+    Сценарий использования для подбора гиперпараметров CatBoost методом
+    последовательного деления (successive halving).
+
+    Все n_trials кандидатов сначала обучаются с малой долей бюджета итераций;
+    после каждого раунда остаётся лучшая 1/reduction_factor часть, а бюджет
+    увеличивается в reduction_factor раз. На последнем раунде оставшиеся кандидаты
+    обучаются с полным бюджетом, и лучшая модель сохраняется через FitModelUseCase.
+    Попытки одного раунда выполняются в пуле обучения параллельно.
+    """
+
+    def __init__(
+        self,
+        fit_use_case: FitModelUseCase,
+        tuning_service: TuningService,
+        executor: Optional[ITrainingExecutor] = None,
+        retry_delay: float = 0.5,
+    ):
+        self.fit_use_case = fit_use_case
+        self.tuning_service = tuning_service
+        self.executor = executor
+        self.retry_delay = retry_delay
+
+    async def execute(self, request: TuneRequest) -> TuneResponse:
+        """
+        Подбирает параметры и сохраняет лучшую модель.
+
+        Возвращает
+        -------
+        TuneResponse
+            Сохранённая лучшая модель, её параметры и значение метрики на валидации,
+            а также результаты всех попыток.
+
+        Исключения
+        ----------
+        ValueError
+            Если стратегия, метрика или перебираемый параметр не поддерживаются,
+            или данных не хватает на валидационную часть.
+        """
+        service = self.tuning_service
+        plan = service.plan(request)
+        trials = [TuneTrial(index=i, params=params) for i, params in enumerate(plan.candidates)]
+        data = (plan.x_train, plan.y_train, plan.x_val, plan.y_val)
+        final_context = (request.strategy, plan.series, request.horizon, request.lags, request.metrics)
+
+        eta = request.reduction_factor
+        n_rounds = int(math.log(len(trials), eta) + 1e-9) + 1
+        alive = trials
+        results = {}
+        # Матрицы признаков передаются в пул один раз на все раунды
+        shared = self.executor.shared(*data) if self.executor else nullcontext()
+        with shared:
+            for round_index in range(n_rounds):
+                final = round_index == n_rounds - 1
+                fraction = eta ** (round_index - n_rounds + 1)
+                calls = [
+                    (
+                        *data,
+                        service.trial_params(plan, trial.params, fraction, request.early_stopping_rounds),
+                        final_context if final else None,
+                    )
+                    for trial in alive
+                ]
+                costs = [
+                    training_cost(request.strategy, request.horizon, len(plan.x_train), plan.x_train.shape[1], args[4])
+                    for args in calls
+                ]
+                outcomes = await self._run_all(service.run_trial, calls, costs)
+                for trial, (score, best_iteration, result) in zip(alive, outcomes):
+                    trial.score, trial.best_iteration, trial.rounds = score, best_iteration, round_index + 1
+                    if result is not None:
+                        results[trial.index] = result
+                alive = sorted(alive, key=lambda t: t.score if math.isfinite(t.score) else math.inf)
+                if not final:
+                    alive = alive[:max(len(alive) // eta, 1)]
+
+        best = alive[0]
+        best_params = {**plan.base_params, **best.params}
+        fit_request = FitModelRequest(
+            time_series_id=request.time_series_id,
+            timestamps=request.timestamps,
+            endogenous=request.endogenous,
+            exogenous=request.exogenous,
+            exogenous_names=request.exogenous_names,
+            horizon=request.horizon,
+            strategy=request.strategy,
+            lags=request.lags,
+            catboost_params=best_params,
+            metrics=request.metrics,
+            model_response=request.model_response,
+        )
+        return TuneResponse(
+            fit=self.fit_use_case.save(fit_request, results[best.index]),
+            best_params=best_params,
+            best_score=best.score,
+            trials=trials,
+        )
+
+    async def _run_all(self, fn: Callable[..., Any], calls: List[Tuple], costs: List[TrainingCost]) -> List[Any]:
+        """
+        Выполняет fn для всех наборов аргументов и возвращает результаты в том же порядке.
+        Задачи отправляются в пул, пока в нём есть место; остальные ждут освобождения.
+        costs — оценки ресурсов задач для планировщика пула.
+        """
+        if self.executor is None:
+            return [fn(*args) for args in calls]
+
+        results: List[Any] = [None] * len(calls)
+        # Ошибка попытки или отмена запроса закрывает генератор — задачи не остаются в очереди пула
+        async with aclosing(self.executor.as_completed(fn, calls, costs, self.retry_delay)) as completed:
+            async for index, future in completed:
+                results[index] = future.result()
+        return results
@@ -0,0 +1,4 @@
+from .synthetic import synthetic_series, fit_payload
+from .runner import BenchmarkConfig, StageResult, run_benchmarks, compare
+
+__all__ = ["synthetic_series", "fit_payload", "BenchmarkConfig", "StageResult", "run_benchmarks", "compare"]
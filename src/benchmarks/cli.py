@@ -0,0 +1,76 @@
+import argparse
+import json
+import sys
+from typing import List, Optional
+from src.benchmarks.runner import STAGES, STRATEGIES, BenchmarkConfig, compare, run_benchmarks
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    defaults = BenchmarkConfig()
+    parser = argparse.ArgumentParser(
+        prog="tsf-bench",
+        description="Бенчмарк конвейера обучения на синтетических рядах; результат — JSON.",
+    )
+    parser.add_argument("--length", type=int, default=defaults.length, help="Число точек ряда")
+    parser.add_argument("--exogenous", type=int, default=defaults.n_exogenous, help="Число экзогенных признаков")
+    parser.add_argument("--lags", type=int, default=defaults.lags)
+    parser.add_argument("--horizon", type=int, default=defaults.horizon)
+    parser.add_argument("--iterations", type=int, default=defaults.iterations, help="Деревьев CatBoost")
+    parser.add_argument("--metric-series", type=int, default=defaults.metric_series, help="Рядов для этапа metrics")
+    parser.add_argument(
+        "--model-bytes", type=int, default=defaults.model_bytes, help="Размер модели в ответе для response_encode"
+    )
+    parser.add_argument("--repeat", type=int, default=defaults.repeat, help="Повторов каждого замера")
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--strategies", nargs="+", choices=STRATEGIES, default=list(STRATEGIES))
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--output", "-o", help="Файл для JSON-отчёта (по умолчанию stdout)")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON-отчёт предыдущего запуска для сравнения")
+    parser.add_argument("--quiet", "-q", action="store_true", help="Не печатать ход замеров в stderr")
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    if args.length <= args.lags + args.horizon:
+        parser.error("--length must exceed --lags + --horizon")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    config = BenchmarkConfig(
+        length=args.length,
+        n_exogenous=args.exogenous,
+        lags=args.lags,
+        horizon=args.horizon,
+        iterations=args.iterations,
+        metric_series=args.metric_series,
+        model_bytes=args.model_bytes,
+        repeat=args.repeat,
+        seed=args.seed,
+        strategies=args.strategies,
+        stages=args.stages,
+    )
+    log = None if args.quiet else (lambda message: print(message, file=sys.stderr))
+    report = run_benchmarks(config, log=log)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        report["comparison"] = {
+            "baseline_commit": baseline.get("environment", {}).get("commit"),
+            "stages": compare(report, baseline),
+        }
+        for row in report["comparison"]["stages"]:
+            ratio = f"x{row['ratio']:.3f}" if row["ratio"] is not None else "n/a"
+            print(
+                f"{row['stage']:<32} {row['baseline_seconds']:>12.6f}s -> {row['current_seconds']:>12.6f}s  {ratio}",
+                file=sys.stderr,
+            )
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
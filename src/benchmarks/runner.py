@@ -0,0 +1,331 @@
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+import numpy as np
+from src.benchmarks.synthetic import fit_payload, synthetic_series
+
+STRATEGIES = ("direct", "recursive", "multioutput")
+METRICS = ["mae", "rmse", "mse", "mape", "smape", "r2", "max_error"]
+# Этапы в порядке выполнения; подмножество выбирается параметром stages
+STAGES = (
+    "schema_parse",
+    "request_parse",
+    "response_encode",
+    "map_request",
+    "build_series",
+    "prepare_train_data",
+    "train",
+    "forecast",
+    "metrics",
+    "fit_e2e",
+    "startup",
+)
+
+
+@dataclass
+class BenchmarkConfig:
+    length: int = 10_000  # точек в ряду
+    n_exogenous: int = 5
+    lags: int = 24
+    horizon: int = 12
+    iterations: int = 100  # деревьев CatBoost для train и fit_e2e
+    metric_series: int = 10_000  # число рядов для этапа metrics
+    model_bytes: int = 4 * 1024 ** 2  # размер модели в ответе для этапа response_encode
+    repeat: int = 5
+    seed: int = 0
+    strategies: List[str] = field(default_factory=lambda: list(STRATEGIES))
+    stages: List[str] = field(default_factory=lambda: list(STAGES))
+
+
+@dataclass
+class StageResult:
+    name: str
+    repeat: int
+    items: int  # сколько элементов (точек, строк, значений) обрабатывается за один запуск
+    unit: str
+    min_seconds: float
+    median_seconds: float
+    mean_seconds: float
+    throughput: float  # items в секунду по лучшему запуску
+    peak_traced_bytes: int  # пик памяти Python/numpy (tracemalloc) за один запуск
+
+
+def measure(name: str, fn: Callable[[], Any], repeat: int, items: int, unit: str) -> StageResult:
+    """
+    Замеряет fn: repeat запусков для времени и отдельный запуск под tracemalloc для пика памяти,
+    чтобы трассировка не искажала время.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    best = min(times)
+    return StageResult(
+        name=name,
+        repeat=repeat,
+        items=items,
+        unit=unit,
+        min_seconds=best,
+        median_seconds=statistics.median(times),
+        mean_seconds=statistics.fmean(times),
+        throughput=items / best if best > 0 else float("inf"),
+        peak_traced_bytes=peak,
+    )
+
+
+def run_benchmarks(config: BenchmarkConfig, log: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+    """
+    Прогоняет выбранные этапы конвейера обучения на синтетических данных.
+
+    Возвращает
+    -------
+    Dict[str, Any]
+        JSON-совместимый отчёт: окружение, конфигурация, результаты этапов
+        (StageResult по имени этапа) и пиковый RSS процесса.
+    """
+    from src.domain import TimeSeries, ForecastHorizon, LagCount, MetricFactory
+    from src.application.services import MetricsEngine
+    from src.application.services.metrics import (
+        MAECalculator,
+        RMSECalculator,
+        MSECalculator,
+        MAPECalculator,
+        SMAPECalculator,
+        R2Calculator,
+        MaxErrorCalculator,
+    )
+    from src.application.services.training import training_params
+    from src.presentation import FitRequestSchema, map_request_schema_to_dto
+    from src.infrastructure.ml import CatBoostTrainer
+    from src.infrastructure.strategies import (
+        DirectForecastStrategy,
+        RecursiveForecastStrategy,
+        MultiOutputForecastStrategy,
+    )
+
+    log = log or (lambda message: None)
+    strategies = {
+        "direct": DirectForecastStrategy(),
+        "recursive": RecursiveForecastStrategy(),
+        "multioutput": MultiOutputForecastStrategy(),
+    }
+    stages = set(config.stages)
+    results: Dict[str, StageResult] = {}
+
+    def run(name: str, fn: Callable[[], Any], items: int, unit: str) -> None:
+        log(f"{name} ...")
+        results[name] = measure(name, fn, config.repeat, items, unit)
+        log(f"{name}: {results[name].min_seconds:.6f}s, {results[name].throughput:,.0f} {unit}/s")
+
+    catboost_params = {"iterations": config.iterations, "random_seed": config.seed}
+    payload = fit_payload(
+        config.length, config.n_exogenous, config.horizon, config.lags,
+        config.strategies[0], catboost_params, METRICS, config.seed,
+    )
+    body = json.dumps(payload).encode("utf-8")
+    schema = FitRequestSchema.model_validate_json(body)
+    timestamps, endogenous, exogenous, names = synthetic_series(config.length, config.n_exogenous, config.seed)
+    series = TimeSeries(timestamps, endogenous, exogenous, names, series_id="bench")
+    horizon, lags = ForecastHorizon(config.horizon), LagCount(config.lags)
+
+    if "schema_parse" in stages:
+        run("schema_parse", lambda: FitRequestSchema.model_validate_json(body), config.length, "points")
+    if "request_parse" in stages:
+        # Разбор тела FastAPI (json.loads, затем валидация словаря) против parse_body
+        run(
+            "request_parse[fastapi]",
+            lambda: FitRequestSchema.model_validate(json.loads(body)),
+            config.length,
+            "points",
+        )
+        run("request_parse[direct]", lambda: FitRequestSchema.model_validate_json(body), config.length, "points")
+    if "response_encode" in stages:
+        _run_response_encode(config, run)
+    if "map_request" in stages:
+        run("map_request", lambda: map_request_schema_to_dto(schema), config.length, "points")
+    if "build_series" in stages:
+        run(
+            "build_series",
+            lambda: TimeSeries(timestamps, endogenous, exogenous, names, series_id="bench"),
+            config.length,
+            "points",
+        )
+
+    trainer = CatBoostTrainer()
+    for name in config.strategies:
+        strategy = strategies[name]
+        x, y = strategy.prepare_train_data(series, horizon, lags)
+        if "prepare_train_data" in stages:
+            run(f"prepare_train_data[{name}]", lambda: strategy.prepare_train_data(series, horizon, lags), len(x), "rows")
+        if "train" in stages or "forecast" in stages:
+            params = training_params(name, catboost_params)
+            model = trainer.train(x, y, params)
+            if "train" in stages:
+                run(f"train[{name}]", lambda: trainer.train(x, y, params), len(x), "rows")
+            if "forecast" in stages:
+                run(f"forecast[{name}]", lambda: strategy.forecast(model, series, horizon, lags), config.horizon, "steps")
+
+    if "metrics" in stages:
+        engine = MetricsEngine(MetricFactory({
+            "mae": MAECalculator(),
+            "rmse": RMSECalculator(),
+            "mse": MSECalculator(),
+            "mape": MAPECalculator(),
+            "smape": SMAPECalculator(),
+            "r2": R2Calculator(),
+            "max_error": MaxErrorCalculator(),
+        }))
+        rng = np.random.default_rng(config.seed)
+        y_true = rng.normal(100.0, 10.0, size=(config.metric_series, config.horizon))
+        y_pred = y_true + rng.normal(size=y_true.shape)
+        run(
+            "metrics",
+            lambda: engine.evaluate(y_true, y_pred, METRICS, per_step=True),
+            y_true.size,
+            "values",
+        )
+
+    if "fit_e2e" in stages:
+        _run_fit_e2e(config, catboost_params, run)
+    if "startup" in stages:
+        _run_startup(run)
+
+    return {
+        "environment": environment(),
+        "config": asdict(config),
+        "stages": {name: asdict(result) for name, result in results.items()},
+        "max_rss_bytes": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+    }
+
+
+def _run_response_encode(config: BenchmarkConfig, run: Callable[..., None]) -> None:
+    """
+    Кодирование ответа /fit с моделью в model_base64: прежний путь FastAPI (схема
+    из DTO, повторная валидация по response_model, сериализация pydantic) против
+    словаря из DTO, закодированного FastJSONResponse.
+    """
+    import base64
+    from pydantic import TypeAdapter
+    from src.application.dto import FitModelResponse
+    from src.presentation import FitResponseSchema, map_fit_response_to_schema, map_fit_response_to_content
+    from src.infrastructure.api.fast_json import FastJSONResponse
+
+    model = np.random.default_rng(config.seed).bytes(config.model_bytes)
+    response = FitModelResponse(
+        model_id="bench",
+        model_base64=base64.b64encode(model).decode("ascii"),
+        metrics={name: 1.0 for name in METRICS},
+        timings={"train": 1.0, "serialize": 0.1},
+    )
+    adapter = TypeAdapter(FitResponseSchema)
+    run(
+        "response_encode[schema]",
+        lambda: adapter.dump_json(adapter.validate_python(map_fit_response_to_schema(response))),
+        config.model_bytes,
+        "bytes",
+    )
+    run(
+        "response_encode[direct]",
+        lambda: FastJSONResponse(map_fit_response_to_content(response)).body,
+        config.model_bytes,
+        "bytes",
+    )
+
+
+def _run_fit_e2e(config: BenchmarkConfig, catboost_params: Dict[str, Any], run: Callable[..., None]) -> None:
+    """/fit целиком через TestClient: разбор JSON, пул обучения, сохранение. Кэш обучения отключается."""
+    os.environ["TSF_TRAINING_CACHE_ENABLED"] = "false"
+    try:
+        from fastapi.testclient import TestClient
+    except ImportError as e:
+        raise RuntimeError("fit_e2e requires httpx: pip install 'timeseriesforecastapi[bench]'") from e
+    from src.main import app
+
+    with TestClient(app) as client:
+        for name in config.strategies:
+            body = json.dumps(fit_payload(
+                config.length, config.n_exogenous, config.horizon, config.lags,
+                name, catboost_params, METRICS, config.seed,
+            )).encode("utf-8")
+
+            def fit() -> None:
+                response = client.post("/fit", content=body, headers={"Content-Type": "application/json"})
+                response.raise_for_status()
+
+            fit()  # прогрев пула обучения
+            run(f"fit_e2e[{name}]", fit, config.length, "points")
+
+
+def _run_startup(run: Callable[..., None]) -> None:
+    """Холодный импорт приложения в отдельном интерпретаторе: по умолчанию и с TSF_PRELOAD=true."""
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    for name, preload in (("lazy", "false"), ("preload", "true")):
+        env = {**os.environ, "TSF_PRELOAD": preload}
+
+        def start() -> None:
+            subprocess.run([sys.executable, "-c", "import src.main"], cwd=root, env=env, check=True)
+
+        run(f"startup[{name}]", start, 1, "starts")
+
+
+def environment() -> Dict[str, Any]:
+    """Версии Python и библиотек, платформа и текущий коммит git (если доступен)."""
+    import catboost
+    import pydantic
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, timeout=5
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "numpy": np.__version__,
+        "catboost": catboost.__version__,
+        "pydantic": pydantic.__version__,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Сравнивает два отчёта run_benchmarks по лучшему времени этапов.
+
+    Возвращает
+    -------
+    List[Dict[str, Any]]
+        Для каждого общего этапа — время в обоих отчётах и отношение current / baseline
+        (больше 1 — медленнее).
+    """
+    rows = []
+    for name, stage in current["stages"].items():
+        base = baseline.get("stages", {}).get(name)
+        if base is None:
+            continue
+        rows.append({
+            "stage": name,
+            "baseline_seconds": base["min_seconds"],
+            "current_seconds": stage["min_seconds"],
+            "ratio": stage["min_seconds"] / base["min_seconds"] if base["min_seconds"] else None,
+        })
+    return rows
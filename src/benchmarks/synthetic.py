@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Tuple
+import numpy as np
+
+# Первая метка времени синтетических рядов; шаг — один час
+START = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+def synthetic_series(
+    length: int, n_exogenous: int, seed: int = 0
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+    """
+    Генерирует ряд с трендом, суточной сезонностью, шумом и экзогенными признаками,
+    часть которых влияет на целевую переменную.
+
+    Возвращает
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]
+        Метки времени (int64, нс, шаг — час), эндогенная переменная (float64),
+        экзогенные признаки (float64, length × n_exogenous) и их имена —
+        в том же виде, что columns_from_points.
+    """
+    rng = np.random.default_rng(seed)
+    start_ns = int(START.timestamp()) * 10 ** 9
+    timestamps = start_ns + np.arange(length, dtype=np.int64) * 3600 * 10 ** 9
+    t = np.arange(length, dtype=np.float64)
+    exogenous = rng.normal(size=(length, n_exogenous))
+    endogenous = 100.0 + 0.01 * t + 10.0 * np.sin(2 * np.pi * t / 24) + rng.normal(scale=2.0, size=length)
+    if n_exogenous:
+        endogenous += exogenous[:, : min(n_exogenous, 3)].sum(axis=1)
+    names = [f"x{i:03d}" for i in range(n_exogenous)]
+    return timestamps, endogenous, exogenous, names
+
+
+def fit_payload(
+    length: int,
+    n_exogenous: int,
+    horizon: int,
+    lags: int,
+    strategy: str,
+    catboost_params: Dict[str, Any],
+    metrics: List[str],
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Возвращает тело запроса /fit (FitRequestSchema) с синтетическим рядом."""
+    _, endogenous, exogenous, names = synthetic_series(length, n_exogenous, seed)
+    step = timedelta(hours=1)
+    points = [
+        {
+            "timestamp": (START + i * step).isoformat(),
+            "endogenous": float(endogenous[i]),
+            "exogenous": dict(zip(names, exogenous[i].tolist())),
+        }
+        for i in range(length)
+    ]
+    return {
+        "time_series_id": f"bench-{seed}",
+        "points": points,
+        "horizon": horizon,
+        "strategy": strategy,
+        "lags": lags,
+        "catboost_params": catboost_params,
+        "metrics": metrics,
+        "model_response": "omit",
+    }
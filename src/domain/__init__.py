@@ -1,10 +1,17 @@
-from .entities import TimeSeries, TrainedModel
-from .value_objects import TimePoint, ForecastHorizon, LagCount, MetricName
+from .entities import TimeSeries, TrainedModel, TrainingJob
+from .value_objects import TimePoint, ForecastHorizon, LagCount, MetricName, JobStatus, TrainingCost
 from .interfaces import (
     IForecastStrategy,
     ITrainer,
+    IModelSerializer,
     IMetricCalculator,
     IModelRepository,
+    IModelCache,
+    ITrainingCache,
+    ITrainingJobRepository,
+    ITrainingExecutor,
+    LazyImport,
+    LazyFactory,
     StrategyFactory,
     MetricFactory,
 )
@@ -13,14 +20,26 @@ from .exceptions import *
 __all__ = [
     "TimeSeries",
     "TrainedModel",
+    "TrainingJob",
     "TimePoint",
     "ForecastHorizon",
     "LagCount",
     "MetricName",
+    "JobStatus",
+    "TrainingCost",
     "IForecastStrategy",
     "ITrainer",
+    "IModelSerializer",
     "IMetricCalculator",
     "IModelRepository",
+    "IModelCache",
+    "ITrainingCache",
+    "ITrainingJobRepository",
+    "ITrainingExecutor",
+    "TrainingQueueFullError",
+    "ModelNotFoundError",
+    "LazyImport",
+    "LazyFactory",
     "StrategyFactory",
     "MetricFactory",
 ]
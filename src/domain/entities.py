@@ -1,34 +1,136 @@
-from typing import List
-from .value_objects import TimePoint
+from typing import List, Sequence, Tuple
+from .value_objects import TimePoint, JobStatus
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+import numpy as np
+
+_EPOCH = datetime(1970, 1, 1)
+
 
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc).replace(tzinfo=None)
 
+
+def datetime_to_ns(value: datetime) -> int:
+    """Переводит datetime в целое число наносекунд с начала эпохи (aware-значения приводятся к UTC)."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    delta = value - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
+
+
+def ns_to_datetime(value: int) -> datetime:
+    """Переводит наносекунды с начала эпохи в naive datetime (UTC) с точностью до микросекунд."""
+    return _EPOCH + timedelta(microseconds=int(value) // 1_000)
+
+
+def columns_from_points(
+    points: Sequence[Any],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]:
+    """
+    Раскладывает последовательность точек в колонки.
+
+    Параметры
+    ----------
+    points : Sequence[Any]
+        Объекты с атрибутами timestamp, endogenous и exogenous
+        (TimePoint, DTO или pydantic-схема точки).
+
+    Возвращает
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]
+        Метки времени (int64, нс), эндогенная переменная (float64),
+        матрица экзогенных признаков (float64, n × n_exog) и имена её столбцов
+        в алфавитном порядке.
+
+    Исключения
+    ----------
+    ValueError
+        Если наборы экзогенных признаков отличаются между точками.
+    """
+    n = len(points)
+    timestamps = np.fromiter((datetime_to_ns(p.timestamp) for p in points), dtype=np.int64, count=n)
+    endogenous = np.fromiter((p.endogenous for p in points), dtype=np.float64, count=n)
+    if n == 0:
+        return timestamps, endogenous, np.empty((0, 0), dtype=np.float64), []
+
+    first_keys = points[0].exogenous.keys()
+    names = sorted(first_keys)
+    if any(p.exogenous.keys() != first_keys for p in points):
+        raise ValueError("All points must have the same set of exogenous features")
+    exogenous = np.array(
+        [[p.exogenous[key] for key in names] for p in points], dtype=np.float64
+    ).reshape(n, len(names))
+    return timestamps, endogenous, exogenous, names
+
+
 class TimeSeries:
-    """Класс для временного ряда"""
-    def __init__(self, points: List[TimePoint], series_id: Optional[str] = None):
-        if not points:
+    """
+    Класс для временного ряда.
+
+    Хранит ряд в колоночном виде: метки времени (int64, наносекунды с начала эпохи),
+    значения эндогенной переменной (float64) и матрицу экзогенных признаков
+    (float64, n × n_exog) с фиксированным порядком столбцов exogenous_names.
+    Точки всегда упорядочены по времени.
+    """
+    def __init__(
+        self,
+        timestamps: np.ndarray,
+        endogenous: np.ndarray,
+        exogenous: Optional[np.ndarray] = None,
+        exogenous_names: Optional[List[str]] = None,
+        series_id: Optional[str] = None,
+    ):
+        timestamps = np.asarray(timestamps, dtype=np.int64)
+        endogenous = np.asarray(endogenous, dtype=np.float64)
+        n = len(timestamps)
+        if n == 0:
             raise ValueError("Time series must contain at least one point")
-        # Проверка уникальности временных меток
-        timestamps = [p.timestamp for p in points]
-        if len(timestamps) != len(set(timestamps)):
-            raise ValueError("Duplicate timestamps in time series")
-        self.points = sorted(points, key=lambda p: p.timestamp)  # всегда сортируем по времени
+        if endogenous.shape != (n,):
+            raise ValueError("Endogenous values must be a 1-D array aligned with timestamps")
+
+        exogenous_names = list(exogenous_names or [])
+        if exogenous is None:
+            exogenous = np.empty((n, 0), dtype=np.float64)
+        exogenous = np.asarray(exogenous, dtype=np.float64)
+        if exogenous.shape != (n, len(exogenous_names)):
+            raise ValueError(
+                f"Exogenous matrix must have shape ({n}, {len(exogenous_names)}), got {exogenous.shape}"
+            )
+
+        # всегда сортируем по времени; копии делаем только если ряд не упорядочен
+        if n > 1 and not np.all(timestamps[1:] > timestamps[:-1]):
+            order = np.argsort(timestamps, kind="stable")
+            timestamps = timestamps[order]
+            endogenous = endogenous[order]
+            exogenous = exogenous[order]
+            # Проверка уникальности временных меток
+            if np.any(timestamps[1:] == timestamps[:-1]):
+                raise ValueError("Duplicate timestamps in time series")
+
+        self.timestamps = np.ascontiguousarray(timestamps)
+        self.endogenous = np.ascontiguousarray(endogenous)
+        self.exogenous = np.ascontiguousarray(exogenous)
+        self.exogenous_names = exogenous_names
         self.series_id = series_id
 
+    @classmethod
+    def from_points(cls, points: List[TimePoint], series_id: Optional[str] = None) -> "TimeSeries":
+        """Создаёт временной ряд из списка точек TimePoint."""
+        timestamps, endogenous, exogenous, names = columns_from_points(points)
+        return cls(timestamps, endogenous, exogenous, names, series_id)
+
     def __len__(self) -> int:
-        return len(self.points)
+        return len(self.timestamps)
 
-    def get_endogenous_array(self):
-        """Возвращает список значений эндогенного признака временного ряда."""
-        return [p.endogenous for p in self.points]
+    def get_endogenous_array(self) -> np.ndarray:
+        """Возвращает массив значений эндогенного признака временного ряда."""
+        return self.endogenous
 
-    def get_exogenous_data(self):
+    def get_exogenous_data(self) -> List[Dict[str, float]]:
         """Возвращает список словарей значений экзогенных признаков временного ряда."""
-        return [p.exogenous for p in self.points]
+        return [dict(zip(self.exogenous_names, row)) for row in self.exogenous.tolist()]
 
 
 def utc_now() -> datetime:
@@ -47,3 +149,16 @@ class TrainedModel:
     metrics: Dict[str, float]
     created_at: datetime = field(default_factory=utc_now)
     metadata: Optional[Dict[str, Any]] = None
+
+@dataclass
+class TrainingJob:
+    """Фоновая задача обучения модели."""
+    job_id: str
+    series_id: str
+    status: JobStatus = JobStatus.QUEUED
+    created_at: datetime = field(default_factory=utc_now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    # model_id, model_base64 и metrics после успешного завершения
+    result: Optional[Dict[str, Any]] = None
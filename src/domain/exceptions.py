@@ -0,0 +1,8 @@
+class TrainingQueueFullError(Exception):
+    """Очередь задач обучения переполнена, новая задача не может быть принята."""
+    pass
+
+
+class ModelNotFoundError(Exception):
+    """Модель с указанным идентификатором не найдена в хранилище."""
+    pass
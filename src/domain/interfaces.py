@@ -1,11 +1,23 @@
+import asyncio
+import importlib
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Tuple
+from concurrent.futures import Future
+from contextlib import nullcontext
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple, Callable, TypeVar, ContextManager, AsyncIterator, Sequence
 import numpy as np
-from .entities import TimeSeries
-from .value_objects import ForecastHorizon, LagCount
+from .entities import TimeSeries, TrainingJob
+from .exceptions import TrainingQueueFullError
+from .value_objects import ForecastHorizon, LagCount, TrainingCost
+
+T = TypeVar("T")
 
 class IForecastStrategy(ABC):
     """Стратегия подготовки данных для обучения и прогнозирования."""
+
+    # Может ли стратегия обучать и прогнозировать панельную модель (categories в forecast_many)
+    supports_panel: bool = False
+
     @abstractmethod
     def prepare_train_data(
         self, series: TimeSeries, horizon: ForecastHorizon, lags: LagCount
@@ -20,6 +32,24 @@ class IForecastStrategy(ABC):
         """Выполняет прогноз на последние horizon точек ряда."""
         pass
 
+    def forecast_many(
+        self,
+        model: Any,
+        series_list: List[TimeSeries],
+        horizon: ForecastHorizon,
+        lags: LagCount,
+        categories: Optional[List[str]] = None,
+    ) -> List[np.ndarray]:
+        """
+        Выполняет прогноз одной моделью для нескольких рядов; по умолчанию — по одному ряду.
+        categories — значения категориального признака рядов (идентификаторы рядов
+        в панельной модели, см. ITrainer.train) в порядке series_list; передаются
+        только стратегиям с supports_panel.
+        """
+        if categories is not None:
+            raise ValueError(f"{type(self).__name__} does not support panel models")
+        return [self.forecast(model, series, horizon, lags) for series in series_list]
+
     @abstractmethod
     def extract_test_values(
         self, series: TimeSeries, horizon: ForecastHorizon
@@ -27,10 +57,67 @@ class IForecastStrategy(ABC):
         """Извлекает истинные значения тестового периода (последние horizon точек)."""
         pass
 
+    @abstractmethod
+    def train_rows(self, cutoff: int, horizon: ForecastHorizon, lags: LagCount) -> int:
+        """
+        Возвращает число первых строк prepare_train_data для всего ряда, все цели
+        которых лежат строго до позиции cutoff. Строка k соответствует позиции lags + k.
+        Позволяет брать обучающую выборку для точки отсечения срезом, не пересобирая признаки.
+        """
+        pass
+
 class ITrainer(ABC):
     @abstractmethod
-    def train(self, x: np.ndarray, y: np.ndarray, params: Dict[str, Any]) -> Any:
-        """Обучает модель и возвращает объект модели (например, CatBoost)."""
+    def train(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        params: Dict[str, Any],
+        eval_set: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+        init_model: Optional[Any] = None,
+        categories: Optional[np.ndarray] = None,
+    ) -> Any:
+        """
+        Обучает модель и возвращает объект модели (например, CatBoost).
+        Если передан eval_set (x_val, y_val), качество отслеживается на нём
+        (в том числе для ранней остановки). Если передан init_model, обучение
+        продолжается от этой модели: новые деревья добавляются к её ансамблю.
+        categories — строковый категориальный признак каждой строки x (например,
+        идентификатор ряда в панели); он добавляется после столбцов x.
+        Для двумерной цели реализация может обучить одну multi-target модель
+        или по модели на столбец; в обоих случаях predict возвращает все столбцы.
+        """
+        pass
+
+    @abstractmethod
+    def best_score(self, model: Any) -> Tuple[float, int]:
+        """
+        Возвращает лучшее значение метрики на eval_set и номер итерации, на которой
+        оно достигнуто. Меньшее значение лучше.
+        """
+        pass
+
+class IModelSerializer(ABC):
+    """Преобразует обученную модель в байты и обратно."""
+    # Формат и сжатие, в которых serialize сохраняет модель
+    model_format: str
+    compression: str
+
+    @abstractmethod
+    def serialize(self, model: Any) -> bytes:
+        pass
+
+    @abstractmethod
+    def format_of(self, model: Any) -> str:
+        """
+        Возвращает формат, в котором serialize сохранит model. Для составных
+        моделей он может отличаться от model_format (см. реализацию).
+        """
+        pass
+
+    @abstractmethod
+    def deserialize(self, data: bytes, model_format: str, compression: str) -> Any:
+        """Восстанавливает модель, сохранённую в указанном формате и со сжатием."""
         pass
 
 class IMetricCalculator(ABC):
@@ -49,11 +136,196 @@ class IModelRepository(ABC):
     def load(self, model_id: str) -> Tuple[bytes, Dict[str, Any]]:
         pass
 
+    @abstractmethod
+    def load_metadata(self, model_id: str) -> Dict[str, Any]:
+        """Возвращает только метаданные модели, не читая её байты; бросает KeyError, если модели нет."""
+        pass
+
+    @abstractmethod
+    def exists(self, model_id: str) -> bool:
+        pass
+
+    @abstractmethod
+    def delete(self, model_id: str) -> None:
+        """Удаляет модель; бросает KeyError, если её нет."""
+        pass
+
+    @abstractmethod
+    def list(self, series_id: Optional[str] = None) -> List[Tuple[str, Dict[str, Any]]]:
+        """Возвращает пары (model_id, метаданные), при необходимости только для указанного ряда."""
+        pass
+
+    @abstractmethod
+    def blob_file(self, model_id: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Возвращает путь к файлу с байтами модели и метаданные, если хранилище
+        держит модели в файлах; None — если байты есть только в памяти (см. load).
+        Бросает KeyError, если модели нет.
+        """
+        pass
+
+class IModelCache(ABC):
+    """Кэш десериализованных моделей вместе с их метаданными."""
+    @abstractmethod
+    def get(self, model_id: str) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        """Возвращает (модель, метаданные) или None, если модели нет в кэше."""
+        pass
+
+    @abstractmethod
+    def put(self, model_id: str, model: Any, metadata: Dict[str, Any], size_bytes: int) -> None:
+        pass
+
+    @abstractmethod
+    def invalidate(self, model_id: str) -> None:
+        pass
+
+class ITrainingCache(ABC):
+    """
+    Кэш результатов обучения по отпечатку запроса: сериализованная модель
+    и связанные с ней данные (идентификатор, метрики и т. п.).
+    """
+    # Число обращений, нашедших и не нашедших запись
+    hits: int
+    misses: int
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+        """Возвращает (байты модели, данные) или None, если записи нет."""
+        pass
+
+    @abstractmethod
+    def put(self, key: str, model_data: bytes, payload: Dict[str, Any]) -> None:
+        pass
+
+class ITrainingJobRepository(ABC):
+    """Хранилище фоновых задач обучения и их результатов."""
+    @abstractmethod
+    def save(self, job: TrainingJob) -> None:
+        """Создаёт или обновляет задачу."""
+        pass
+
+    @abstractmethod
+    def get(self, job_id: str) -> TrainingJob:
+        """Возвращает задачу по идентификатору; бросает KeyError, если её нет."""
+        pass
+
+class ITrainingExecutor(ABC):
+    """Выполняет CPU-ёмкие задачи обучения вне потока обработки запросов."""
+    @abstractmethod
+    def submit(self, fn: Callable[..., T], *args: Any, cost: Optional[TrainingCost] = None) -> "Future[T]":
+        """
+        Ставит задачу в очередь; бросает TrainingQueueFullError, если очередь заполнена.
+        cost — оценка ресурсов задачи, по которой пул выбирает порядок запуска и число потоков.
+        """
+        pass
+
+    @abstractmethod
+    async def run(self, fn: Callable[..., T], *args: Any, cost: Optional[TrainingCost] = None) -> T:
+        """Ставит задачу в очередь и асинхронно ожидает её результат."""
+        pass
+
+    async def as_completed(
+        self,
+        fn: Callable[..., T],
+        calls: Sequence[Tuple[Any, ...]],
+        costs: Optional[Sequence[Optional[TrainingCost]]] = None,
+        retry_delay: float = 0.5,
+    ) -> AsyncIterator[Tuple[int, "asyncio.Future[T]"]]:
+        """
+        Выполняет fn для каждого набора аргументов из calls и отдаёт пары
+        (номер набора, завершённый future) в порядке завершения.
+
+        Задачи отправляются, пока очередь их принимает; при TrainingQueueFullError
+        остальные ждут, пока завершится одна из своих задач, а если своих задач
+        в очереди нет — retry_delay секунд. При выходе из генератора (ошибка,
+        отмена, закрытие) отправленные и не завершённые задачи отменяются;
+        закрывать генератор следует через contextlib.aclosing.
+        """
+        pending: Dict[asyncio.Future, int] = {}
+        next_call = 0
+        try:
+            while next_call < len(calls) or pending:
+                while next_call < len(calls):
+                    cost = costs[next_call] if costs is not None else None
+                    try:
+                        future = self.submit(fn, *calls[next_call], cost=cost)
+                    except TrainingQueueFullError:
+                        break
+                    pending[asyncio.wrap_future(future)] = next_call
+                    next_call += 1
+
+                if not pending:
+                    await asyncio.sleep(retry_delay)
+                    continue
+
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future
+        finally:
+            for future in pending:
+                future.cancel()
+
+    async def run_queued(
+        self, fn: Callable[..., T], *args: Any, cost: Optional[TrainingCost] = None, retry_delay: float = 0.5
+    ) -> T:
+        """Как run, но при заполненной очереди ждёт места вместо TrainingQueueFullError."""
+        completed = self.as_completed(fn, [args], [cost], retry_delay)
+        try:
+            async for _, future in completed:
+                return future.result()
+        finally:
+            await completed.aclose()
+
+    def shared(self, *arrays: np.ndarray) -> ContextManager[None]:
+        """
+        Контекст, на время которого массивы, передаваемые в задачи, удерживаются
+        в общей для рабочих процессов памяти. По умолчанию ничего не делает.
+        """
+        return nullcontext()
+
+
+@dataclass(frozen=True)
+class LazyImport:
+    """
+    Отложенная реализация для фабрики: путь 'модуль:класс'. Модуль импортируется,
+    а класс создаётся без аргументов при первом обращении к фабрике по имени.
+    """
+    path: str
+
+    def load(self) -> Any:
+        module_name, _, name = self.path.partition(":")
+        return getattr(importlib.import_module(module_name), name)()
+
+
+class LazyFactory(Dict[str, Any]):
+    """
+    Словарь реализаций, значения которого могут быть LazyImport: такое значение
+    заменяется созданным объектом при первом обращении через [] или get.
+
+    Одновременное первое обращение из нескольких потоков может создать объект
+    дважды; реализации не хранят состояния, поэтому это безопасно.
+    """
+
+    def __getitem__(self, name: str) -> Any:
+        value = super().__getitem__(name)
+        if isinstance(value, LazyImport):
+            value = value.load()
+            self[name] = value
+        return value
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self[name] if name in self else default
+
+    def load_all(self) -> None:
+        """Создаёт все отложенные реализации (прогрев перед fork рабочих процессов)."""
+        for name in list(self):
+            self[name]
+
 
-class StrategyFactory(Dict[str, Any]):
+class StrategyFactory(LazyFactory):
     """Словарь со стратегиями прогнозирования."""
     pass
 
-class MetricFactory(Dict[str, Any]):
+class MetricFactory(LazyFactory):
     """Словарь с калькуляторами метрик."""
     pass
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict
+from enum import Enum
+from typing import Dict, Optional
 
 @dataclass(frozen=True)
 class TimePoint:
@@ -31,3 +32,22 @@ class LagCount:
 class MetricName:
     """Название метрики, которая будет оценивать качество модели после обучения"""
     name: str  # можно позже добавить Enum
+
+@dataclass(frozen=True)
+class TrainingCost:
+    """
+    Оценка ресурсов задачи обучения для планировщика пула: размер наибольшей
+    обучающей матрицы (для оценки памяти) и объём работы — строки × признаки ×
+    итерации × число моделей, суммарно по всем обучениям задачи.
+    """
+    rows: int
+    features: int
+    work: int
+    threads: Optional[int] = None  # thread_count из catboost_params, если клиент его задал
+
+class JobStatus(str, Enum):
+    """Состояние фоновой задачи обучения"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
@@ -1,4 +1,5 @@
 from .controllers import router
 from .dependencies import AppProvider
+from .fast_json import FastJSONResponse
 
-__all__ = ["router", "AppProvider"]
\ No newline at end of file
+__all__ = ["router", "AppProvider", "FastJSONResponse"]
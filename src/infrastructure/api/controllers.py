@@ -1,31 +1,547 @@
-from fastapi import APIRouter, HTTPException
+import os
+import time
+from typing import Annotated, List, Optional, Tuple
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, PlainTextResponse, Response, StreamingResponse
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from src.presentation.schemas import FitRequestSchema, FitResponseSchema
-from src.presentation.mappers import map_request_schema_to_dto
+from src.presentation.schemas import (
+    FitRequestSchema,
+    FitUploadParamsSchema,
+    FitResponseSchema,
+    JobCreatedSchema,
+    TrainingCacheStatsSchema,
+    SchedulerStateSchema,
+    StartupReportSchema,
+    JobStatusSchema,
+    BatchFitRequestSchema,
+    BatchFitItemResultSchema,
+    ModelInfoSchema,
+    PredictRequestSchema,
+    PredictResponseSchema,
+    BatchPredictRequestSchema,
+    BatchPredictResponseSchema,
+    BacktestRequestSchema,
+    BacktestResponseSchema,
+    TuneRequestSchema,
+    TuneResponseSchema,
+    RefitRequestSchema,
+    PanelFitRequestSchema,
+    PanelFitResponseSchema,
+)
+from src.presentation.mappers import (
+    map_request_schema_to_dto,
+    map_upload_to_dto,
+    map_fit_response_to_content,
+    map_job_to_status_schema,
+    map_batch_item_to_dto,
+    map_batch_item_result_to_schema,
+    map_model_metadata_to_schema,
+    map_predict_schema_to_dto,
+    map_batch_predict_schema_to_dto,
+    map_backtest_schema_to_dto,
+    map_backtest_response_to_schema,
+    map_tune_schema_to_dto,
+    map_tune_response_to_schema,
+    map_refit_schema_to_dto,
+    map_panel_schema_to_dto,
+    map_panel_response_to_content,
+)
+from src.presentation.ingestion import Columns, parse_ndjson, parse_csv, parse_arrow
+from src.application.dto import BatchFitItemResult, FitModelResponse
 from src.application.use_cases.fit_model import FitModelUseCase
+from src.application.use_cases.training_jobs import TrainingJobsUseCase
+from src.application.use_cases.batch_fit import BatchFitModelUseCase
+from src.application.use_cases.manage_models import ManageModelsUseCase
+from src.application.use_cases.predict import PredictUseCase
+from src.application.use_cases.backtest import BacktestModelUseCase
+from src.application.use_cases.tune import TuneModelUseCase
+from src.application.use_cases.refit import RefitModelUseCase
+from src.application.use_cases.fit_panel import FitPanelUseCase
+from src.domain.value_objects import JobStatus
+from src.domain.exceptions import ModelNotFoundError, TrainingQueueFullError
+from src.infrastructure.executors import ProcessPoolTrainingExecutor
+from src.infrastructure.api.fast_json import FastJSONResponse, json_body_openapi, parse_body
+from src.infrastructure.monitoring import ServiceMetrics
 import logging
 
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-@router.post("/fit", response_model=FitResponseSchema)
+@router.post("/fit", response_model=FitResponseSchema, openapi_extra=json_body_openapi(FitRequestSchema))
 @inject
 async def fit_model(
-    request: FitRequestSchema,
+    http_request: Request,
     use_case: FromDishka[FitModelUseCase],
+    metrics: FromDishka[ServiceMetrics],
 ):
+    """
+    Обучает модель на ряде из тела запроса (FitRequestSchema). Тело разбирается
+    сразу в схему (parse_body), ответ кодируется в JSON один раз (FastJSONResponse).
+    """
+    request = await parse_body(http_request, FitRequestSchema)
     try:
+        start = time.perf_counter()
         dto = map_request_schema_to_dto(request)
-        response = use_case.execute(dto)
-        return FitResponseSchema(
-            model_id=response.model_id,
-            model_base64=response.model_base64,
-            metrics=response.metrics
-        )
+        map_seconds = time.perf_counter() - start
+        response = await use_case.execute_async(dto)
+        return _fit_response(_observe_fit(metrics, response, map_seconds))
+    except TrainingQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception:
         logger.exception("Unhandled exception in /fit")
         raise HTTPException(status_code=500, detail="Internal server error")
+
+
+
+# Content-Type тела /fit/upload -> формат для parse_arrow
+_ARROW_MEDIA_TYPES = {
+    "application/vnd.apache.arrow.stream": "arrow_stream",
+    "application/vnd.apache.arrow.file": "arrow_file",
+    "application/vnd.apache.parquet": "parquet",
+}
+
+
+@router.post(
+    "/fit/upload",
+    response_model=FitResponseSchema,
+    responses={415: {"description": "Неподдерживаемый Content-Type тела"}},
+)
+@inject
+async def fit_model_upload(
+    request: Request,
+    params: Annotated[FitUploadParamsSchema, Query()],
+    use_case: FromDishka[FitModelUseCase],
+    metrics: FromDishka[ServiceMetrics],
+):
+    """
+    Обучает модель на ряде, загруженном телом запроса в колоночном формате:
+    NDJSON (application/x-ndjson, по точке на строку), CSV (text/csv),
+    Arrow IPC (application/vnd.apache.arrow.stream / .file) или Parquet
+    (application/vnd.apache.parquet). Параметры обучения передаются в строке запроса.
+    """
+    try:
+        start = time.perf_counter()
+        columns = await _read_upload(request)
+        dto = map_upload_to_dto(params, columns)
+        map_seconds = time.perf_counter() - start
+        response = await use_case.execute_async(dto)
+        return _fit_response(_observe_fit(metrics, response, map_seconds))
+    except TrainingQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("Unhandled exception in /fit/upload")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+async def _read_upload(request: Request) -> Columns:
+    media_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if media_type in ("application/x-ndjson", "application/jsonl"):
+        return await parse_ndjson(request.stream())
+    # Разбор всего тела — работа CPU, поэтому выполняется в пуле потоков
+    if media_type == "text/csv":
+        return await run_in_threadpool(parse_csv, await request.body())
+    if media_type in _ARROW_MEDIA_TYPES:
+        try:
+            return await run_in_threadpool(parse_arrow, await request.body(), _ARROW_MEDIA_TYPES[media_type])
+        except RuntimeError as e:
+            raise HTTPException(status_code=415, detail=str(e))
+    raise HTTPException(status_code=415, detail=f"Unsupported Content-Type: {media_type or 'none'}")
+
+
+@router.post(
+    "/fit/batch",
+    response_class=StreamingResponse,
+    responses={200: {"description": "NDJSON: по одной строке BatchFitItemResultSchema на ряд"}},
+)
+@inject
+async def fit_batch(
+    request: BatchFitRequestSchema,
+    use_case: FromDishka[BatchFitModelUseCase],
+):
+    """
+    Обучает модели для множества рядов. Результаты отдаются потоком NDJSON
+    по мере готовности; index указывает на позицию ряда в items.
+    """
+    dtos, positions, rejected = [], [], []
+    for index, item in enumerate(request.items):
+        try:
+            dtos.append(map_batch_item_to_dto(item, request))
+            positions.append(index)
+        except ValueError as e:
+            rejected.append(BatchFitItemResult(index, item.time_series_id, error=str(e)))
+
+    link = request.model_response == "link"
+
+    async def stream():
+        for result in rejected:
+            yield _ndjson_line(map_batch_item_result_to_schema(result))
+        async for result in use_case.execute(dtos):
+            result.index = positions[result.index]
+            model_url = _model_blob_url(result.model_id) if link and result.model_id else None
+            yield _ndjson_line(map_batch_item_result_to_schema(result, model_url))
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+def _observe_fit(metrics: ServiceMetrics, response: FitModelResponse, map_seconds: float) -> FitModelResponse:
+    """Добавляет к timings ответа этап map_request и записывает этапы в гистограмму /metrics."""
+    response.timings = {"map_request": map_seconds, **(response.timings or {})}
+    metrics.observe_fit(response.timings)
+    return response
+
+
+def _fit_response(response: FitModelResponse) -> FastJSONResponse:
+    model_url = _model_blob_url(response.model_id) if response.model_response == "link" else None
+    return FastJSONResponse(map_fit_response_to_content(response, model_url))
+
+
+def _model_blob_url(model_id: str) -> str:
+    return router.url_path_for("get_model_blob", model_id=model_id)
+
+
+def _ndjson_line(schema: BatchFitItemResultSchema) -> str:
+    return schema.model_dump_json(exclude_none=True) + "\n"
+
+@router.post("/fit/panel", response_model=PanelFitResponseSchema)
+@inject
+async def fit_panel(
+    request: PanelFitRequestSchema,
+    use_case: FromDishka[FitPanelUseCase],
+):
+    """
+    Обучает одну глобальную модель на всех рядах панели; идентификатор ряда
+    используется как категориальный признак. Прогноз — через /predict/batch.
+    """
+    try:
+        dto = map_panel_schema_to_dto(request)
+        response = await use_case.execute(dto)
+        model_url = _model_blob_url(response.fit.model_id) if dto.model_response == "link" else None
+        return FastJSONResponse(map_panel_response_to_content(response, model_url))
+    except TrainingQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception:
+        logger.exception("Unhandled exception in /fit/panel")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.post("/backtest", response_model=BacktestResponseSchema)
+@inject
+async def backtest_model(
+    request: BacktestRequestSchema,
+    use_case: FromDishka[BacktestModelUseCase],
+):
+    """
+    Оценивает модель скользящим началом прогноза: n_folds фолдов, точки отсечения
+    которых сдвинуты на step, с расширяющимся или скользящим (window) окном обучения.
+    """
+    try:
+        dto = map_backtest_schema_to_dto(request)
+        response = await use_case.execute(dto)
+        return map_backtest_response_to_schema(response)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception:
+        logger.exception("Unhandled exception in /backtest")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.post("/tune", response_model=TuneResponseSchema)
+@inject
+async def tune_model(
+    request: TuneRequestSchema,
+    use_case: FromDishka[TuneModelUseCase],
+):
+    """
+    Подбирает iterations, depth, learning_rate и l2_leaf_reg по search_space
+    методом последовательного деления с ранней остановкой на валидационной части
+    и сохраняет лучшую модель.
+    """
+    try:
+        dto = map_tune_schema_to_dto(request)
+        response = await use_case.execute(dto)
+        model_url = _model_blob_url(response.fit.model_id) if dto.model_response == "link" else None
+        return map_tune_response_to_schema(response, model_url)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception:
+        logger.exception("Unhandled exception in /tune")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.post(
+    "/fit/jobs",
+    response_model=JobCreatedSchema,
+    status_code=202,
+    openapi_extra=json_body_openapi(FitRequestSchema),
+)
+@inject
+async def submit_fit_job(
+    http_request: Request,
+    jobs: FromDishka[TrainingJobsUseCase],
+):
+    request = await parse_body(http_request, FitRequestSchema)
+    try:
+        dto = map_request_schema_to_dto(request)
+        job = jobs.submit(dto)
+        return JobCreatedSchema(job_id=job.job_id, status=job.status.value)
+    except TrainingQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception:
+        logger.exception("Unhandled exception in /fit/jobs")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get("/fit/jobs/{job_id}", response_model=JobStatusSchema)
+@inject
+async def get_fit_job(job_id: str, jobs: FromDishka[TrainingJobsUseCase]):
+    try:
+        job = jobs.get(job_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return map_job_to_status_schema(job)
+
+
+@router.get("/fit/jobs/{job_id}/result", response_model=FitResponseSchema)
+@inject
+async def get_fit_job_result(job_id: str, jobs: FromDishka[TrainingJobsUseCase]):
+    try:
+        job = jobs.get(job_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    if job.status == JobStatus.FAILED:
+        raise HTTPException(status_code=409, detail=f"Job {job_id} failed: {job.error}")
+    if job.status != JobStatus.DONE:
+        raise HTTPException(status_code=409, detail=f"Job {job_id} is {job.status.value}")
+    return _fit_response(FitModelResponse(**job.result))
+
+
+@router.get("/fit/cache", response_model=TrainingCacheStatsSchema)
+@inject
+async def get_training_cache_stats(use_case: FromDishka[FitModelUseCase]):
+    cache = use_case.training_cache
+    if cache is None:
+        return TrainingCacheStatsSchema(enabled=False, hits=0, misses=0)
+    return TrainingCacheStatsSchema(enabled=True, hits=cache.hits, misses=cache.misses)
+
+
+@router.get("/admin/scheduler", response_model=SchedulerStateSchema)
+@inject
+async def get_scheduler_state(executor: FromDishka[ProcessPoolTrainingExecutor]):
+    return SchedulerStateSchema(**executor.allocation())
+
+
+@router.get("/admin/startup", response_model=StartupReportSchema)
+async def get_startup_report(request: Request):
+    """Длительности этапов запуска сервиса и загруженные тяжёлые модули."""
+    return StartupReportSchema(**request.app.state.startup.snapshot())
+
+
+@router.get("/models", response_model=List[ModelInfoSchema])
+@inject
+async def list_models(
+    use_case: FromDishka[ManageModelsUseCase],
+    series_id: Optional[str] = None,
+):
+    return [
+        map_model_metadata_to_schema(model_id, metadata)
+        for model_id, metadata in use_case.list_models(series_id)
+    ]
+
+
+@router.get("/models/{model_id}", response_model=ModelInfoSchema)
+@inject
+async def get_model(model_id: str, use_case: FromDishka[ManageModelsUseCase]):
+    try:
+        metadata = use_case.get_metadata(model_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Model {model_id} not found")
+    return map_model_metadata_to_schema(model_id, metadata)
+
+
+@router.get(
+    "/models/{model_id}/blob",
+    response_class=Response,
+    responses={
+        200: {"content": {"application/octet-stream": {}}},
+        206: {"description": "Запрошенный диапазон байтов"},
+        416: {"description": "Диапазон вне размера модели"},
+    },
+)
+@inject
+async def get_model_blob(
+    model_id: str,
+    use_case: FromDishka[ManageModelsUseCase],
+    range_header: Optional[str] = Header(None, alias="Range"),
+):
+    """
+    Отдаёт сохранённые байты модели как есть (в формате model_format и со
+    сжатием compression из заголовков ответа). Поддерживает один диапазон
+    в заголовке Range (bytes=start-end, bytes=start-, bytes=-suffix).
+
+    Модель из дискового хранилища отдаётся из файла частями (FileResponse,
+    диапазон — через seek), не загружаясь в память целиком.
+    """
+    try:
+        blob_file = use_case.get_blob_file(model_id)
+        if blob_file is not None:
+            path, metadata = blob_file
+            stat_result = os.stat(path)
+        else:
+            data, metadata = use_case.get_blob(model_id)
+    except (KeyError, FileNotFoundError):
+        raise HTTPException(status_code=404, detail=f"Model {model_id} not found")
+
+    model_format = metadata.get("model_format", "pickle")
+    compression = metadata.get("compression", "none")
+    extension = model_format + ("" if compression == "none" else f".{compression}")
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f'attachment; filename="{model_id}.{extension}"',
+        "X-Model-Format": model_format,
+        "X-Model-Compression": compression,
+    }
+    if blob_file is not None:
+        # Range и If-Range FileResponse обрабатывает сам
+        return FileResponse(
+            path, media_type="application/octet-stream", headers=headers, stat_result=stat_result
+        )
+
+    byte_range = _parse_byte_range(range_header, len(data))
+    if byte_range is None:
+        return Response(content=data, media_type="application/octet-stream", headers=headers)
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{len(data)}"
+    return Response(
+        content=data[start:end + 1],
+        status_code=206,
+        media_type="application/octet-stream",
+        headers=headers,
+    )
+
+
+def _parse_byte_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Разбирает заголовок Range с одним диапазоном и возвращает (start, end) включительно.
+    Для отсутствующего, некорректного или составного заголовка возвращает None
+    (отдаётся весь объект); для невыполнимого диапазона отвечает 416.
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    start_text, _, end_text = header[len("bytes="):].strip().partition("-")
+    try:
+        if start_text:
+            start = int(start_text)
+            end = int(end_text) if end_text else size - 1
+        else:
+            suffix = int(end_text)
+            if suffix == 0:
+                raise HTTPException(status_code=416, headers={"Content-Range": f"bytes */{size}"})
+            start, end = max(size - suffix, 0), size - 1
+    except ValueError:
+        return None
+    if start >= size:
+        raise HTTPException(status_code=416, headers={"Content-Range": f"bytes */{size}"})
+    if start < 0 or end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+@router.post("/models/{model_id}/refit", response_model=FitResponseSchema)
+@inject
+async def refit_model(
+    model_id: str,
+    request: RefitRequestSchema,
+    use_case: FromDishka[RefitModelUseCase],
+):
+    """
+    Дообучает модель на новых точках ряда, продолжая бустинг от сохранённой модели.
+    Результат сохраняется как новая модель; исходная остаётся без изменений.
+    """
+    try:
+        dto = map_refit_schema_to_dto(model_id, request)
+        response = await use_case.execute(dto)
+        return _fit_response(response)
+    except ModelNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except TrainingQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception:
+        logger.exception("Unhandled exception in /models/{model_id}/refit")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.delete("/models/{model_id}", status_code=204)
+@inject
+async def delete_model(model_id: str, use_case: FromDishka[ManageModelsUseCase]):
+    try:
+        use_case.delete(model_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Model {model_id} not found")
+
+
+@router.post("/predict", response_model=PredictResponseSchema)
+@inject
+async def predict(
+    request: PredictRequestSchema,
+    use_case: FromDishka[PredictUseCase],
+):
+    """
+    Прогноз сохранённой моделью. Десериализация и прогноз выполняются в пуле
+    потоков, не блокируя цикл событий.
+    """
+    try:
+        dto = map_predict_schema_to_dto(request)
+        response = await run_in_threadpool(use_case.execute, dto)
+        return PredictResponseSchema(model_id=response.model_id, forecast=response.forecast)
+    except ModelNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception:
+        logger.exception("Unhandled exception in /predict")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.post("/predict/batch", response_model=BatchPredictResponseSchema)
+@inject
+async def predict_batch(
+    request: BatchPredictRequestSchema,
+    use_case: FromDishka[PredictUseCase],
+):
+    """
+    Прогноз одной сохранённой моделью для нескольких рядов. Прогноз выполняется
+    в пуле потоков, не блокируя цикл событий.
+    """
+    try:
+        dto = map_batch_predict_schema_to_dto(request)
+        response = await run_in_threadpool(use_case.execute_batch, dto)
+        return BatchPredictResponseSchema(model_id=response.model_id, forecasts=response.forecasts)
+    except ModelNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception:
+        logger.exception("Unhandled exception in /predict/batch")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+@inject
+async def get_metrics(metrics: FromDishka[ServiceMetrics]):
+    """Метрики сервиса в текстовом формате Prometheus."""
+    return PlainTextResponse(metrics.registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -1,71 +1,324 @@
+from typing import Iterator
 from dishka import Provider, Scope, provide
-from src.infrastructure.strategies import (
-    DirectForecastStrategy,
-    RecursiveForecastStrategy,
-    MultiOutputForecastStrategy,
+from src.infrastructure.config import Settings
+from src.infrastructure.executors import ProcessPoolTrainingExecutor, SharedArrayStore
+from src.infrastructure.monitoring import ServiceMetrics
+from src.infrastructure.ml import CatBoostTrainer, InMemoryModelCache, CatBoostModelSerializer, TrainingResultCache
+from src.infrastructure.repositories import (
+    InMemoryModelRepository,
+    DiskModelRepository,
+    InMemoryTrainingJobRepository,
+    SqliteTrainingJobRepository,
 )
-from src.infrastructure.ml import CatBoostTrainer
-from src.infrastructure.repositories import InMemoryModelRepository
-from src.application.use_cases import FitModelUseCase
-from src.application.services.metrics import (
-    MAECalculator,
-    RMSECalculator,
-    MSECalculator,
-    MAPECalculator,
-    SMAPECalculator,
-    R2Calculator,
-    MaxErrorCalculator,
+from src.application.use_cases import (
+    FitModelUseCase,
+    TrainingJobsUseCase,
+    BatchFitModelUseCase,
+    ManageModelsUseCase,
+    PredictUseCase,
+    BacktestModelUseCase,
+    TuneModelUseCase,
+    RefitModelUseCase,
+    FitPanelUseCase,
+)
+from src.application.services.training import ModelTrainingService
+from src.application.services.tuning import TuningService
+from src.infrastructure.startup import PRELOAD_MODULES
+from src.domain import (
+    LazyImport,
+    StrategyFactory,
+    MetricFactory,
+    IModelRepository,
+    IModelCache,
+    IModelSerializer,
+    ITrainingCache,
+    ITrainingJobRepository,
 )
-from src.domain import StrategyFactory, MetricFactory
 
 class AppProvider(Provider):
     """Провайдер зависимостей для DI-контейнера Dishka."""
     scope = Scope.REQUEST
 
-    @provide
+    @provide(scope=Scope.APP)
+    def provide_settings(self) -> Settings:
+        """Предоставляет настройки сервиса, прочитанные из переменных окружения."""
+        return Settings()
+
+    @provide(scope=Scope.APP)
+    def provide_training_executor(self, settings: Settings) -> Iterator[ProcessPoolTrainingExecutor]:
+        """Предоставляет общий для приложения пул процессов обучения и останавливает его при закрытии контейнера."""
+        shared_arrays = None
+        if settings.shared_memory != "none":
+            shared_arrays = SharedArrayStore(
+                backend=settings.shared_memory,
+                min_bytes=settings.shared_memory_min_bytes,
+                directory=settings.shared_memory_path,
+            )
+        executor = ProcessPoolTrainingExecutor(
+            max_workers=settings.training_max_workers,
+            max_queue_size=settings.training_max_queue_size,
+            mp_context=settings.training_mp_context,
+            shared_arrays=shared_arrays,
+            cpus=settings.scheduler_cpus,
+            memory_bytes=settings.scheduler_memory_bytes,
+            aging_seconds=settings.scheduler_aging_seconds,
+            preload_modules=PRELOAD_MODULES if settings.training_preload else (),
+        )
+        yield executor
+        executor.shutdown()
+
+    @provide(scope=Scope.APP)
+    def provide_job_repository(self, settings: Settings) -> Iterator[ITrainingJobRepository]:
+        """Предоставляет хранилище фоновых задач обучения, выбранное в настройках."""
+        if settings.job_store == "sqlite":
+            repo = SqliteTrainingJobRepository(
+                settings.job_store_path,
+                max_finished=settings.jobs_max_finished,
+                ttl_seconds=settings.jobs_finished_ttl_seconds,
+            )
+            yield repo
+            repo.close()
+        else:
+            yield InMemoryTrainingJobRepository(
+                max_finished=settings.jobs_max_finished,
+                ttl_seconds=settings.jobs_finished_ttl_seconds,
+            )
+
+    @provide(scope=Scope.APP)
+    def provide_training_jobs(
+            self, settings: Settings, job_repo: ITrainingJobRepository, fit_use_case: FitModelUseCase
+    ) -> Iterator[TrainingJobsUseCase]:
+        """Создаёт сценарий фонового обучения и отменяет незавершённые задачи при закрытии контейнера."""
+        jobs = TrainingJobsUseCase(
+            fit_use_case=fit_use_case,
+            job_repo=job_repo,
+            max_running=settings.jobs_max_running or settings.training_max_workers,
+            max_queued=settings.jobs_max_queue_size,
+        )
+        yield jobs
+        jobs.shutdown()
+
+    @provide(scope=Scope.APP)
     def provide_strategy_factory(self) -> StrategyFactory:
-        """Предоставляет фабрику стратегий прогнозирования, сопоставляя имя стратегии с её реализацией."""
+        """
+        Предоставляет фабрику стратегий прогнозирования, сопоставляя имя стратегии с её реализацией.
+        Модуль стратегии импортируется при первом обращении к ней.
+        """
         return StrategyFactory({
-            "direct": DirectForecastStrategy(),
-            "multioutput": MultiOutputForecastStrategy(),
-            "recursive": RecursiveForecastStrategy()
+            "direct": LazyImport("src.infrastructure.strategies.direct:DirectForecastStrategy"),
+            "multioutput": LazyImport("src.infrastructure.strategies.multioutput:MultiOutputForecastStrategy"),
+            "recursive": LazyImport("src.infrastructure.strategies.recursive:RecursiveForecastStrategy"),
         })
 
-    @provide
+    @provide(scope=Scope.APP)
     def provide_metric_factory(self) -> MetricFactory:
-        """Предоставляет фабрику калькуляторов метрик, сопоставляя имя метрики с её реализацией."""
+        """
+        Предоставляет фабрику калькуляторов метрик, сопоставляя имя метрики с её реализацией.
+        Калькулятор создаётся при первом обращении к метрике.
+        """
         return MetricFactory({
-            "mae": MAECalculator(),
-            "rmse": RMSECalculator(),
-            "mse": MSECalculator(),
-            "mape": MAPECalculator(),
-            "smape": SMAPECalculator(),
-            "r2": R2Calculator(),
-            "max_error": MaxErrorCalculator(),
+            "mae": LazyImport("src.application.services.metrics:MAECalculator"),
+            "rmse": LazyImport("src.application.services.metrics:RMSECalculator"),
+            "mse": LazyImport("src.application.services.metrics:MSECalculator"),
+            "mape": LazyImport("src.application.services.metrics:MAPECalculator"),
+            "smape": LazyImport("src.application.services.metrics:SMAPECalculator"),
+            "r2": LazyImport("src.application.services.metrics:R2Calculator"),
+            "max_error": LazyImport("src.application.services.metrics:MaxErrorCalculator"),
         })
 
-    @provide
-    def provide_trainer(self) -> CatBoostTrainer:
-        """Предоставляет объект для обучения моделей CatBoost."""
-        return CatBoostTrainer()
+    @provide(scope=Scope.APP)
+    def provide_trainer(self, settings: Settings) -> CatBoostTrainer:
+        """Предоставляет объект для обучения моделей CatBoost с кэшем квантованных пулов из настроек."""
+        return CatBoostTrainer(pool_cache_max_bytes=settings.pool_cache_max_bytes)
 
-    @provide
-    def provide_repository(self) -> InMemoryModelRepository:
-        """Предоставляет репозиторий для сохранения и загрузки обученных моделей."""
-        return InMemoryModelRepository()
+    @provide(scope=Scope.APP)
+    def provide_serializer(self, settings: Settings) -> IModelSerializer:
+        """Предоставляет сериализатор моделей с форматом и сжатием из настроек."""
+        return CatBoostModelSerializer(
+            model_format=settings.model_format,
+            compression=settings.model_compression,
+        )
 
-    @provide
+    @provide(scope=Scope.APP)
+    def provide_repository(self, settings: Settings) -> Iterator[IModelRepository]:
+        """Предоставляет общий для приложения репозиторий для сохранения и загрузки обученных моделей."""
+        if settings.model_store == "disk":
+            repo = DiskModelRepository(settings.model_store_path)
+            yield repo
+            repo.close()
+        else:
+            yield InMemoryModelRepository(max_bytes=settings.model_store_max_bytes)
+
+    @provide(scope=Scope.APP)
     def provide_use_case(
             self,
             strategy_factory: StrategyFactory,
             trainer: CatBoostTrainer,
-            repo: InMemoryModelRepository,
+            repo: IModelRepository,
             metric_factory: MetricFactory,
+            serializer: IModelSerializer,
+            executor: ProcessPoolTrainingExecutor,
+            training_cache: ITrainingCache,
+            training_service: ModelTrainingService,
+            settings: Settings,
     ) -> FitModelUseCase:
-        """Создаёт и предоставляет сценарий использования для обучения модели."""
+        """
+        Создаёт и предоставляет сценарий использования для обучения модели. Сценарий
+        не хранит состояния запроса и общий для приложения: его использует и фоновое обучение.
+        """
         return FitModelUseCase(
             strategy_factory=strategy_factory,
             trainer=trainer,
             model_repo=repo,
-            metric_factory=metric_factory
+            metric_factory=metric_factory,
+            serializer=serializer,
+            executor=executor,
+            training_cache=training_cache if settings.training_cache_enabled else None,
+            training_service=training_service,
+        )
+
+    @provide(scope=Scope.APP)
+    def provide_training_service(
+            self,
+            strategy_factory: StrategyFactory,
+            trainer: CatBoostTrainer,
+            metric_factory: MetricFactory,
+            serializer: IModelSerializer,
+    ) -> ModelTrainingService:
+        """Предоставляет общий для приложения сервис обучения (его методы выполняются в пуле обучения)."""
+        return ModelTrainingService(strategy_factory, trainer, metric_factory, serializer)
+
+    @provide(scope=Scope.APP)
+    def provide_tuning_service(
+            self,
+            strategy_factory: StrategyFactory,
+            trainer: CatBoostTrainer,
+            metric_factory: MetricFactory,
+            serializer: IModelSerializer,
+    ) -> TuningService:
+        """Предоставляет общий для приложения сервис подбора гиперпараметров."""
+        return TuningService(strategy_factory, trainer, metric_factory, serializer)
+
+    @provide(scope=Scope.APP)
+    def provide_training_cache(self, settings: Settings) -> ITrainingCache:
+        """Предоставляет общий для приложения кэш результатов обучения."""
+        return TrainingResultCache(
+            max_bytes=settings.training_cache_max_bytes,
+            disk_path=settings.training_cache_path,
+            disk_max_bytes=settings.training_cache_disk_max_bytes,
+        )
+
+    @provide
+    def provide_batch_use_case(
+            self,
+            fit_use_case: FitModelUseCase,
+            training_service: ModelTrainingService,
+            executor: ProcessPoolTrainingExecutor,
+            settings: Settings,
+    ) -> BatchFitModelUseCase:
+        """Создаёт и предоставляет сценарий использования для пакетного обучения."""
+        return BatchFitModelUseCase(
+            fit_use_case=fit_use_case,
+            training_service=training_service,
+            executor=executor,
+            chunk_size=settings.batch_chunk_size,
+        )
+
+    @provide(scope=Scope.APP)
+    def provide_model_cache(self, settings: Settings) -> IModelCache:
+        """Предоставляет общий для приложения кэш десериализованных моделей."""
+        return InMemoryModelCache(
+            max_bytes=settings.model_cache_max_bytes,
+            ttl_seconds=settings.model_cache_ttl_seconds,
         )
+
+    @provide
+    def provide_manage_models_use_case(
+            self, repo: IModelRepository, cache: IModelCache
+    ) -> ManageModelsUseCase:
+        """Создаёт и предоставляет сценарий использования для управления сохранёнными моделями."""
+        return ManageModelsUseCase(model_repo=repo, model_cache=cache)
+
+    @provide
+    def provide_predict_use_case(
+            self,
+            strategy_factory: StrategyFactory,
+            repo: IModelRepository,
+            serializer: IModelSerializer,
+            cache: IModelCache,
+    ) -> PredictUseCase:
+        """Создаёт и предоставляет сценарий использования для прогноза сохранённой моделью."""
+        return PredictUseCase(
+            strategy_factory=strategy_factory,
+            model_repo=repo,
+            serializer=serializer,
+            model_cache=cache,
+        )
+
+    @provide
+    def provide_backtest_use_case(
+            self,
+            strategy_factory: StrategyFactory,
+            trainer: CatBoostTrainer,
+            metric_factory: MetricFactory,
+            executor: ProcessPoolTrainingExecutor,
+    ) -> BacktestModelUseCase:
+        """Создаёт и предоставляет сценарий использования для бэктеста модели."""
+        return BacktestModelUseCase(
+            strategy_factory=strategy_factory,
+            trainer=trainer,
+            metric_factory=metric_factory,
+            executor=executor,
+        )
+
+    @provide
+    def provide_tune_use_case(
+            self,
+            fit_use_case: FitModelUseCase,
+            tuning_service: TuningService,
+            executor: ProcessPoolTrainingExecutor,
+    ) -> TuneModelUseCase:
+        """Создаёт и предоставляет сценарий использования для подбора гиперпараметров."""
+        return TuneModelUseCase(fit_use_case=fit_use_case, tuning_service=tuning_service, executor=executor)
+
+    @provide
+    def provide_refit_use_case(
+            self,
+            fit_use_case: FitModelUseCase,
+            training_service: ModelTrainingService,
+            repo: IModelRepository,
+            executor: ProcessPoolTrainingExecutor,
+    ) -> RefitModelUseCase:
+        """Создаёт и предоставляет сценарий использования для дообучения сохранённой модели."""
+        return RefitModelUseCase(
+            fit_use_case=fit_use_case,
+            training_service=training_service,
+            model_repo=repo,
+            executor=executor,
+        )
+
+    @provide
+    def provide_panel_use_case(
+            self,
+            fit_use_case: FitModelUseCase,
+            training_service: ModelTrainingService,
+            executor: ProcessPoolTrainingExecutor,
+    ) -> FitPanelUseCase:
+        """Создаёт и предоставляет сценарий использования для обучения панельной модели."""
+        return FitPanelUseCase(fit_use_case=fit_use_case, training_service=training_service, executor=executor)
+
+    @provide(scope=Scope.APP)
+    def provide_service_metrics(
+            self,
+            executor: ProcessPoolTrainingExecutor,
+            jobs: TrainingJobsUseCase,
+            model_cache: IModelCache,
+            training_cache: ITrainingCache,
+    ) -> ServiceMetrics:
+        """Предоставляет метрики сервиса для /metrics, подключённые к пулу обучения и кэшам."""
+        metrics = ServiceMetrics()
+        metrics.watch_executor(executor)
+        metrics.watch_jobs(jobs)
+        metrics.watch_cache("tsf_model_cache", "Deserialized model cache", model_cache)
+        metrics.watch_cache("tsf_training_cache", "Training result cache", training_cache)
+        return metrics
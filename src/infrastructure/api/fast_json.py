@@ -0,0 +1,70 @@
+from typing import Any, Dict, Type, TypeVar
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, ValidationError
+import pydantic_core
+
+try:
+    import orjson
+except ImportError:  # необязательная зависимость: pip install '.[fast]'
+    orjson = None
+
+S = TypeVar("S", bound=BaseModel)
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Кодирует content в JSON одним проходом: orjson, если он установлен, иначе
+    сериализатор pydantic-core. Оба записывают NaN и бесконечности как null,
+    как и сериализация ответов pydantic.
+    """
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+    return pydantic_core.to_json(content, inf_nan_mode="null")
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON-ответ из готового словаря без схемы ответа.
+
+    Для ответов с моделью в model_base64 (мегабайты base64) FastAPI строит
+    схему, заново валидирует её по response_model и копирует строку ещё раз
+    при сериализации; эндпоинты обучения вместо этого отдают словарь,
+    собранный из DTO, и он кодируется один раз функцией dumps.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+async def parse_body(request: Request, schema: Type[S]) -> S:
+    """
+    Разбирает тело запроса сразу в schema (model_validate_json) без
+    промежуточного словаря json.loads, через который тело разбирает FastAPI.
+
+    Ошибки возвращаются так же, как при обычном разборе: 422 с локацией
+    ошибки от 'body'.
+    """
+    body = await request.body()
+    try:
+        return schema.model_validate_json(body)
+    except ValidationError as e:
+        errors = [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        raise RequestValidationError(errors, body=body)
+
+
+def json_body_openapi(schema: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    openapi_extra для эндпоинта, который читает тело через parse_body: описывает
+    тело схемой schema, как если бы она была параметром эндпоинта. Вложенные
+    схемы ссылаются на components — их туда добавляют другие эндпоинты.
+    """
+    body_schema = schema.model_json_schema(ref_template="#/components/schemas/{model}")
+    body_schema.pop("$defs", None)
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": body_schema}},
+        }
+    }
@@ -0,0 +1,51 @@
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from src.infrastructure.monitoring import ServiceMetrics
+
+
+class RequestMetricsMiddleware:
+    """
+    Считает запросы, ошибки и длительность обработки для /metrics.
+
+    В метку path попадает шаблон маршрута (/models/{model_id}), а не сам путь,
+    чтобы число рядов метрик не росло с числом моделей.
+
+    ASGI-middleware без обёрток запроса и ответа: сообщения проходят к клиенту
+    как есть, а длительность измеряется до отправки последней части тела
+    (http.response.body без more_body), поэтому для потоковых ответов
+    (/fit/batch, /models/{model_id}/blob) учитывается вся передача.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+        observed = False
+
+        async def observe() -> None:
+            nonlocal observed
+            observed = True
+            path = getattr(scope.get("route"), "path", "unmatched")
+            metrics = await scope["app"].state.dishka_container.get(ServiceMetrics)
+            metrics.observe_request(scope["method"], path, status, time.perf_counter() - start)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                await observe()
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # Ошибка обработчика или обрыв соединения до конца тела ответа
+            if not observed:
+                await observe()
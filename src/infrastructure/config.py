@@ -0,0 +1,73 @@
+import os
+from typing import Optional
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """
+    Настройки сервиса. Значения читаются из переменных окружения с префиксом TSF_
+    (например, TSF_TRAINING_MAX_WORKERS=4).
+    """
+    model_config = SettingsConfigDict(env_prefix="TSF_")
+
+    # Число процессов пула обучения
+    training_max_workers: int = Field(default_factory=lambda: os.cpu_count() or 1, ge=1)
+    # Сколько задач может ждать свободного процесса сверх выполняющихся
+    training_max_queue_size: int = Field(default=16, ge=0)
+    # Способ запуска процессов: forkserver, spawn или fork
+    training_mp_context: str = Field(default="forkserver", pattern="^(forkserver|spawn|fork)$")
+    # Импортировать CatBoost и стратегии в рабочих процессах обучения заранее: при forkserver —
+    # один раз в процессе-сервере, от которого порождаются рабочие, иначе — при старте каждого рабочего
+    training_preload: bool = True
+    # Передача крупных массивов в пул обучения: shm (multiprocessing.shared_memory),
+    # mmap (файлы .npy в shared_memory_path) или none (pickle)
+    shared_memory: str = Field(default="shm", pattern="^(shm|mmap|none)$")
+    # Рабочий каталог для shared_memory=mmap (не задан — временный каталог системы)
+    shared_memory_path: Optional[str] = None
+    # Массивы меньшего размера передаются через pickle
+    shared_memory_min_bytes: int = Field(default=1024 ** 2, ge=0)
+    # Ядра и память, которые планировщик пула распределяет между задачами обучения
+    # (не заданы — доступные процессу ядра и 80% физической памяти)
+    scheduler_cpus: Optional[int] = Field(default=None, ge=1)
+    scheduler_memory_bytes: Optional[int] = Field(default=None, ge=1)
+    # За это время ожидания оценка задачи в очереди уменьшается вдвое, чтобы длинные задачи не голодали
+    scheduler_aging_seconds: float = Field(default=30.0, gt=0)
+
+    # Хранилище фоновых задач обучения: memory или sqlite
+    job_store: str = Field(default="memory", pattern="^(memory|sqlite)$")
+    # Путь к файлу базы данных для job_store=sqlite
+    job_store_path: str = "training_jobs.sqlite3"
+    # Сколько фоновых задач обучаются одновременно (по умолчанию — training_max_workers)
+    jobs_max_running: Optional[int] = Field(default=None, ge=1)
+    # Сколько фоновых задач может ждать запуска
+    jobs_max_queue_size: int = Field(default=1000, ge=0)
+    # Сколько завершённых фоновых задач и сколько секунд хранит job_store=memory
+    jobs_max_finished: int = Field(default=1000, ge=1)
+    jobs_finished_ttl_seconds: Optional[float] = Field(default=24 * 3600, gt=0)
+    # Сколько рядов пакетного запроса обучается одной задачей пула
+    batch_chunk_size: int = Field(default=8, ge=1)
+    # Хранилище моделей: memory (LRU в памяти процесса) или disk
+    model_store: str = Field(default="memory", pattern="^(memory|disk)$")
+    # Каталог хранилища для model_store=disk
+    model_store_path: str = "models"
+    # Ограничение суммарного размера моделей в памяти для model_store=memory
+    model_store_max_bytes: int = Field(default=1024 ** 3, ge=1)
+    # Кэш десериализованных моделей для /predict: предельный размер и время жизни без обращений
+    model_cache_max_bytes: int = Field(default=512 * 1024 ** 2, ge=1)
+    model_cache_ttl_seconds: float = Field(default=3600.0, gt=0)
+    # Формат сохранения моделей (cbm — нативный формат CatBoost, pickle) и сжатие (none, zstd, lz4)
+    model_format: str = Field(default="cbm", pattern="^(cbm|pickle)$")
+    model_compression: str = Field(default="none", pattern="^(none|zstd|lz4)$")
+    # Кэш результатов обучения: повторный /fit с теми же данными и параметрами не обучает модель заново
+    training_cache_enabled: bool = True
+    # Ограничение суммарного размера записей кэша обучения в памяти
+    training_cache_max_bytes: int = Field(default=256 * 1024 ** 2, ge=0)
+    # Каталог дискового уровня кэша обучения (не задан — только память) и его предельный размер
+    training_cache_path: Optional[str] = None
+    training_cache_disk_max_bytes: int = Field(default=4 * 1024 ** 3, ge=0)
+    # Кэш квантованных catboost.Pool в каждом процессе обучения (0 — квантовать при каждом обучении)
+    pool_cache_max_bytes: int = Field(default=256 * 1024 ** 2, ge=0)
+    # Загрузить CatBoost, стратегии и метрики при импорте приложения, а не при первом обучении,
+    # чтобы рабочие процессы gunicorn --preload получали их от мастера после fork (copy-on-write)
+    preload: bool = False
@@ -0,0 +1,11 @@
+from .process_pool import ProcessPoolTrainingExecutor
+from .scheduler import TrainingScheduler, ScheduledTask
+from .shared_arrays import SharedArrayStore, SharedArrayHandle
+
+__all__ = [
+    "ProcessPoolTrainingExecutor",
+    "TrainingScheduler",
+    "ScheduledTask",
+    "SharedArrayStore",
+    "SharedArrayHandle",
+]
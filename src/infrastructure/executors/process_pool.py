@@ -0,0 +1,203 @@
+import asyncio
+import logging
+import multiprocessing
+import threading
+from contextlib import nullcontext
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, ContextManager, Dict, Optional, Sequence, TypeVar
+import numpy as np
+from src.domain import TrainingCost
+from src.domain.interfaces import ITrainingExecutor
+from src.domain.exceptions import TrainingQueueFullError
+from src.infrastructure.executors.scheduler import ScheduledTask, TrainingScheduler, physical_memory
+from src.infrastructure.executors.shared_arrays import SharedArrayStore, run_with_shared_arrays
+from src.infrastructure.ml.threads import available_cpus, run_with_thread_budget
+from src.infrastructure.startup import preload_worker
+
+T = TypeVar("T")
+logger = logging.getLogger(__name__)
+
+# Доля физической памяти, которую по умолчанию могут занимать задачи обучения
+DEFAULT_MEMORY_FRACTION = 0.8
+
+
+class ProcessPoolTrainingExecutor(ITrainingExecutor):
+    """
+    Реализация ITrainingExecutor на пуле процессов с ограниченной очередью.
+
+    Одновременно принимается не более max_workers + max_queue_size задач
+    (выполняющиеся и ожидающие). Сверх этого submit сразу бросает
+    TrainingQueueFullError, чтобы вызывающая сторона могла вернуть клиенту
+    отказ вместо неограниченного накопления работы.
+
+    Принятые задачи ждут запуска в TrainingScheduler, а не в очереди пула
+    процессов: планировщик запускает задачу, когда позволяют ядра и память,
+    выбирает из ожидающих самую короткую по оценке cost и выделяет ей
+    thread_count, который CatBoostTrainer применяет в рабочем процессе.
+
+    Если передан shared_arrays, крупные массивы аргументов задач (матрицы
+    признаков, колонки ряда) не сериализуются, а передаются в рабочие процессы
+    через разделяемую память (SharedArrayStore); блоки освобождаются по
+    завершении задач.
+
+    Модули preload_modules (CatBoost, стратегии) импортируются в рабочих
+    процессах до первой задачи: при forkserver — один раз в процессе-сервере,
+    так что рабочие процессы получают их готовыми при fork, при spawn и fork —
+    инициализатором каждого рабочего процесса.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_queue_size: int,
+        mp_context: str = "forkserver",
+        shared_arrays: Optional[SharedArrayStore] = None,
+        cpus: Optional[int] = None,
+        memory_bytes: Optional[int] = None,
+        aging_seconds: float = 30.0,
+        preload_modules: Sequence[str] = (),
+    ):
+        """
+        Параметры
+        ----------
+        max_workers : int
+            Число рабочих процессов.
+        max_queue_size : int
+            Максимальное число задач, ожидающих запуска.
+        mp_context : str
+            Способ запуска процессов (forkserver, spawn или fork).
+        shared_arrays : Optional[SharedArrayStore]
+            Хранилище разделяемых массивов; без него аргументы передаются через pickle.
+        cpus : Optional[int]
+            Число ядер, распределяемое между задачами (по умолчанию — доступные процессу).
+        memory_bytes : Optional[int]
+            Память для выполняющихся задач (по умолчанию — 80% физической памяти).
+        aging_seconds : float
+            За это время ожидания оценка задачи в очереди уменьшается вдвое.
+        preload_modules : Sequence[str]
+            Модули, импортируемые в рабочих процессах заранее.
+        """
+        self.max_workers = max_workers
+        self.max_queue_size = max_queue_size
+        self.shared_arrays = shared_arrays
+        if memory_bytes is None:
+            total = physical_memory()
+            memory_bytes = int(total * DEFAULT_MEMORY_FRACTION) if total else None
+        self.scheduler = TrainingScheduler(
+            cpus=cpus or available_cpus(),
+            memory_bytes=memory_bytes,
+            max_running=max_workers,
+            aging_seconds=aging_seconds,
+        )
+        self._mp_context = multiprocessing.get_context(mp_context)
+        self._initializer, self._initargs = None, ()
+        if preload_modules and mp_context == "forkserver":
+            self._mp_context.set_forkserver_preload(list(preload_modules))
+        elif preload_modules:
+            self._initializer, self._initargs = preload_worker, (tuple(preload_modules),)
+        # Повторно входимая: завершение задачи внутри _dispatch снова вызывает _dispatch
+        self._lock = threading.RLock()
+        self._pending = 0
+        self._pool = self._create_pool()
+
+    def _create_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=self._mp_context,
+            initializer=self._initializer,
+            initargs=self._initargs,
+        )
+
+    @property
+    def pending(self) -> int:
+        """Число принятых, но ещё не завершённых задач."""
+        return self._pending
+
+    def submit(self, fn: Callable[..., T], *args: Any, cost: Optional[TrainingCost] = None) -> "Future[T]":
+        with self._lock:
+            if self._pending >= self.max_workers + self.max_queue_size:
+                raise TrainingQueueFullError(
+                    f"Training queue is full ({self._pending} tasks in progress)"
+                )
+            task = self.scheduler.create(fn, args, cost)
+            if self.shared_arrays is not None:
+                task.args, handles = self.shared_arrays.pack(args)
+                if handles:
+                    task.fn, task.args = run_with_shared_arrays, (fn, *task.args)
+                    task.release = lambda: self.shared_arrays.release(handles)
+            self._pending += 1
+            self.scheduler.enqueue(task)
+        task.future.add_done_callback(lambda _: self._on_done(task))
+        self._dispatch()
+        return task.future
+
+    def _dispatch(self) -> None:
+        """Запускает в пуле процессов все задачи, которые позволяет бюджет планировщика."""
+        with self._lock:
+            while (task := self.scheduler.next_ready()) is not None:
+                if not task.future.set_running_or_notify_cancel():
+                    # Задача отменена, пока ждала запуска; _on_done уже вызван
+                    self.scheduler.finish(task)
+                    continue
+                try:
+                    inner = self._submit(run_with_thread_budget, task.threads, task.fn, *task.args)
+                except BaseException as e:
+                    task.future.set_exception(e)
+                    continue
+                inner.add_done_callback(lambda f, task=task: self._complete(task, f))
+
+    def _submit(self, fn: Callable[..., T], *args: Any) -> "Future[T]":
+        try:
+            return self._pool.submit(fn, *args)
+        except BrokenProcessPool:
+            # Рабочий процесс аварийно завершился (например, по OOM) — пересоздаём пул
+            logger.warning("Training process pool is broken, recreating it")
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = self._create_pool()
+            return self._pool.submit(fn, *args)
+
+    @staticmethod
+    def _complete(task: ScheduledTask, inner: Future) -> None:
+        """Переносит результат задачи пула процессов в Future, выданный submit."""
+        if inner.cancelled():
+            task.future.set_exception(CancelledError("Training pool was shut down"))
+        elif inner.exception() is not None:
+            task.future.set_exception(inner.exception())
+        else:
+            task.future.set_result(inner.result())
+
+    def _on_done(self, task: ScheduledTask) -> None:
+        with self._lock:
+            self._pending -= 1
+            self.scheduler.finish(task)
+        if task.release is not None:
+            task.release()
+        self._dispatch()
+
+    async def run(self, fn: Callable[..., T], *args: Any, cost: Optional[TrainingCost] = None) -> T:
+        return await asyncio.wrap_future(self.submit(fn, *args, cost=cost))
+
+    def allocation(self) -> Dict[str, Any]:
+        """Текущее распределение ядер и памяти между задачами (см. TrainingScheduler.snapshot)."""
+        with self._lock:
+            return self.scheduler.snapshot()
+
+    def shared(self, *arrays: np.ndarray) -> ContextManager[None]:
+        """
+        Удерживает массивы в разделяемой памяти на время блока with, чтобы задачи,
+        отправляемые несколькими волнами, использовали одни и те же блоки.
+        """
+        if self.shared_arrays is None:
+            return nullcontext()
+        return self.shared_arrays.retained(*arrays)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Останавливает пул, отменяя задачи, которые ещё не начали выполняться."""
+        with self._lock:
+            queued = self.scheduler.drain()
+        for task in queued:
+            task.future.cancel()
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+        if self.shared_arrays is not None:
+            self.shared_arrays.close()
@@ -0,0 +1,170 @@
+import itertools
+import os
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from src.domain import TrainingCost
+
+# Оценка памяти на значение обучающей матрицы: float32 в задаче, копия в Pool
+# CatBoost, квантованные признаки и рабочие буферы обучения
+BYTES_PER_VALUE = 16
+
+
+def physical_memory() -> Optional[int]:
+    """Объём физической памяти машины в байтах или None, если его не удаётся определить."""
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+@dataclass
+class ScheduledTask:
+    """Задача пула обучения вместе с оценкой ресурсов и выделенным бюджетом."""
+    task_id: int
+    fn: Callable[..., Any]
+    args: Tuple[Any, ...]
+    future: Future
+    cost: Optional[TrainingCost]
+    memory_bytes: int
+    submitted_at: float = field(default_factory=time.monotonic)
+    started_at: Optional[float] = None
+    threads: int = 0
+    release: Optional[Callable[[], None]] = None  # освобождение ресурсов задачи (разделяемых массивов)
+
+    @property
+    def work(self) -> int:
+        return self.cost.work if self.cost is not None else 0
+
+
+class TrainingScheduler:
+    """
+    Планировщик задач пула обучения с учётом ядер и памяти машины.
+
+    Задача запускается, когда есть свободный рабочий процесс, хотя бы одно
+    свободное ядро и память под оценку задачи (rows × features × BYTES_PER_VALUE);
+    если ничего не выполняется, задача запускается в любом случае, чтобы крупная
+    задача не ждала вечно. Из ожидающих первой запускается задача с наименьшим
+    объёмом работы (строки × признаки × итерации); чтобы длинные задачи не
+    голодали, оценка ожидающей задачи уменьшается вдвое за каждые aging_seconds
+    ожидания. Задачи без оценки считаются короткими.
+
+    Запущенной задаче выделяется thread_count по текущей загрузке: свободные
+    ядра делятся поровну между ней и ожидающими задачами, которые могут
+    запуститься в свободных рабочих процессах вместе с ней (не меньше одного
+    ядра и не больше thread_count клиента, если он задан). Единственная задача
+    на простаивающей машине получает все ядра.
+
+    Не потокобезопасен: вызывающая сторона держит блокировку.
+    """
+
+    def __init__(
+        self,
+        cpus: int,
+        memory_bytes: Optional[int],
+        max_running: int,
+        aging_seconds: float = 30.0,
+    ):
+        """
+        Параметры
+        ----------
+        cpus : int
+            Число ядер, которое распределяется между задачами.
+        memory_bytes : Optional[int]
+            Память, которую могут занимать выполняющиеся задачи (None — без ограничения).
+        max_running : int
+            Число рабочих процессов пула.
+        aging_seconds : float
+            За это время ожидания оценка задачи уменьшается вдвое.
+        """
+        self.cpus = cpus
+        self.memory_bytes = memory_bytes
+        self.max_running = max_running
+        self.aging_seconds = aging_seconds
+        self._ids = itertools.count(1)
+        self._queued: List[ScheduledTask] = []
+        self._running: Dict[int, ScheduledTask] = {}
+        self.allocated_threads = 0
+        self.allocated_memory = 0
+
+    def create(
+        self, fn: Callable[..., Any], args: Tuple[Any, ...], cost: Optional[TrainingCost]
+    ) -> ScheduledTask:
+        memory = cost.rows * cost.features * BYTES_PER_VALUE if cost is not None else 0
+        return ScheduledTask(next(self._ids), fn, args, Future(), cost, memory)
+
+    def enqueue(self, task: ScheduledTask) -> None:
+        self._queued.append(task)
+
+    def next_ready(self) -> Optional[ScheduledTask]:
+        """Выбирает следующую задачу, которую позволяет запустить бюджет, и выделяет ей ресурсы."""
+        if not self._queued or len(self._running) >= self.max_running:
+            return None
+        free_threads = self.cpus - self.allocated_threads
+        if self._running and free_threads < 1:
+            return None
+
+        now = time.monotonic()
+        task = min(
+            self._queued,
+            key=lambda t: (t.work * 0.5 ** ((now - t.submitted_at) / self.aging_seconds), t.task_id),
+        )
+        if (
+            self._running
+            and self.memory_bytes is not None
+            and self.allocated_memory + task.memory_bytes > self.memory_bytes
+        ):
+            return None
+
+        # Ожидающие задачи, которые займут остальные свободные рабочие процессы
+        startable = min(len(self._queued), self.max_running - len(self._running))
+        threads = max(free_threads // max(startable, 1), 1)
+        if task.cost is not None and task.cost.threads is not None:
+            threads = min(threads, task.cost.threads)
+
+        self._queued.remove(task)
+        task.threads, task.started_at = threads, now
+        self._running[task.task_id] = task
+        self.allocated_threads += threads
+        self.allocated_memory += task.memory_bytes
+        return task
+
+    def finish(self, task: ScheduledTask) -> None:
+        """Освобождает ресурсы завершённой задачи или убирает отменённую из очереди."""
+        if self._running.pop(task.task_id, None) is not None:
+            self.allocated_threads -= task.threads
+            self.allocated_memory -= task.memory_bytes
+        elif task in self._queued:
+            self._queued.remove(task)
+
+    def drain(self) -> List[ScheduledTask]:
+        """Убирает из очереди и возвращает все ожидающие задачи."""
+        queued, self._queued = self._queued, []
+        return queued
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Текущее распределение ресурсов: бюджет, выполняющиеся и ожидающие задачи."""
+        now = time.monotonic()
+
+        def describe(task: ScheduledTask) -> Dict[str, Any]:
+            return {
+                "task_id": task.task_id,
+                "rows": task.cost.rows if task.cost else None,
+                "features": task.cost.features if task.cost else None,
+                "work": task.cost.work if task.cost else None,
+                "memory_bytes": task.memory_bytes,
+                "threads": task.threads or None,
+                "waiting_seconds": (task.started_at or now) - task.submitted_at,
+                "running_seconds": now - task.started_at if task.started_at is not None else None,
+            }
+
+        return {
+            "cpus": self.cpus,
+            "memory_bytes": self.memory_bytes,
+            "max_running": self.max_running,
+            "allocated_threads": self.allocated_threads,
+            "allocated_memory_bytes": self.allocated_memory,
+            "running": [describe(task) for task in self._running.values()],
+            "queued": [describe(task) for task in sorted(self._queued, key=lambda t: t.task_id)],
+        }
@@ -0,0 +1,274 @@
+import copy
+import dataclasses
+import os
+import tempfile
+import threading
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+import numpy as np
+from src.domain import TimeSeries
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SharedArrayHandle:
+    """
+    Ссылка на массив в разделяемом блоке, которая передаётся в рабочий процесс вместо массива.
+
+    Блок хранит C-непрерывный базовый массив; ссылка описывает представление
+    (view) этого блока, поэтому срезы одной матрицы разделяют один блок.
+    """
+    backend: str  # 'shm' — multiprocessing.shared_memory, 'mmap' — файл .npy в рабочем каталоге
+    name: str  # имя блока shared_memory или путь к файлу .npy
+    dtype: str
+    shape: Tuple[int, ...]
+    strides: Tuple[int, ...]
+    offset: int  # смещение первого элемента от начала данных блока, байт
+
+
+class _Block:
+    """Разделяемый блок с копией базового массива и счётчиком ссылок."""
+    __slots__ = ("base", "name", "segment", "refs", "nbytes")
+
+    def __init__(self, base: np.ndarray, name: str, segment: Optional[shared_memory.SharedMemory]):
+        self.base = base
+        self.name = name
+        self.segment = segment
+        self.refs = 0
+        self.nbytes = base.nbytes
+
+
+class SharedArrayStore:
+    """
+    Плоскость данных пула обучения: крупные numpy-массивы аргументов задач
+    копируются один раз в разделяемую память (multiprocessing.shared_memory)
+    или в отображаемые в память файлы .npy, а в рабочий процесс передаются
+    только SharedArrayHandle.
+
+    Блок создаётся для базового массива (массива, владеющего памятью), поэтому
+    одновременные задачи над одной матрицей или её срезами — попытки подбора,
+    фолды бэктеста — используют один блок без копий. Счётчик ссылок блока
+    увеличивается pack и retained и уменьшается release; блок удаляется, когда
+    ссылок не остаётся.
+
+    Массивы меньше min_bytes и массивы объектов передаются как обычно, через pickle.
+    """
+
+    BACKENDS = ("shm", "mmap")
+
+    def __init__(self, backend: str = "shm", min_bytes: int = 1024 ** 2, directory: Optional[str] = None):
+        """
+        Параметры
+        ----------
+        backend : str
+            'shm' — блоки multiprocessing.shared_memory, 'mmap' — файлы .npy в directory.
+        min_bytes : int
+            Массивы меньшего размера не выносятся в разделяемую память.
+        directory : Optional[str]
+            Рабочий каталог для backend='mmap' (по умолчанию — временный каталог системы).
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown shared memory backend: {backend}")
+        self.backend = backend
+        self.min_bytes = min_bytes
+        self.directory = directory or tempfile.gettempdir()
+        if backend == "mmap":
+            os.makedirs(self.directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._blocks: Dict[int, _Block] = {}  # id(базового массива) -> блок
+        self._names: Dict[str, _Block] = {}
+
+    @property
+    def blocks(self) -> int:
+        """Число живых разделяемых блоков."""
+        return len(self._names)
+
+    @property
+    def nbytes(self) -> int:
+        """Суммарный размер живых разделяемых блоков, байт."""
+        return sum(block.nbytes for block in list(self._names.values()))
+
+    def share(self, array: np.ndarray) -> Optional[SharedArrayHandle]:
+        """
+        Возвращает ссылку на array в разделяемом блоке, увеличивая счётчик ссылок блока,
+        или None, если массив передаётся обычным способом. Каждая ссылка освобождается release.
+        """
+        if array.nbytes < self.min_bytes or array.dtype.hasobject:
+            return None
+        base = array
+        while isinstance(base.base, np.ndarray):
+            base = base.base
+        with self._lock:
+            block = self._blocks.get(id(base))
+            if block is None or block.base is not base:
+                # Небольшой срез не выносим вместе со всей матрицей, а копируем отдельно
+                if not base.flags.c_contiguous or base.nbytes > 2 * array.nbytes:
+                    base = array = np.ascontiguousarray(array)
+                block = self._create(base)
+                self._blocks[id(base)] = block
+                self._names[block.name] = block
+            block.refs += 1
+        return SharedArrayHandle(
+            backend=self.backend,
+            name=block.name,
+            dtype=array.dtype.str,
+            shape=array.shape,
+            strides=array.strides,
+            offset=array.ctypes.data - block.base.ctypes.data,
+        )
+
+    def _create(self, base: np.ndarray) -> _Block:
+        if self.backend == "shm":
+            segment = shared_memory.SharedMemory(create=True, size=max(base.nbytes, 1))
+            np.ndarray(base.shape, base.dtype, buffer=segment.buf)[...] = base
+            return _Block(base, segment.name, segment)
+        path = os.path.join(self.directory, f"tsf-{os.getpid()}-{uuid.uuid4().hex}.npy")
+        mapped = np.lib.format.open_memmap(path, mode="w+", dtype=base.dtype, shape=base.shape)
+        mapped[...] = base
+        mapped.flush()
+        del mapped
+        return _Block(base, path, None)
+
+    def release(self, handles: List[SharedArrayHandle]) -> None:
+        """Уменьшает счётчики ссылок блоков и удаляет блоки, на которые не осталось ссылок."""
+        with self._lock:
+            freed = []
+            for handle in handles:
+                block = self._names.get(handle.name)
+                if block is None:
+                    continue
+                block.refs -= 1
+                if block.refs <= 0:
+                    del self._names[block.name]
+                    del self._blocks[id(block.base)]
+                    freed.append(block)
+        for block in freed:
+            self._destroy(block)
+
+    @staticmethod
+    def _destroy(block: _Block) -> None:
+        if block.segment is not None:
+            block.segment.close()
+            block.segment.unlink()
+            return
+        try:
+            os.remove(block.name)
+        except FileNotFoundError:
+            pass
+
+    def pack(self, value: Any) -> Tuple[Any, List[SharedArrayHandle]]:
+        """
+        Заменяет крупные массивы в value ссылками SharedArrayHandle.
+
+        Просматриваются массивы, кортежи, списки, значения словарей, поля
+        dataclass-объектов (DTO) и колонки TimeSeries; объекты копируются
+        поверхностно, исходные значения не меняются.
+
+        Возвращает
+        -------
+        Tuple[Any, List[SharedArrayHandle]]
+            Значение для передачи в рабочий процесс и созданные ссылки — их нужно
+            освободить release после завершения задачи.
+        """
+        handles: List[SharedArrayHandle] = []
+        try:
+            return self._pack(value, handles), handles
+        except BaseException:
+            self.release(handles)
+            raise
+
+    def _pack(self, value: Any, handles: List[SharedArrayHandle]) -> Any:
+        if isinstance(value, np.ndarray):
+            handle = self.share(value)
+            if handle is None:
+                return value
+            handles.append(handle)
+            return handle
+        return _map_arrays(value, lambda item: self._pack(item, handles))
+
+    @contextmanager
+    def retained(self, *arrays: np.ndarray) -> Iterator[None]:
+        """
+        Удерживает блоки массивов на время блока with, чтобы задачи, отправляемые
+        несколькими волнами (например, раунды подбора), не копировали их заново.
+        """
+        handles = [handle for handle in (self.share(array) for array in arrays) if handle is not None]
+        try:
+            yield
+        finally:
+            self.release(handles)
+
+    def close(self) -> None:
+        """Удаляет все оставшиеся блоки."""
+        with self._lock:
+            blocks = list(self._names.values())
+            self._names.clear()
+            self._blocks.clear()
+        for block in blocks:
+            self._destroy(block)
+
+
+def _map_arrays(value: Any, fn: Callable[[Any], Any]) -> Any:
+    """Применяет fn к элементам контейнеров и полям объектов, которые могут содержать массивы."""
+    if isinstance(value, tuple):
+        return tuple(fn(item) for item in value)
+    if isinstance(value, list):
+        return [fn(item) for item in value]
+    if isinstance(value, dict):
+        return {key: fn(item) for key, item in value.items()}
+    if isinstance(value, TimeSeries) or (dataclasses.is_dataclass(value) and not isinstance(value, type)):
+        # Копия без вызова __init__: данные уже прошли валидацию
+        result = copy.copy(value)
+        for name, item in vars(value).items():
+            mapped = fn(item)
+            if mapped is not item:
+                object.__setattr__(result, name, mapped)
+        return result
+    return value
+
+
+def _unpack(value: Any, attached: Dict[str, Any]) -> Any:
+    if isinstance(value, SharedArrayHandle):
+        buffer = attached.get(value.name)
+        if buffer is None:
+            if value.backend == "shm":
+                segment = shared_memory.SharedMemory(name=value.name)
+                attached[value.name] = segment
+                buffer = segment.buf
+            else:
+                buffer = attached[value.name] = np.load(value.name, mmap_mode="r")
+        if isinstance(buffer, shared_memory.SharedMemory):
+            buffer = buffer.buf
+        array = np.ndarray(
+            value.shape, np.dtype(value.dtype), buffer=buffer, offset=value.offset, strides=value.strides
+        )
+        # Блок могут читать одновременно несколько задач
+        array.flags.writeable = False
+        return array
+    return _map_arrays(value, lambda item: _unpack(item, attached))
+
+
+def run_with_shared_arrays(fn: Callable[..., T], *args: Any) -> T:
+    """
+    Выполняется в рабочем процессе: подставляет массивы вместо SharedArrayHandle
+    (только для чтения, без копирования), вызывает fn и отсоединяется от блоков.
+    """
+    attached: Dict[str, Any] = {}
+    try:
+        resolved = _unpack(args, attached)
+        try:
+            return fn(*resolved)
+        finally:
+            del resolved
+    finally:
+        for segment in attached.values():
+            if isinstance(segment, shared_memory.SharedMemory):
+                try:
+                    segment.close()
+                except BufferError:
+                    # На массивы блока ещё есть ссылки; отображение освободит сборщик мусора
+                    pass
@@ -1,3 +1,17 @@
 from .catboost_trainer import CatBoostTrainer
+from .features import panel_features
+from .model_cache import InMemoryModelCache
+from .serializers import CatBoostModelSerializer
+from .training_cache import TrainingResultCache
+from .per_step_model import PerStepModel
+from .pool_cache import QuantizedPoolCache
 
-__all__ = ["CatBoostTrainer"]
\ No newline at end of file
+__all__ = [
+    "CatBoostTrainer",
+    "InMemoryModelCache",
+    "CatBoostModelSerializer",
+    "TrainingResultCache",
+    "PerStepModel",
+    "QuantizedPoolCache",
+    "panel_features",
+]
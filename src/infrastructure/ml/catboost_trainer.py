@@ -1,14 +1,61 @@
-from catboost import CatBoostRegressor
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
 import numpy as np
 from src.domain.interfaces import ITrainer
+from src.infrastructure.ml.features import panel_features
+from src.infrastructure.ml.per_step_model import PerStepModel
+from src.infrastructure.ml.pool_cache import process_pool_cache
+from src.infrastructure.ml.threads import available_cpus, apply_thread_budget
+
+if TYPE_CHECKING:
+    from catboost import CatBoostRegressor
+
+
+def is_multi_target_loss(params: Dict[str, Any]) -> bool:
+    """Обучает ли функция потерь из params одну модель сразу на несколько целей (MultiRMSE и т. п.)."""
+    return str(params.get("loss_function", "RMSE")).startswith("Multi")
 
 
 class CatBoostTrainer(ITrainer):
     """
     Реализация ITrainer для обучения моделей CatBoost.
     Оборачивает вызов CatBoostRegressor с заданными параметрами.
+
+    Если цель двумерная, а функция потерь одномерная (не Multi*), обучается
+    отдельная модель на каждый столбец цели (PerStepModel). Модели обучаются
+    одновременно в потоках: CatBoost отпускает GIL на время обучения, а
+    thread_count делится между ними так, чтобы в сумме не превышать заданное
+    (или число доступных ядер). Если задача выполняется в пуле обучения,
+    thread_count ограничивается числом потоков, которое ей выделил планировщик пула.
+
+    Если pool_cache_max_bytes > 0, обучающие данные передаются в CatBoost
+    квантованными пулами из кэша процесса (QuantizedPoolCache): повторное
+    обучение на тех же данных с теми же параметрами квантования не вычисляет
+    границы признаков заново. Дообучение (init_model) идёт мимо кэша: данные
+    квантуются границами исходной модели.
+
+    CatBoost импортируется при первом обучении, а не при импорте модуля: сервис
+    и его рабочие процессы стартуют без загрузки CatBoost (и pandas, который
+    импортирует CatBoost), пока не понадобится обучение или прогноз.
     """
-    def train(self, x: np.ndarray, y: np.ndarray, params: dict) -> CatBoostRegressor:
+    def __init__(self, pool_cache_max_bytes: int = 0):
+        """
+        Параметры
+        ----------
+        pool_cache_max_bytes : int
+            Ограничение размера кэша квантованных пулов в каждом процессе; 0 — без кэша.
+        """
+        self.pool_cache_max_bytes = pool_cache_max_bytes
+
+    def train(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        params: dict,
+        eval_set: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+        init_model: Optional[Union["CatBoostRegressor", PerStepModel]] = None,
+        categories: Optional[np.ndarray] = None,
+    ) -> Union["CatBoostRegressor", PerStepModel]:
         """
         Обучает модель CatBoost на предоставленных данных.
 
@@ -18,26 +65,96 @@ class CatBoostTrainer(ITrainer):
             Матрица признаков формы (n_samples, n_features).
         y : np.ndarray
             Целевая переменная. Может быть одномерной (n_samples,)
-            или двумерной (n_samples, n_targets) для multi‑target регрессии.
+            или двумерной (n_samples, n_targets): с функцией потерь Multi*
+            обучается одна multi‑target модель, иначе — модель на каждый столбец.
         params : dict
             Словарь параметров для CatBoostRegressor (например, iterations, depth, learning_rate).
             Должен соответствовать документации CatBoost.
+        eval_set : Optional[Tuple[np.ndarray, np.ndarray]]
+            Валидационная выборка (x_val, y_val). С ней работают параметры
+            early_stopping_rounds и use_best_model (по умолчанию включён).
+        init_model : Optional[Union[CatBoostRegressor, PerStepModel]]
+            Ранее обученная модель с тем же набором признаков: обучение продолжается
+            от её предсказаний, params['iterations'] задаёт число добавляемых деревьев.
+        categories : Optional[np.ndarray]
+            Строковый категориальный признак каждой строки x (идентификатор ряда
+            панельной модели); передаётся в CatBoost через panel_features.
 
         Возвращает
         -------
-        CatBoostRegressor
-            Обученная модель CatBoost.
+        Union[CatBoostRegressor, PerStepModel]
+            Обученная модель CatBoost или набор моделей по столбцам цели.
 
         Исключения
         ----------
+        ValueError
+            Если init_model — одна multi‑target модель, а обучение идёт по столбцам цели.
         Exception
             Перехватывает и логирует ошибки обучения, после чего пробрасывает исключение дальше.
         """
+        from catboost import CatBoostRegressor, Pool
+
+        params = apply_thread_budget(params)
+        if y.ndim == 2 and not is_multi_target_loss(params):
+            return self._train_per_step(x, y, params, eval_set, init_model, categories)
         try:
             model = CatBoostRegressor(**params, allow_writing_files=False)
-            model.fit(x, y, verbose=False)
+            data = None if categories is None else panel_features(x, categories)
+            # При дообучении CatBoost квантует данные границами init_model, поэтому кэш не используется
+            if self.pool_cache_max_bytes > 0 and init_model is None:
+                pool = process_pool_cache(self.pool_cache_max_bytes).get_or_build(x, y, params, data)
+                model.fit(pool, eval_set=eval_set, init_model=init_model, verbose=False)
+            elif data is None:
+                model.fit(x, y, eval_set=eval_set, init_model=init_model, verbose=False)
+            else:
+                model.fit(Pool(data, label=y), eval_set=eval_set, init_model=init_model, verbose=False)
             return model
         except Exception as e:
             print(f"CatBoost training error: {e}")
             print(f"x shape: {x.shape}, y shape: {y.shape}, x dtype: {x.dtype}")
             raise
+
+    def _train_per_step(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        params: dict,
+        eval_set: Optional[Tuple[np.ndarray, np.ndarray]],
+        init_model: Optional[Union["CatBoostRegressor", PerStepModel]],
+        categories: Optional[np.ndarray],
+    ) -> PerStepModel:
+        n_steps = y.shape[1]
+        if init_model is not None and not isinstance(init_model, PerStepModel):
+            raise ValueError(
+                "The model was trained as a single multi-target model; "
+                "continue training with loss_function=MultiRMSE"
+            )
+
+        threads = params.get("thread_count", -1)
+        threads = available_cpus() if threads is None or threads <= 0 else threads
+        n_parallel = min(n_steps, threads)
+        step_params = {**params, "thread_count": max(threads // n_parallel, 1)}
+
+        def fit_step(step: int) -> "CatBoostRegressor":
+            step_eval = None if eval_set is None else (eval_set[0], eval_set[1][:, step])
+            step_init = None if init_model is None else init_model.models[step]
+            return self.train(x, y[:, step], step_params, step_eval, step_init, categories)
+
+        if n_parallel == 1:
+            return PerStepModel([fit_step(step) for step in range(n_steps)])
+        with ThreadPoolExecutor(max_workers=n_parallel) as pool:
+            return PerStepModel(list(pool.map(fit_step, range(n_steps))))
+
+    def best_score(self, model: Union["CatBoostRegressor", PerStepModel]) -> Tuple[float, int]:
+        """
+        Возвращает лучшее значение eval_metric модели (по умолчанию совпадает
+        с функцией потерь) на валидационной выборке и номер лучшей итерации.
+        Для PerStepModel — среднее значение по шагам и наибольшая из лучших итераций.
+        """
+        if isinstance(model, PerStepModel):
+            scores = [self.best_score(step_model) for step_model in model.models]
+            return float(np.mean([score for score, _ in scores])), max(iteration for _, iteration in scores)
+        scores = model.get_best_score()["validation"]
+        eval_metric = model.get_all_params().get("eval_metric")
+        score = scores[eval_metric] if eval_metric in scores else next(iter(scores.values()))
+        return float(score), int(model.get_best_iteration())
@@ -0,0 +1,19 @@
+from typing import TYPE_CHECKING, Sequence
+import numpy as np
+
+if TYPE_CHECKING:
+    from catboost import FeaturesData
+
+
+def panel_features(x: np.ndarray, categories: Sequence[str]) -> "FeaturesData":
+    """
+    Объединяет числовые признаки x и строковый категориальный признак строк
+    (идентификатор ряда) в FeaturesData: категориальный столбец идёт после
+    столбцов x. Используется и при обучении, и при прогнозе панельной модели.
+    """
+    from catboost import FeaturesData
+
+    return FeaturesData(
+        num_feature_data=np.ascontiguousarray(x, dtype=np.float32),
+        cat_feature_data=np.asarray(categories, dtype=object).reshape(-1, 1),
+    )
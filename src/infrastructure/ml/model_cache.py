@@ -0,0 +1,72 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from src.domain.interfaces import IModelCache
+
+
+class InMemoryModelCache(IModelCache):
+    """
+    LRU-кэш десериализованных моделей в памяти процесса.
+
+    Запись вытесняется, если к ней не обращались дольше ttl_seconds, а также
+    при превышении max_bytes (в первую очередь — самые давно использованные).
+    Размер записи оценивается по размеру сериализованной модели.
+    """
+
+    def __init__(self, max_bytes: int, ttl_seconds: float):
+        """
+        Параметры
+        ----------
+        max_bytes : int
+            Ограничение суммарного размера моделей в кэше.
+        ttl_seconds : float
+            Время жизни записи без обращений.
+        """
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        # model_id -> (модель, метаданные, размер, время последнего обращения)
+        self._entries: "OrderedDict[str, Tuple[Any, Dict[str, Any], int, float]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size_bytes(self) -> int:
+        """Суммарный размер моделей в кэше."""
+        return self._size
+
+    def get(self, model_id: str) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(model_id)
+            if entry is None or now - entry[3] > self.ttl_seconds:
+                if entry is not None:
+                    self._remove(model_id)
+                self.misses += 1
+                return None
+            model, metadata, size, _ = entry
+            self._entries[model_id] = (model, metadata, size, now)
+            self._entries.move_to_end(model_id)
+            self.hits += 1
+            return model, metadata
+
+    def put(self, model_id: str, model: Any, metadata: Dict[str, Any], size_bytes: int) -> None:
+        with self._lock:
+            if model_id in self._entries:
+                self._remove(model_id)
+            if size_bytes > self.max_bytes:
+                return
+            self._entries[model_id] = (model, metadata, size_bytes, time.monotonic())
+            self._size += size_bytes
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, model_id: str) -> None:
+        with self._lock:
+            if model_id in self._entries:
+                self._remove(model_id)
+
+    def _remove(self, model_id: str) -> None:
+        self._size -= self._entries.pop(model_id)[2]
@@ -0,0 +1,18 @@
+from typing import Any, List
+import numpy as np
+
+
+class PerStepModel:
+    """
+    Набор независимых моделей, по одной на каждый шаг горизонта (direct-подход).
+
+    predict вызывает все модели на одних и тех же строках признаков и
+    возвращает матрицу (n_samples, horizon), как и одна multi-target модель,
+    поэтому стратегии работают с ним так же, как с обычной моделью CatBoost.
+    """
+
+    def __init__(self, models: List[Any]):
+        self.models = models
+
+    def predict(self, data: Any) -> np.ndarray:
+        return np.column_stack([np.asarray(model.predict(data)).reshape(-1) for model in self.models])
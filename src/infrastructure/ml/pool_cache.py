@@ -0,0 +1,135 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+import numpy as np
+
+if TYPE_CHECKING:
+    from catboost import Pool
+
+# Параметры CatBoost, от которых зависят границы квантования признаков
+QUANTIZATION_PARAMS = (
+    "border_count",
+    "max_bin",
+    "feature_border_type",
+    "per_float_feature_quantization",
+    "nan_mode",
+    "ignored_features",
+    "random_seed",
+)
+
+
+def quantization_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Выбирает из параметров обучения те, что передаются в Pool.quantize."""
+    return {name: params[name] for name in QUANTIZATION_PARAMS if params.get(name) is not None}
+
+
+def pool_fingerprint(
+    x: np.ndarray, y: np.ndarray, quantization: Dict[str, Any], categories: Optional[np.ndarray] = None
+) -> str:
+    """
+    Хэш данных пула (признаки, цель, категориальный признак) и параметров квантования.
+    blake2b вместо sha256 — ключ нужен только внутри процесса, а хэшируется вся матрица.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for array in (x, y):
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        digest.update(array.data)
+    if categories is not None:
+        digest.update("\x1f".join(map(str, categories)).encode("utf-8"))
+    digest.update(json.dumps(quantization, sort_keys=True, default=str).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class QuantizedPoolCache:
+    """
+    LRU-кэш квантованных catboost.Pool.
+
+    CatBoost квантует признаки (вычисляет границы и переводит значения в номера
+    корзин) при каждом fit на сырых массивах; для матриц в сотни тысяч строк это
+    заметная часть времени обучения. Кэш хранит уже квантованные пулы по ключу
+    pool_fingerprint, поэтому попытки подбора, повторные /fit с другими
+    параметрами обучения на тех же данных квантование пропускают.
+
+    Размер записи оценивается по объёму квантованных данных: байт (два при
+    border_count > 255) на значение признака плюс цель в float32.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # ключ -> (пул, размер)
+        self._entries: "OrderedDict[str, Tuple[Pool, int]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size_bytes(self) -> int:
+        """Оценка суммарного размера пулов в кэше."""
+        return self._size
+
+    def get_or_build(
+        self, x: np.ndarray, y: np.ndarray, params: Dict[str, Any], data: Any = None
+    ) -> "Pool":
+        """
+        Возвращает квантованный пул для (x, y) с параметрами квантования из params.
+
+        Параметры
+        ----------
+        x, y : np.ndarray
+            Матрица признаков и цель.
+        params : Dict[str, Any]
+            Параметры обучения; учитываются только QUANTIZATION_PARAMS.
+        data : Any
+            Признаки для Pool вместо x (FeaturesData панельной модели); тогда
+            категориальный столбец data.cat_feature_data входит в ключ.
+        """
+        quantization = quantization_params(params)
+        categories = None if data is None else data.cat_feature_data.reshape(-1)
+        key = pool_fingerprint(x, y, quantization, categories)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        from catboost import Pool
+
+        # Квантование вне блокировки: параллельные шаги direct-модели квантуют свои пулы одновременно
+        pool = Pool(x if data is None else data, label=y)
+        pool.quantize(**quantization)
+        n_features = x.shape[1] + (0 if categories is None else 1)
+        value_bytes = 2 if quantization.get("border_count", quantization.get("max_bin", 254)) > 255 else 1
+        size = len(x) * n_features * value_bytes + y.size * 4
+        with self._lock:
+            if key not in self._entries and size <= self.max_bytes:
+                self._entries[key] = (pool, size)
+                self._size += size
+                while self._size > self.max_bytes:
+                    _, (_, evicted) = self._entries.popitem(last=False)
+                    self._size -= evicted
+        return pool
+
+
+_process_cache: Optional[QuantizedPoolCache] = None
+_process_lock = threading.Lock()
+
+
+def process_pool_cache(max_bytes: int) -> QuantizedPoolCache:
+    """
+    Возвращает кэш пулов текущего процесса.
+
+    Тренер передаётся в рабочие процессы пула обучения вместе с каждой задачей,
+    поэтому кэш хранится не в тренере, а в модуле — один на процесс, и переживает
+    задачи. Если max_bytes изменился, кэш создаётся заново.
+    """
+    global _process_cache
+    with _process_lock:
+        if _process_cache is None or _process_cache.max_bytes != max_bytes:
+            _process_cache = QuantizedPoolCache(max_bytes)
+        return _process_cache
@@ -0,0 +1,157 @@
+import os
+import pickle
+import struct
+import tempfile
+from typing import TYPE_CHECKING, Any
+from src.domain.interfaces import IModelSerializer
+from src.infrastructure.ml.per_step_model import PerStepModel
+
+if TYPE_CHECKING:
+    from catboost import CatBoostRegressor
+
+MODEL_FORMATS = ("cbm", "pickle")
+COMPRESSIONS = ("none", "zstd", "lz4")
+# Формат PerStepModel при model_format=cbm: это не cbm-файл, а контейнер из cbm-моделей шагов
+PER_STEP_FORMAT = "cbm-steps"
+# Заголовок контейнера cbm-steps: за ним число моделей (uint32 LE) и для каждой —
+# длина (uint64 LE) и байты cbm
+PER_STEP_MAGIC = b"TSFSTEP1"
+
+
+class CatBoostModelSerializer(IModelSerializer):
+    """
+    Сериализатор моделей CatBoost.
+
+    Поддерживает нативный формат CatBoost (cbm — тот же, что пишет save_model)
+    и pickle, а также необязательное сжатие zstd (пакет zstandard) или lz4
+    (пакет lz4). Восстановить можно модель в любом из этих форматов, независимо
+    от настроек, с которыми создан сериализатор.
+
+    PerStepModel при model_format=cbm сохраняется в формате cbm-steps
+    (PER_STEP_FORMAT): контейнер из cbm-моделей шагов с заголовком
+    PER_STEP_MAGIC. Этот формат сообщает format_of, чтобы клиент не пытался
+    загрузить контейнер как одну cbm-модель.
+    """
+
+    def __init__(self, model_format: str = "cbm", compression: str = "none"):
+        """
+        Параметры
+        ----------
+        model_format : str
+            Формат сохранения: cbm или pickle.
+        compression : str
+            Сжатие: none, zstd или lz4.
+
+        Исключения
+        ----------
+        ValueError
+            Если формат или сжатие не поддерживаются.
+        RuntimeError
+            Если для выбранного сжатия не установлен нужный пакет.
+        """
+        if model_format not in MODEL_FORMATS:
+            raise ValueError(f"Unknown model format: {model_format}")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression: {compression}")
+        _codec(compression)
+        self.model_format = model_format
+        self.compression = compression
+
+    def format_of(self, model: Any) -> str:
+        if self.model_format == "cbm" and isinstance(model, PerStepModel):
+            return PER_STEP_FORMAT
+        return self.model_format
+
+    def serialize(self, model: Any) -> bytes:
+        if self.format_of(model) == PER_STEP_FORMAT:
+            blobs = [_dump_cbm(step_model) for step_model in model.models]
+            data = b"".join(
+                [PER_STEP_MAGIC, struct.pack("<I", len(blobs))]
+                + [struct.pack("<Q", len(blob)) + blob for blob in blobs]
+            )
+        elif self.model_format == "cbm":
+            data = _dump_cbm(model)
+        else:
+            data = pickle.dumps(model)
+        return _compress(data, self.compression)
+
+    def deserialize(self, data: bytes, model_format: str, compression: str) -> Any:
+        data = _decompress(data, compression)
+        # Модели шагов, сохранённые до появления cbm-steps, помечены как cbm
+        if model_format == PER_STEP_FORMAT or (model_format == "cbm" and data.startswith(PER_STEP_MAGIC)):
+            return _load_per_step(data)
+        if model_format == "cbm":
+            return _load_cbm(data)
+        if model_format == "pickle":
+            return pickle.loads(data)
+        raise ValueError(f"Unknown model format: {model_format}")
+
+
+def _dump_cbm(model: "CatBoostRegressor") -> bytes:
+    """Возвращает байты модели в формате cbm: save_model пишет их во временный файл."""
+    fd, path = tempfile.mkstemp(suffix=".cbm")
+    os.close(fd)
+    try:
+        model.save_model(path, format="cbm")
+        with open(path, "rb") as f:
+            return f.read()
+    finally:
+        os.unlink(path)
+
+
+def _load_cbm(data: bytes) -> "CatBoostRegressor":
+    # CatBoost импортируется при первой загрузке модели, а не при старте сервиса
+    from catboost import CatBoostRegressor
+
+    model = CatBoostRegressor()
+    model.load_model(blob=data)
+    return model
+
+
+def _load_per_step(data: bytes) -> PerStepModel:
+    offset = len(PER_STEP_MAGIC)
+    (count,) = struct.unpack_from("<I", data, offset)
+    offset += 4
+    models = []
+    for _ in range(count):
+        (size,) = struct.unpack_from("<Q", data, offset)
+        offset += 8
+        models.append(_load_cbm(data[offset:offset + size]))
+        offset += size
+    return PerStepModel(models)
+
+
+def _codec(compression: str):
+    """Возвращает модуль сжатия или None; бросает RuntimeError, если пакет не установлен."""
+    if compression == "none":
+        return None
+    try:
+        if compression == "zstd":
+            import zstandard
+            return zstandard
+        if compression == "lz4":
+            import lz4.frame
+            return lz4.frame
+    except ImportError as e:
+        raise RuntimeError(
+            f"Compression '{compression}' requires an optional package: pip install 'timeseriesforecastapi[compression]'"
+        ) from e
+    raise ValueError(f"Unknown compression: {compression}")
+
+
+def _compress(data: bytes, compression: str) -> bytes:
+    codec = _codec(compression)
+    if codec is None:
+        return data
+    if compression == "zstd":
+        return codec.ZstdCompressor().compress(data)
+    return codec.compress(data)
+
+
+def _decompress(data: bytes, compression: str) -> bytes:
+    codec = _codec(compression)
+    if codec is None:
+        return data
+    if compression == "zstd":
+        return codec.ZstdDecompressor().decompress(data)
+    return codec.decompress(data)
@@ -0,0 +1,44 @@
+import os
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+# Число потоков, выделенное планировщиком пула текущей задаче рабочего процесса
+_thread_budget: Optional[int] = None
+
+
+def available_cpus() -> int:
+    """Число ядер, доступных процессу."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+@contextmanager
+def thread_budget(threads: Optional[int]) -> Iterator[None]:
+    """Ограничивает thread_count обучений внутри блока with (см. apply_thread_budget)."""
+    global _thread_budget
+    previous, _thread_budget = _thread_budget, threads
+    try:
+        yield
+    finally:
+        _thread_budget = previous
+
+
+def apply_thread_budget(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Подставляет в параметры CatBoost число потоков, выделенное задаче: без бюджета
+    параметры не меняются, thread_count клиента больше бюджета уменьшается до него,
+    а не заданный (или -1) становится равным бюджету.
+    """
+    if _thread_budget is None:
+        return params
+    requested = params.get("thread_count")
+    if requested is not None and 0 < requested <= _thread_budget:
+        return params
+    return {**params, "thread_count": _thread_budget}
+
+
+def run_with_thread_budget(threads: Optional[int], fn, *args: Any) -> Any:
+    """Выполняется в рабочем процессе: вызывает fn с бюджетом потоков, выделенным планировщиком."""
+    with thread_budget(threads):
+        return fn(*args)
@@ -0,0 +1,145 @@
+import json
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from src.domain.interfaces import ITrainingCache
+
+_KEY_RE = re.compile(r"^[0-9a-f]+$")
+
+
+class TrainingResultCache(ITrainingCache):
+    """
+    Двухуровневый кэш результатов обучения.
+
+    Первый уровень — LRU в памяти процесса с ограничением max_bytes. Второй,
+    необязательный, — каталог на диске (disk_path): запись хранится в файлах
+    <key>.bin (модель) и <key>.json (данные), записываемых атомарно; при
+    превышении disk_max_bytes удаляются записи, к которым дольше всего не
+    обращались. Запись, найденная на диске, поднимается в память.
+    """
+
+    def __init__(self, max_bytes: int, disk_path: Optional[str] = None, disk_max_bytes: Optional[int] = None):
+        """
+        Параметры
+        ----------
+        max_bytes : int
+            Ограничение суммарного размера записей в памяти.
+        disk_path : Optional[str]
+            Каталог дискового уровня; None — только память.
+        disk_max_bytes : Optional[int]
+            Ограничение суммарного размера записей на диске; None — без ограничения.
+        """
+        self.max_bytes = max_bytes
+        self.disk_path = disk_path
+        self.disk_max_bytes = disk_max_bytes
+        self.hits = 0
+        self.misses = 0
+        # key -> (модель, данные, размер)
+        self._entries: "OrderedDict[str, Tuple[bytes, Dict[str, Any], int]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        if disk_path is not None:
+            os.makedirs(disk_path, exist_ok=True)
+
+    @property
+    def size_bytes(self) -> int:
+        """Суммарный размер записей в памяти."""
+        return self._size
+
+    def get(self, key: str) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0], entry[1]
+            entry = self._read_disk(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._put_memory(key, *entry)
+            return entry
+
+    def put(self, key: str, model_data: bytes, payload: Dict[str, Any]) -> None:
+        with self._lock:
+            self._put_memory(key, model_data, payload)
+            self._write_disk(key, model_data, payload)
+
+    def _put_memory(self, key: str, model_data: bytes, payload: Dict[str, Any]) -> None:
+        if key in self._entries:
+            self._size -= self._entries.pop(key)[2]
+        size = len(model_data) + len(json.dumps(payload))
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (model_data, payload, size)
+        self._size += size
+        while self._size > self.max_bytes:
+            self._size -= self._entries.popitem(last=False)[1][2]
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        # Ключ попадает в имя файла, поэтому допускаем только шестнадцатеричный отпечаток
+        if not _KEY_RE.match(key):
+            raise ValueError(f"Invalid cache key: {key!r}")
+        return os.path.join(self.disk_path, f"{key}.bin"), os.path.join(self.disk_path, f"{key}.json")
+
+    def _read_disk(self, key: str) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+        if self.disk_path is None:
+            return None
+        blob_path, payload_path = self._paths(key)
+        try:
+            with open(payload_path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            with open(blob_path, "rb") as f:
+                model_data = f.read()
+            os.utime(payload_path)  # время последнего обращения для вытеснения
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return model_data, payload
+
+    def _write_disk(self, key: str, model_data: bytes, payload: Dict[str, Any]) -> None:
+        if self.disk_path is None:
+            return
+        blob_path, payload_path = self._paths(key)
+        # Сначала модель, затем данные: запись считается существующей, когда есть <key>.json
+        self._write_atomic(blob_path, model_data)
+        self._write_atomic(payload_path, json.dumps(payload).encode("utf-8"))
+        if self.disk_max_bytes is not None:
+            self._evict_disk()
+
+    def _write_atomic(self, path: str, data: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.disk_path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _evict_disk(self) -> None:
+        entries = []
+        total = 0
+        for name in os.listdir(self.disk_path):
+            if not name.endswith(".json"):
+                continue
+            key = name[:-len(".json")]
+            blob_path, payload_path = self._paths(key)
+            try:
+                size = os.path.getsize(payload_path) + os.path.getsize(blob_path)
+                entries.append((os.path.getmtime(payload_path), size, key))
+            except FileNotFoundError:
+                continue
+            total += size
+        for _, size, key in sorted(entries):
+            if total <= self.disk_max_bytes:
+                break
+            for path in self._paths(key):
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+            total -= size
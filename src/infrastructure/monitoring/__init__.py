@@ -0,0 +1,4 @@
+from .prometheus import MetricsRegistry, Counter, Histogram, CallbackGauge
+from .service_metrics import ServiceMetrics
+
+__all__ = ["MetricsRegistry", "Counter", "Histogram", "CallbackGauge", "ServiceMetrics"]
@@ -0,0 +1,76 @@
+from typing import Dict, Optional
+from src.application.use_cases import TrainingJobsUseCase
+from src.infrastructure.executors import ProcessPoolTrainingExecutor
+from src.infrastructure.monitoring.prometheus import MetricsRegistry
+
+
+class ServiceMetrics:
+    """
+    Метрики сервиса для /metrics: запросы HTTP и их длительность, ошибки,
+    длительности этапов обучения /fit, глубина очереди пула обучения и
+    попадания в кэши моделей и результатов обучения.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        self.registry = registry or MetricsRegistry()
+        self.requests = self.registry.counter(
+            "tsf_http_requests_total", "HTTP requests by route and status code", ("method", "path", "status")
+        )
+        self.errors = self.registry.counter(
+            "tsf_http_request_errors_total", "HTTP requests that ended with a 5xx status", ("method", "path")
+        )
+        self.request_duration = self.registry.histogram(
+            "tsf_http_request_duration_seconds", "HTTP request latency", ("method", "path")
+        )
+        self.fit_stage_duration = self.registry.histogram(
+            "tsf_fit_stage_duration_seconds", "Duration of /fit stages", ("stage",)
+        )
+
+    def observe_request(self, method: str, path: str, status: int, seconds: float) -> None:
+        self.requests.inc(method=method, path=path, status=str(status))
+        self.request_duration.observe(seconds, method=method, path=path)
+        if status >= 500:
+            self.errors.inc(method=method, path=path)
+
+    def observe_fit(self, timings: Optional[Dict[str, float]]) -> None:
+        for stage, seconds in (timings or {}).items():
+            self.fit_stage_duration.observe(seconds, stage=stage)
+
+    def watch_executor(self, executor: ProcessPoolTrainingExecutor) -> None:
+        self.registry.gauge(
+            "tsf_training_queue_depth",
+            "Training tasks accepted by the pool and not finished yet (running and queued)",
+            lambda: executor.pending,
+        )
+        self.registry.gauge(
+            "tsf_training_allocated_threads",
+            "CPU threads assigned by the scheduler to running training tasks",
+            lambda: executor.scheduler.allocated_threads,
+        )
+        self.registry.gauge(
+            "tsf_training_allocated_memory_bytes",
+            "Estimated memory of running training tasks",
+            lambda: executor.scheduler.allocated_memory,
+        )
+        if executor.shared_arrays is not None:
+            shared_arrays = executor.shared_arrays
+            self.registry.gauge(
+                "tsf_shared_memory_bytes",
+                "Size of feature matrices shared with training workers",
+                lambda: shared_arrays.nbytes,
+            )
+
+    def watch_jobs(self, jobs: TrainingJobsUseCase) -> None:
+        self.registry.gauge(
+            "tsf_training_jobs_pending", "Background training jobs not finished yet", lambda: jobs.pending
+        )
+
+    def watch_cache(self, prefix: str, description: str, cache) -> None:
+        """Экспортирует счётчики hits/misses кэша и долю попаданий."""
+        self.registry.counter_callback(f"{prefix}_hits_total", f"{description} hits", lambda: cache.hits)
+        self.registry.counter_callback(f"{prefix}_misses_total", f"{description} misses", lambda: cache.misses)
+        self.registry.gauge(
+            f"{prefix}_hit_ratio",
+            f"{description} hit ratio since start",
+            lambda: cache.hits / (cache.hits + cache.misses) if cache.hits + cache.misses else None,
+        )
@@ -1,3 +1,10 @@
 from .model_repository import InMemoryModelRepository
+from .disk_model_repository import DiskModelRepository
+from .job_repository import InMemoryTrainingJobRepository, SqliteTrainingJobRepository
 
-__all__ = ["InMemoryModelRepository"]
\ No newline at end of file
+__all__ = [
+    "InMemoryModelRepository",
+    "DiskModelRepository",
+    "InMemoryTrainingJobRepository",
+    "SqliteTrainingJobRepository",
+]
@@ -0,0 +1,130 @@
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+from typing import Dict, Any, List, Optional, Tuple
+from src.domain.interfaces import IModelRepository
+
+_MODEL_ID_RE = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+class DiskModelRepository(IModelRepository):
+    """
+    Реализация репозитория моделей на диске.
+
+    Бинарные данные каждой модели лежат в отдельном файле <root>/blobs/<model_id>.bin,
+    метаданные — в базе SQLite <root>/models.sqlite3 с индексом по series_id.
+    Файл модели записывается атомарно (через временный файл и os.replace),
+    поэтому модель, найденная в метаданных, всегда читается целиком.
+    """
+
+    def __init__(self, root: str):
+        """
+        Параметры
+        ----------
+        root : str
+            Каталог хранилища (создаётся при необходимости).
+        """
+        self.root = root
+        self._blob_dir = os.path.join(root, "blobs")
+        os.makedirs(self._blob_dir, exist_ok=True)
+        self._conn = sqlite3.connect(os.path.join(root, "models.sqlite3"), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS models (
+                    model_id TEXT PRIMARY KEY,
+                    series_id TEXT,
+                    size_bytes INTEGER NOT NULL,
+                    metadata TEXT NOT NULL
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_models_series_id ON models (series_id)")
+
+    def _blob_path(self, model_id: str) -> str:
+        # Идентификатор попадает в путь к файлу, поэтому не допускаем разделителей и '..'
+        if not _MODEL_ID_RE.match(model_id):
+            raise KeyError(model_id)
+        return os.path.join(self._blob_dir, f"{model_id}.bin")
+
+    def save(self, model_id: str, model_data: bytes, metadata: Dict[str, Any]) -> None:
+        path = self._blob_path(model_id)
+        fd, tmp_path = tempfile.mkstemp(dir=self._blob_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(model_data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO models VALUES (?, ?, ?, ?)",
+                (model_id, metadata.get("series_id"), len(model_data), json.dumps(metadata)),
+            )
+
+    def load(self, model_id: str) -> Tuple[bytes, Dict[str, Any]]:
+        """
+        Загружает модель и её метаданные по идентификатору.
+
+        Исключения
+        ----------
+        KeyError
+            Если модель с указанным model_id отсутствует в хранилище.
+        """
+        path = self._blob_path(model_id)
+        metadata = self.load_metadata(model_id)
+        with open(path, "rb") as f:
+            return f.read(), metadata
+
+    def load_metadata(self, model_id: str) -> Dict[str, Any]:
+        """Читает метаданные модели из базы, не открывая файл модели; KeyError, если модели нет."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT metadata FROM models WHERE model_id = ?", (model_id,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(model_id)
+        return json.loads(row[0])
+
+    def blob_file(self, model_id: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Путь к файлу модели и её метаданные без чтения файла; KeyError, если модели нет."""
+        return self._blob_path(model_id), self.load_metadata(model_id)
+
+    def exists(self, model_id: str) -> bool:
+        if not _MODEL_ID_RE.match(model_id):
+            return False
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM models WHERE model_id = ?", (model_id,)
+            ).fetchone()
+        return row is not None
+
+    def delete(self, model_id: str) -> None:
+        path = self._blob_path(model_id)
+        with self._lock, self._conn:
+            deleted = self._conn.execute("DELETE FROM models WHERE model_id = ?", (model_id,)).rowcount
+        if not deleted:
+            raise KeyError(model_id)
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+    def list(self, series_id: Optional[str] = None) -> List[Tuple[str, Dict[str, Any]]]:
+        with self._lock:
+            if series_id is None:
+                rows = self._conn.execute("SELECT model_id, metadata FROM models").fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT model_id, metadata FROM models WHERE series_id = ?", (series_id,)
+                ).fetchall()
+        return [(model_id, json.loads(metadata)) for model_id, metadata in rows]
+
+    def close(self) -> None:
+        """Закрывает соединение с базой метаданных."""
+        self._conn.close()
@@ -0,0 +1,196 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from src.domain.entities import TrainingJob, utc_now
+from src.domain.interfaces import ITrainingJobRepository
+from src.domain.value_objects import JobStatus
+
+
+class InMemoryTrainingJobRepository(ITrainingJobRepository):
+    """
+    Реализация хранилища задач обучения в оперативной памяти.
+
+    Хранит копии объектов TrainingJob, чтобы изменения задачи вне хранилища
+    становились видимы только после явного вызова save.
+
+    Завершённые задачи (вместе с результатом, в котором может быть модель в
+    base64) хранятся не дольше ttl_seconds и не больше max_finished штук:
+    сверх этого удаляются задачи, завершившиеся раньше других. Ожидающие и
+    выполняющиеся задачи не удаляются.
+    """
+
+    def __init__(self, max_finished: int = 1000, ttl_seconds: Optional[float] = 24 * 3600):
+        """
+        Параметры
+        ----------
+        max_finished : int
+            Сколько завершённых задач хранится одновременно.
+        ttl_seconds : Optional[float]
+            Сколько секунд хранится завершённая задача (None — без ограничения).
+        """
+        self.max_finished = max_finished
+        self.ttl_seconds = ttl_seconds
+        self._storage: Dict[str, TrainingJob] = {}
+        # job_id завершённой задачи -> время завершения (time.monotonic), в порядке завершения
+        self._finished: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def save(self, job: TrainingJob) -> None:
+        with self._lock:
+            self._storage[job.job_id] = replace(job)
+            if job.status in (JobStatus.DONE, JobStatus.FAILED):
+                self._finished[job.job_id] = time.monotonic()
+                self._finished.move_to_end(job.job_id)
+            self._evict()
+
+    def get(self, job_id: str) -> TrainingJob:
+        with self._lock:
+            self._evict()
+            return replace(self._storage[job_id])
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        while self._finished:
+            job_id, finished_at = next(iter(self._finished.items()))
+            expired = self.ttl_seconds is not None and now - finished_at > self.ttl_seconds
+            if not expired and len(self._finished) <= self.max_finished:
+                break
+            del self._finished[job_id]
+            del self._storage[job_id]
+
+
+class SqliteTrainingJobRepository(ITrainingJobRepository):
+    """
+    Реализация хранилища задач обучения в файле SQLite.
+
+    Задачи переживают перезапуск сервиса; результат (model_id, model_base64, metrics)
+    хранится в столбце result в виде JSON. Задачи, которые при открытии базы
+    ещё числятся ожидающими или выполняющимися, остались от прошлого запуска
+    сервиса и уже не завершатся: они помечаются как failed.
+
+    Завершённые задачи, как и в InMemoryTrainingJobRepository, хранятся не
+    дольше ttl_seconds и не больше max_finished штук: лишние удаляются из базы
+    при сохранении завершённой задачи и при чтении.
+    """
+
+    def __init__(self, path: str, max_finished: int = 1000, ttl_seconds: Optional[float] = 24 * 3600):
+        """
+        Параметры
+        ----------
+        path : str
+            Путь к файлу базы данных (создаётся при необходимости).
+        max_finished : int
+            Сколько завершённых задач хранится одновременно.
+        ttl_seconds : Optional[float]
+            Сколько секунд хранится завершённая задача (None — без ограничения).
+        """
+        self.max_finished = max_finished
+        self.ttl_seconds = ttl_seconds
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS training_jobs (
+                    job_id TEXT PRIMARY KEY,
+                    series_id TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    started_at TEXT,
+                    finished_at TEXT,
+                    error TEXT,
+                    result TEXT
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_training_jobs_finished_at ON training_jobs (finished_at)"
+            )
+            self._conn.execute(
+                "UPDATE training_jobs SET status = ?, error = ?, finished_at = ? WHERE status IN (?, ?)",
+                (
+                    JobStatus.FAILED.value,
+                    "Service restarted before the job finished",
+                    utc_now().isoformat(),
+                    JobStatus.QUEUED.value,
+                    JobStatus.RUNNING.value,
+                ),
+            )
+            self._evict()
+
+    def save(self, job: TrainingJob) -> None:
+        row = (
+            job.job_id,
+            job.series_id,
+            job.status.value,
+            job.created_at.isoformat(),
+            _to_iso(job.started_at),
+            _to_iso(job.finished_at),
+            job.error,
+            json.dumps(job.result) if job.result is not None else None,
+        )
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO training_jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?)", row
+            )
+            if job.status in (JobStatus.DONE, JobStatus.FAILED):
+                self._evict()
+
+    def get(self, job_id: str) -> TrainingJob:
+        with self._lock:
+            if self.ttl_seconds is not None:
+                with self._conn:
+                    self._evict_expired()
+            row = self._conn.execute(
+                "SELECT job_id, series_id, status, created_at, started_at, finished_at, error, result "
+                "FROM training_jobs WHERE job_id = ?",
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            raise KeyError(job_id)
+        return TrainingJob(
+            job_id=row[0],
+            series_id=row[1],
+            status=JobStatus(row[2]),
+            created_at=datetime.fromisoformat(row[3]),
+            started_at=_from_iso(row[4]),
+            finished_at=_from_iso(row[5]),
+            error=row[6],
+            result=json.loads(row[7]) if row[7] is not None else None,
+        )
+
+    def _evict(self) -> None:
+        """Удаляет просроченные и лишние завершённые задачи; вызывается под блокировкой в транзакции."""
+        self._evict_expired()
+        self._conn.execute(
+            "DELETE FROM training_jobs WHERE finished_at IS NOT NULL AND job_id NOT IN ("
+            "SELECT job_id FROM training_jobs WHERE finished_at IS NOT NULL "
+            "ORDER BY finished_at DESC LIMIT ?)",
+            (self.max_finished,),
+        )
+
+    def _evict_expired(self) -> None:
+        if self.ttl_seconds is None:
+            return
+        # Время хранится в ISO 8601 в UTC, поэтому строки сравниваются в хронологическом порядке
+        cutoff = (utc_now() - timedelta(seconds=self.ttl_seconds)).isoformat()
+        self._conn.execute(
+            "DELETE FROM training_jobs WHERE finished_at IS NOT NULL AND finished_at < ?", (cutoff,)
+        )
+
+    def close(self) -> None:
+        """Закрывает соединение с базой данных."""
+        self._conn.close()
+
+
+def _to_iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def _from_iso(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value is not None else None
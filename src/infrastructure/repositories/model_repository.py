@@ -1,4 +1,6 @@
-from typing import Dict, Any, Tuple
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 from src.domain.interfaces import IModelRepository
 
 
@@ -8,11 +10,28 @@ class InMemoryModelRepository(IModelRepository):
 
     Модели сохраняются во внутреннем словаре, где ключом является строковый идентификатор модели,
     а значением — кортеж (бинарные данные модели, словарь метаданных).
+    Если задан max_bytes, суммарный размер моделей ограничен: при превышении
+    вытесняются модели, к которым дольше всего не обращались (LRU).
     """
 
-    def __init__(self):
-        """Инициализирует пустое хранилище моделей."""
-        self._storage: Dict[str, Tuple[bytes, Dict[str, Any]]] = {}
+    def __init__(self, max_bytes: Optional[int] = None):
+        """
+        Инициализирует пустое хранилище моделей.
+
+        Параметры
+        ----------
+        max_bytes : Optional[int]
+            Ограничение суммарного размера бинарных данных моделей; None — без ограничения.
+        """
+        self.max_bytes = max_bytes
+        self._storage: "OrderedDict[str, Tuple[bytes, Dict[str, Any]]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size_bytes(self) -> int:
+        """Суммарный размер хранимых моделей в байтах."""
+        return self._size
 
     def save(self, model_id: str, model_data: bytes, metadata: Dict[str, Any]) -> None:
         """
@@ -27,7 +46,15 @@ class InMemoryModelRepository(IModelRepository):
         metadata : Dict[str, Any]
             Словарь с метаданными модели (серия, горизонт, лаги, стратегия, метрики и т.д.).
         """
-        self._storage[model_id] = (model_data, metadata)
+        with self._lock:
+            if model_id in self._storage:
+                self._size -= len(self._storage.pop(model_id)[0])
+            self._storage[model_id] = (model_data, metadata)
+            self._size += len(model_data)
+            # Вытесняем самые давние модели, но только что сохранённую оставляем всегда
+            while self.max_bytes is not None and self._size > self.max_bytes and len(self._storage) > 1:
+                _, (evicted, _) = self._storage.popitem(last=False)
+                self._size -= len(evicted)
 
     def load(self, model_id: str) -> Tuple[bytes, Dict[str, Any]]:
         """
@@ -48,4 +75,32 @@ class InMemoryModelRepository(IModelRepository):
         KeyError
             Если модель с указанным model_id отсутствует в хранилище.
         """
-        return self._storage[model_id]
+        with self._lock:
+            self._storage.move_to_end(model_id)
+            return self._storage[model_id]
+
+    def load_metadata(self, model_id: str) -> Dict[str, Any]:
+        with self._lock:
+            return self._storage[model_id][1]
+
+    def exists(self, model_id: str) -> bool:
+        with self._lock:
+            return model_id in self._storage
+
+    def delete(self, model_id: str) -> None:
+        with self._lock:
+            self._size -= len(self._storage.pop(model_id)[0])
+
+    def blob_file(self, model_id: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        # Модели хранятся только в памяти: байты отдаёт load
+        if not self.exists(model_id):
+            raise KeyError(model_id)
+        return None
+
+    def list(self, series_id: Optional[str] = None) -> List[Tuple[str, Dict[str, Any]]]:
+        with self._lock:
+            return [
+                (model_id, metadata)
+                for model_id, (_, metadata) in self._storage.items()
+                if series_id is None or metadata.get("series_id") == series_id
+            ]
@@ -0,0 +1,77 @@
+import gc
+import importlib
+import sys
+import time
+from typing import Any, Dict, Iterable, Optional
+
+# Модули, которые сервис загружает только при первом обучении или прогнозе:
+# CatBoost (вместе с ним — pandas) и реализации стратегий и метрик
+PRELOAD_MODULES = (
+    "catboost",
+    "src.infrastructure.ml.catboost_trainer",
+    "src.infrastructure.strategies",
+    "src.application.services.metrics",
+)
+
+# Тяжёлые модули, наличие которых в процессе показывает отчёт о запуске
+HEAVY_MODULES = ("catboost", "pandas", "pyarrow", "orjson", "zstandard", "lz4")
+
+
+def preload(modules: Iterable[str] = PRELOAD_MODULES, freeze: bool = True) -> None:
+    """
+    Импортирует модули, которые иначе загружаются при первом обучении.
+
+    Вызывается до fork рабочих процессов (gunicorn --preload), чтобы они
+    получили загруженные модули от мастера и разделяли их страницы памяти
+    (copy-on-write). С freeze=True объекты, созданные к этому моменту,
+    исключаются из сборки мусора (gc.freeze): сборщик не трогает их счётчики
+    и заголовки, и страницы не копируются в каждом рабочем процессе.
+    """
+    for module in modules:
+        importlib.import_module(module)
+    if freeze:
+        gc.freeze()
+
+
+def preload_worker(modules: Iterable[str]) -> None:
+    """Инициализатор рабочего процесса пула обучения: импортирует modules без gc.freeze."""
+    preload(modules, freeze=False)
+
+
+class StartupReport:
+    """
+    Длительности этапов запуска сервиса: mark(phase) записывает время,
+    прошедшее с предыдущей отметки (или с начала отсчёта).
+    """
+
+    def __init__(self, started: Optional[float] = None):
+        """
+        Параметры
+        ----------
+        started : Optional[float]
+            Начало отсчёта по time.perf_counter (по умолчанию — момент создания отчёта).
+        """
+        self.started = time.perf_counter() if started is None else started
+        self._last = self.started
+        self.phases: Dict[str, float] = {}
+        self.preloaded = False
+
+    def mark(self, phase: str) -> float:
+        """Завершает этап phase и возвращает его длительность в секундах."""
+        now = time.perf_counter()
+        self.phases[phase] = now - self._last
+        self._last = now
+        return self.phases[phase]
+
+    @property
+    def total_seconds(self) -> float:
+        return self._last - self.started
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Этапы запуска, общее время, признак preload и загруженные тяжёлые модули."""
+        return {
+            "phases": dict(self.phases),
+            "total_seconds": self.total_seconds,
+            "preloaded": self.preloaded,
+            "modules": {name: name in sys.modules for name in HEAVY_MODULES},
+        }
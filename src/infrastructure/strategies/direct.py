@@ -1,19 +1,40 @@
+from typing import List, Optional
 import numpy as np
 from src.domain.interfaces import IForecastStrategy
 from src.domain.entities import TimeSeries
 from src.domain.value_objects import ForecastHorizon, LagCount
+from src.infrastructure.strategies.lag_matrix import (
+    build_feature_matrix,
+    build_feature_row,
+    target_windows,
+    predict_in_chunks,
+)
 
 class DirectForecastStrategy(IForecastStrategy):
     """
-    Стратегия прямого многошагового прогнозирования (multi‑target).
+    Стратегия прямого многошагового прогнозирования.
 
     Формирует обучающие примеры, где каждый пример состоит из:
       - признаков: lags последних значений эндогенной переменной и экзогенных переменных в текущий момент;
       - целевой переменной: вектор следующих horizon значений эндогенной переменной.
 
-    Прогноз выполняется сразу на весь горизонт с помощью обученной модели,
-    которая возвращает вектор длины horizon.
+    С одномерной функцией потерь (по умолчанию) тренер обучает по отдельной
+    модели на каждый шаг горизонта (столбец цели). Прогноз выполняется сразу
+    на весь горизонт: все модели вызываются на одной общей строке признаков
+    и вместе возвращают вектор длины horizon.
     """
+    supports_panel = True
+
+    def __init__(self, predict_chunk_size: int = 65536):
+        """
+        Параметры
+        ----------
+        predict_chunk_size : int
+            Максимальное число строк в одном вызове model.predict при прогнозе
+            для нескольких рядов (forecast_many).
+        """
+        self.predict_chunk_size = predict_chunk_size
+
     def prepare_train_data(
         self, series: TimeSeries, horizon: ForecastHorizon, lags: LagCount
     ) -> tuple[np.ndarray, np.ndarray]:
@@ -40,27 +61,17 @@ class DirectForecastStrategy(IForecastStrategy):
         ValueError
             Если длина ряда меньше lags + horizon.
         """
-        points = series.points
-        n = len(points)
+        n = len(series)
         min_required = lags.value + horizon.value
         if n < min_required:
             raise ValueError(f"Not enough points: need {min_required}, have {n}")
 
-        x, y = [], []
-        for i in range(lags.value, n - horizon.value + 1):
-            # Лаги эндогенной переменной
-            lag_values = [points[i - j - 1].endogenous for j in range(lags.value)]
-            # Экзогенные признаки в момент i, отсортированные по ключам для стабильности
-            exog = points[i].exogenous
-            exog_values = [exog[key] for key in sorted(exog.keys())]
-            features = lag_values + exog_values
-            x.append(features)
-
-            # Целевой вектор — следующие horizon значений
-            target = [points[i + k].endogenous for k in range(horizon.value)]
-            y.append(target)
-
-        return np.array(x, dtype=np.float32), np.array(y, dtype=np.float32)
+        endogenous, exogenous = series.endogenous, series.exogenous
+        # Позиции i, для которых есть lags значений до i и horizon значений начиная с i
+        start, stop = lags.value, n - horizon.value + 1
+        x = build_feature_matrix(endogenous, exogenous, lags.value, start, stop)
+        y = target_windows(endogenous, horizon.value, start, stop).astype(np.float32)
+        return x, y
 
     def forecast(
         self, model, series: TimeSeries, horizon: ForecastHorizon, lags: LagCount
@@ -84,21 +95,45 @@ class DirectForecastStrategy(IForecastStrategy):
         np.ndarray
             Массив предсказанных значений длины horizon.
         """
-        points = series.points
-        last_idx = len(points) - 1
+        endogenous, exogenous = series.endogenous, series.exogenous
+        # Последние lags значений эндогенной переменной и экзогенные из последней точки
+        x_pred = build_feature_row(endogenous, exogenous[-1], lags.value)
 
-        # Формируем вектор признаков из последних lags значений эндогенной переменной
-        lag_values = [points[last_idx - j].endogenous for j in range(lags.value)]
+        pred = model.predict(x_pred)  # форма (1, horizon)
+        return pred.flatten()
 
-        # Экзогенные переменные из последней точки, отсортированные по ключам
-        exog = points[last_idx].exogenous
-        exog_values = [exog[key] for key in sorted(exog.keys())]
+    def forecast_many(
+        self,
+        model,
+        series_list: List[TimeSeries],
+        horizon: ForecastHorizon,
+        lags: LagCount,
+        categories: Optional[List[str]] = None,
+    ) -> List[np.ndarray]:
+        """
+        Выполняет прогноз одной моделью для нескольких рядов.
 
-        features = lag_values + exog_values
-        x_pred = np.array([features], dtype=np.float32)
+        Строки признаков всех рядов собираются в одну матрицу, и модель вызывается
+        один раз на каждые predict_chunk_size строк. Результат совпадает с вызовом
+        forecast для каждого ряда по отдельности. Для панельной модели categories —
+        идентификаторы рядов в порядке series_list.
 
-        pred = model.predict(x_pred)  # форма (1, horizon)
-        return pred.flatten()
+        Возвращает
+        -------
+        List[np.ndarray]
+            Прогнозы длины horizon в порядке series_list.
+        """
+        if not series_list:
+            return []
+        x_pred = np.concatenate([
+            build_feature_row(series.endogenous, series.exogenous[-1], lags.value)
+            for series in series_list
+        ])
+        return list(predict_in_chunks(model, x_pred, self.predict_chunk_size, categories))
+
+    def train_rows(self, cutoff: int, horizon: ForecastHorizon, lags: LagCount) -> int:
+        """Строка позиции i использует цели endogenous[i:i + horizon], поэтому i + horizon <= cutoff."""
+        return max(cutoff - horizon.value + 1 - lags.value, 0)
 
     def extract_test_values(
         self, series: TimeSeries, horizon: ForecastHorizon
@@ -118,4 +153,4 @@ class DirectForecastStrategy(IForecastStrategy):
         np.ndarray
             Массив истинных значений длины horizon.
         """
-        return np.array([p.endogenous for p in series.points[-horizon.value:]])
+        return series.endogenous[-horizon.value:].copy()
@@ -0,0 +1,93 @@
+from typing import Optional, Sequence
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from src.infrastructure.ml.features import panel_features
+
+
+def lag_windows(endogenous: np.ndarray, lags: int, start: int, stop: int) -> np.ndarray:
+    """
+    Возвращает матрицу лагов для позиций i из [start, stop).
+
+    Строка для позиции i равна (endogenous[i - 1], endogenous[i - 2], ..., endogenous[i - lags]).
+    Результат — представление (view) над исходным массивом, без копирования.
+    """
+    windows = sliding_window_view(endogenous, lags)
+    return windows[start - lags:stop - lags, ::-1]
+
+
+def target_windows(endogenous: np.ndarray, horizon: int, start: int, stop: int) -> np.ndarray:
+    """
+    Возвращает матрицу целевых векторов (endogenous[i], ..., endogenous[i + horizon - 1])
+    для позиций i из [start, stop). Результат — представление без копирования.
+    """
+    return sliding_window_view(endogenous, horizon)[start:stop]
+
+
+def build_feature_matrix(
+    endogenous: np.ndarray, exogenous: np.ndarray, lags: int, start: int, stop: int
+) -> np.ndarray:
+    """
+    Собирает матрицу признаков [лаги | экзогенные] для позиций i из [start, stop).
+
+    Параметры
+    ----------
+    endogenous : np.ndarray
+        Эндогенная переменная формы (n,).
+    exogenous : np.ndarray
+        Экзогенные признаки формы (n, n_exog).
+    lags : int
+        Количество лагов.
+    start, stop : int
+        Диапазон позиций; требуется lags <= start <= stop.
+
+    Возвращает
+    -------
+    np.ndarray
+        Массив float32 формы (stop - start, lags + n_exog).
+    """
+    n_rows = max(stop - start, 0)
+    x = np.empty((n_rows, lags + exogenous.shape[1]), dtype=np.float32)
+    if n_rows:
+        x[:, :lags] = lag_windows(endogenous, lags, start, stop)
+        x[:, lags:] = exogenous[start:stop]
+    return x
+
+
+def build_feature_row(
+    endogenous: np.ndarray, exogenous_row: np.ndarray, lags: int
+) -> np.ndarray:
+    """
+    Собирает одну строку признаков для прогноза от конца ряда:
+    (endogenous[-1], ..., endogenous[-lags]) и переданные экзогенные значения.
+
+    Возвращает
+    -------
+    np.ndarray
+        Массив float32 формы (1, lags + n_exog).
+    """
+    n = len(endogenous)
+    x = np.empty((1, lags + len(exogenous_row)), dtype=np.float32)
+    x[0, :lags] = endogenous[n - lags:n][::-1]
+    x[0, lags:] = exogenous_row
+    return x
+
+
+def predict_in_chunks(
+    model, x: np.ndarray, chunk_size: int, categories: Optional[Sequence[str]] = None
+) -> np.ndarray:
+    """
+    Вызывает model.predict на матрице x частями не более chunk_size строк.
+    Для панельной модели categories — идентификаторы рядов строк x (см. panel_features).
+
+    Возвращает
+    -------
+    np.ndarray
+        Предсказания формы (len(x), n_outputs) — для одномерной модели n_outputs = 1.
+    """
+    preds = []
+    for start in range(0, len(x), chunk_size):
+        chunk = x[start:start + chunk_size]
+        if categories is not None:
+            chunk = panel_features(chunk, categories[start:start + chunk_size])
+        preds.append(np.asarray(model.predict(chunk)).reshape(min(chunk_size, len(x) - start), -1))
+    return np.concatenate(preds)
@@ -4,6 +4,8 @@ class MultiOutputForecastStrategy(DirectForecastStrategy):
     """
     Стратегия multi‑target прогнозирования.
     Является наследником DirectForecastStrategy, так как использует тот же подход:
-    формирование целевой переменной как вектора будущих значений.
+    формирование целевой переменной как вектора будущих значений. В отличие от
+    direct, обучается одна модель на весь горизонт (по умолчанию с функцией
+    потерь MultiRMSE, см. training_params).
     """
     pass
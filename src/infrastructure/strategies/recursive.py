@@ -1,7 +1,9 @@
+from typing import List, Optional
 import numpy as np
 from src.domain.interfaces import IForecastStrategy
 from src.domain.entities import TimeSeries
 from src.domain.value_objects import ForecastHorizon, LagCount
+from src.infrastructure.strategies.lag_matrix import build_feature_matrix, predict_in_chunks
 
 class RecursiveForecastStrategy(IForecastStrategy):
     """
@@ -14,6 +16,17 @@ class RecursiveForecastStrategy(IForecastStrategy):
     из последней известной точки (предполагается их неизменность на всём
     горизонте).
     """
+    supports_panel = True
+
+    def __init__(self, predict_chunk_size: int = 65536):
+        """
+        Параметры
+        ----------
+        predict_chunk_size : int
+            Максимальное число строк в одном вызове model.predict при прогнозе
+            для нескольких рядов (forecast_many).
+        """
+        self.predict_chunk_size = predict_chunk_size
 
     def prepare_train_data(
         self, series: TimeSeries, horizon: ForecastHorizon, lags: LagCount
@@ -49,23 +62,16 @@ class RecursiveForecastStrategy(IForecastStrategy):
             Если недостаточно данных для формирования хотя бы одного
             обучающего примера (длина ряда меньше или равна `lags`).
         """
-        points = series.points
-        n = len(points)
+        n = len(series)
         if n <= lags.value:
             raise ValueError(f"Not enough points for training: need > {lags.value}, have {n}")
 
-        x, y = [], []
-        # Последний индекс, для которого можно взять y = points[i+1], не заходя в тестовый период
-        max_i = n - horizon.value
-        for i in range(lags.value, max_i):
-            lag_values = [points[i - j - 1].endogenous for j in range(lags.value)]
-            exog = points[i].exogenous
-            exog_values = [exog[key] for key in sorted(exog.keys())]
-            features = lag_values + exog_values
-            x.append(features)
-            y.append(points[i + 1].endogenous)
-
-        return np.array(x, dtype=np.float32), np.array(y, dtype=np.float32)
+        endogenous, exogenous = series.endogenous, series.exogenous
+        # Последний индекс, для которого можно взять y = endogenous[i+1], не заходя в тестовый период
+        start, stop = lags.value, max(n - horizon.value, lags.value)
+        x = build_feature_matrix(endogenous, exogenous, lags.value, start, stop)
+        y = endogenous[start + 1:stop + 1].astype(np.float32)
+        return x, y
 
     def forecast(
         self, model, series: TimeSeries, horizon: ForecastHorizon, lags: LagCount
@@ -96,25 +102,58 @@ class RecursiveForecastStrategy(IForecastStrategy):
         np.ndarray
             Массив предсказанных значений длины `horizon`.
         """
-        points = series.points
-        n = len(points)
-        # Текущие лаги — последние `lags` значений эндогенной переменной
-        current_lags = [points[n - 1 - j].endogenous for j in range(lags.value)]
+        return self.forecast_many(model, [series], horizon, lags)[0]
+
+    def forecast_many(
+        self,
+        model,
+        series_list: List[TimeSeries],
+        horizon: ForecastHorizon,
+        lags: LagCount,
+        categories: Optional[List[str]] = None,
+    ) -> List[np.ndarray]:
+        """
+        Выполняет рекурсивный прогноз одной моделью для нескольких рядов одновременно.
+
+        Все ряды продвигаются по горизонту синхронно: на каждом шаге строки
+        признаков всех рядов передаются в модель одним вызовом (или частями
+        по predict_chunk_size строк), так что число вызовов модели равно horizon,
+        а не числу рядов × horizon.
+
+        Для каждого ряда хранится буфер истории длины lags + horizon: в начале
+        в нём последние lags известных значений, а предсказание шага t
+        записывается в позицию lags + t. Лаги шага t — это окно буфера
+        [t, t + lags), взятое в обратном порядке (от нового к старому), как и
+        при обучении; данные при этом не сдвигаются. Для панельной модели
+        categories — идентификаторы рядов в порядке series_list.
+
+        Возвращает
+        -------
+        List[np.ndarray]
+            Прогнозы длины horizon в порядке series_list.
+        """
+        if not series_list:
+            return []
+        n_series, n_lags, n_steps = len(series_list), lags.value, horizon.value
+
+        history = np.empty((n_series, n_lags + n_steps), dtype=np.float64)
+        for i, series in enumerate(series_list):
+            history[i, :n_lags] = series.endogenous[len(series) - n_lags:]
+
         # Экзогенные переменные из последней точки (предполагаем их неизменность)
-        last_exog = points[-1].exogenous
-        exog_values = [last_exog[key] for key in sorted(last_exog.keys())]
+        exogenous = np.stack([series.exogenous[-1] for series in series_list])
+        x_pred = np.empty((n_series, n_lags + exogenous.shape[1]), dtype=np.float32)
+        x_pred[:, n_lags:] = exogenous
+
+        for step in range(n_steps):
+            x_pred[:, :n_lags] = history[:, step:step + n_lags][:, ::-1]
+            history[:, n_lags + step] = predict_in_chunks(model, x_pred, self.predict_chunk_size, categories)[:, 0]
 
-        predictions = []
-        for _ in range(horizon.value):
-            features = current_lags + exog_values
-            x_pred = np.array([features], dtype=np.float32)
-            pred = model.predict(x_pred)[0]  # ожидается скаляр
-            predictions.append(pred)
-            # Обновляем лаги: удаляем самый старый, добавляем новое предсказание
-            current_lags.pop(0)
-            current_lags.append(pred)
+        return list(history[:, n_lags:])
 
-        return np.array(predictions)
+    def train_rows(self, cutoff: int, horizon: ForecastHorizon, lags: LagCount) -> int:
+        """Строка позиции i использует цель endogenous[i + 1], поэтому i + 1 < cutoff."""
+        return max(cutoff - 1 - lags.value, 0)
 
     def extract_test_values(
         self, series: TimeSeries, horizon: ForecastHorizon
@@ -134,4 +173,4 @@ class RecursiveForecastStrategy(IForecastStrategy):
         np.ndarray
             Массив истинных значений длины `horizon`.
         """
-        return np.array([p.endogenous for p in series.points[-horizon.value:]])
+        return series.endogenous[-horizon.value:].copy()
@@ -1,15 +1,47 @@
+import time
+
+_started = time.perf_counter()
+
+import logging
 import uvicorn
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from dishka import make_async_container
 from dishka.integrations.fastapi import setup_dishka
 from src.infrastructure.api.controllers import router
 from src.infrastructure.api.dependencies import AppProvider
+from src.infrastructure.api.middleware import RequestMetricsMiddleware
+from src.infrastructure.config import Settings
+from src.infrastructure.startup import StartupReport, preload
+
+logger = logging.getLogger(__name__)
+startup = StartupReport(_started)
+startup.mark("imports")
 
-app = FastAPI(title="CatBoost Time Series Trainer")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    startup.mark("lifespan")
+    logger.info("Startup finished in %.3fs: %s", startup.total_seconds, startup.phases)
+    yield
+    # Останавливаем пул обучения и прочие ресурсы уровня приложения
+    await app.state.dishka_container.close()
+
+app = FastAPI(title="CatBoost Time Series Trainer", lifespan=lifespan)
 app.include_router(router)
+app.add_middleware(RequestMetricsMiddleware)
 
 container = make_async_container(AppProvider())
 setup_dishka(container, app)
+app.state.startup = startup
+startup.mark("app")
+
+# CatBoost, стратегии и метрики загружаются при первом обучении или прогнозе;
+# TSF_PRELOAD=true загружает их сразу, до fork рабочих процессов сервера
+if Settings().preload:
+    preload()
+    startup.preloaded = True
+    startup.mark("preload")
 
 if __name__ == "__main__":
     uvicorn.run(
@@ -17,4 +49,4 @@ if __name__ == "__main__":
         host="127.0.0.1",
         port=8080,
         reload=True
-    )
\ No newline at end of file
+    )
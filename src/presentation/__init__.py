@@ -1,9 +1,108 @@
-from .schemas import TimePointSchema, FitRequestSchema, FitResponseSchema
-from .mappers import map_request_schema_to_dto
+from .schemas import (
+    TimePointSchema,
+    FitRequestSchema,
+    FitUploadParamsSchema,
+    FitResponseSchema,
+    JobCreatedSchema,
+    TrainingCacheStatsSchema,
+    ScheduledTaskSchema,
+    SchedulerStateSchema,
+    StartupReportSchema,
+    JobStatusSchema,
+    BatchFitItemSchema,
+    BatchFitRequestSchema,
+    BatchFitItemResultSchema,
+    ModelInfoSchema,
+    PredictRequestSchema,
+    PredictResponseSchema,
+    BatchPredictSeriesSchema,
+    BatchPredictRequestSchema,
+    BatchPredictResponseSchema,
+    BacktestRequestSchema,
+    BacktestFoldSchema,
+    BacktestResponseSchema,
+    ParamRangeSchema,
+    SearchSpaceSchema,
+    TuneRequestSchema,
+    TuneTrialSchema,
+    TuneResponseSchema,
+    RefitRequestSchema,
+    PanelFitRequestSchema,
+    PanelFitResponseSchema,
+)
+from .mappers import (
+    map_request_schema_to_dto,
+    map_upload_to_dto,
+    map_fit_response_to_schema,
+    map_fit_response_to_content,
+    map_job_to_status_schema,
+    map_batch_item_to_dto,
+    map_batch_item_result_to_schema,
+    map_model_metadata_to_schema,
+    map_predict_schema_to_dto,
+    map_batch_predict_schema_to_dto,
+    map_backtest_schema_to_dto,
+    map_backtest_response_to_schema,
+    map_tune_schema_to_dto,
+    map_tune_response_to_schema,
+    map_refit_schema_to_dto,
+    map_panel_schema_to_dto,
+    map_panel_response_to_schema,
+    map_panel_response_to_content,
+)
+from .ingestion import parse_ndjson, parse_csv, parse_arrow, parse_timestamps
 
 __all__ = [
     "TimePointSchema",
     "FitRequestSchema",
+    "FitUploadParamsSchema",
     "FitResponseSchema",
+    "JobCreatedSchema",
+    "TrainingCacheStatsSchema",
+    "ScheduledTaskSchema",
+    "SchedulerStateSchema",
+    "StartupReportSchema",
+    "JobStatusSchema",
+    "BatchFitItemSchema",
+    "BatchFitRequestSchema",
+    "BatchFitItemResultSchema",
+    "ModelInfoSchema",
+    "PredictRequestSchema",
+    "PredictResponseSchema",
+    "BatchPredictSeriesSchema",
+    "BatchPredictRequestSchema",
+    "BatchPredictResponseSchema",
+    "BacktestRequestSchema",
+    "BacktestFoldSchema",
+    "BacktestResponseSchema",
+    "ParamRangeSchema",
+    "SearchSpaceSchema",
+    "TuneRequestSchema",
+    "TuneTrialSchema",
+    "TuneResponseSchema",
+    "RefitRequestSchema",
+    "PanelFitRequestSchema",
+    "PanelFitResponseSchema",
     "map_request_schema_to_dto",
+    "map_upload_to_dto",
+    "map_fit_response_to_schema",
+    "map_fit_response_to_content",
+    "map_job_to_status_schema",
+    "map_batch_item_to_dto",
+    "map_batch_item_result_to_schema",
+    "map_model_metadata_to_schema",
+    "map_predict_schema_to_dto",
+    "map_batch_predict_schema_to_dto",
+    "map_backtest_schema_to_dto",
+    "map_backtest_response_to_schema",
+    "map_tune_schema_to_dto",
+    "map_tune_response_to_schema",
+    "map_refit_schema_to_dto",
+    "map_panel_schema_to_dto",
+    "map_panel_response_to_schema",
+    "map_panel_response_to_content",
+    "parse_ndjson",
+    "parse_csv",
+    "parse_arrow",
+    "parse_timestamps",
 ]
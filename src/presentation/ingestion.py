@@ -0,0 +1,199 @@
+import io
+import json
+import warnings
+from datetime import datetime
+from typing import AsyncIterator, List, Tuple
+import numpy as np
+from fastapi.concurrency import run_in_threadpool
+from src.domain.entities import datetime_to_ns
+
+# Колонки ряда: метки времени (int64, нс), эндогенная (float64), экзогенные (float64, n × k), имена экзогенных
+Columns = Tuple[np.ndarray, np.ndarray, np.ndarray, List[str]]
+
+TIMESTAMP_COLUMN = "timestamp"
+ENDOGENOUS_COLUMN = "endogenous"
+# Значение NaT в int64-представлении datetime64
+_NAT = np.iinfo(np.int64).min
+
+
+def parse_timestamps(values) -> np.ndarray:
+    """
+    Переводит метки времени в int64-наносекунды с начала эпохи.
+
+    Принимает массив datetime64 или строки ISO 8601. Строки без часового пояса
+    разбираются векторно средствами NumPy; строки с часовым поясом — по одной
+    через datetime.fromisoformat с приведением к UTC.
+
+    Исключения
+    ----------
+    ValueError
+        Если значение не является корректной меткой времени (в том числе NaT
+        или пропуск).
+    """
+    array = np.asarray(values)
+    if array.dtype.kind == "M":
+        timestamps = array.astype("datetime64[ns]").view(np.int64)
+        _reject_missing(timestamps == _NAT)
+        return timestamps
+    if array.dtype.kind not in "USO":
+        raise ValueError("Timestamps must be ISO 8601 strings")
+    array = array.astype(str)
+    # NumPy разбирает "NaT" и пустую строку как NaT, а в ряду точке без времени не место
+    _reject_missing(np.isin(np.char.lower(np.char.strip(array)), ("nat", "nan", "")))
+    try:
+        with warnings.catch_warnings():
+            # NumPy разбирает смещения часового пояса только с предупреждением — делаем это явно ниже
+            warnings.simplefilter("error")
+            return array.astype("datetime64[ns]").view(np.int64)
+    except (ValueError, UserWarning, DeprecationWarning):
+        pass
+    try:
+        return np.fromiter(
+            (datetime_to_ns(datetime.fromisoformat(v)) for v in array.tolist()), dtype=np.int64, count=len(array)
+        )
+    except ValueError as e:
+        raise ValueError(f"Invalid timestamp: {e}") from e
+
+
+def _reject_missing(missing: np.ndarray) -> None:
+    rows = np.flatnonzero(missing)
+    if len(rows):
+        raise ValueError(f"Invalid timestamp: missing or NaT value at row {rows[0] + 1}")
+
+
+async def parse_ndjson(chunks: AsyncIterator[bytes]) -> Columns:
+    """
+    Разбирает поток NDJSON, где каждая строка — точка
+    {"timestamp": ..., "endogenous": ..., "exogenous": {...}}.
+
+    Данные читаются по частям и сразу раскладываются в колонки,
+    без создания pydantic-объекта на каждую точку. Разбор частей и сборка
+    колонок выполняются в пуле потоков, не блокируя цикл событий.
+
+    Исключения
+    ----------
+    ValueError
+        Если строка не является корректной точкой или наборы экзогенных признаков различаются.
+    """
+    timestamps: List[str] = []
+    endogenous: List[float] = []
+    exogenous: List[List[float]] = []
+    names: List[str] = []
+    keys = None
+
+    def add_lines(lines: List[bytes]) -> None:
+        for line in lines:
+            add_line(line)
+
+    def add_line(line: bytes) -> None:
+        nonlocal keys, names
+        if not line.strip():
+            return
+        try:
+            point = json.loads(line)
+            exog = point.get("exogenous") or {}
+            if keys is None:
+                keys = exog.keys()
+                names = sorted(keys)
+            elif exog.keys() != keys:
+                raise ValueError("All points must have the same set of exogenous features")
+            timestamps.append(point[TIMESTAMP_COLUMN])
+            endogenous.append(float(point[ENDOGENOUS_COLUMN]))
+            exogenous.append([float(exog[name]) for name in names])
+        except (json.JSONDecodeError, KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"Invalid NDJSON point at line {len(timestamps) + 1}: {e}") from e
+
+    def build() -> Columns:
+        if not timestamps:
+            raise ValueError("Time series must contain at least one point")
+        return (
+            parse_timestamps(timestamps),
+            np.asarray(endogenous, dtype=np.float64),
+            np.asarray(exogenous, dtype=np.float64).reshape(len(timestamps), len(names)),
+            names,
+        )
+
+    tail = b""
+    async for chunk in chunks:
+        lines = (tail + chunk).split(b"\n")
+        tail = lines.pop()
+        if lines:
+            await run_in_threadpool(add_lines, lines)
+    add_line(tail)
+    return await run_in_threadpool(build)
+
+
+def parse_csv(data: bytes) -> Columns:
+    """
+    Разбирает CSV с заголовком: колонки timestamp и endogenous, остальные — экзогенные признаки.
+    """
+    import pandas as pd
+
+    try:
+        frame = pd.read_csv(io.BytesIO(data), dtype={TIMESTAMP_COLUMN: str})
+    except (ValueError, pd.errors.ParserError) as e:
+        raise ValueError(f"Invalid CSV: {e}") from e
+    return _columns_from_table(
+        {name: frame[name].to_numpy() for name in frame.columns}, list(frame.columns)
+    )
+
+
+def parse_arrow(data: bytes, file_format: str) -> Columns:
+    """
+    Разбирает таблицу Arrow IPC (stream или file) либо Parquet с колонками
+    timestamp, endogenous и экзогенными признаками. Требует пакет pyarrow.
+
+    Параметры
+    ----------
+    data : bytes
+        Содержимое загруженного файла.
+    file_format : str
+        arrow_stream, arrow_file или parquet.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as e:
+        raise RuntimeError(
+            "Arrow and Parquet uploads require pyarrow: pip install 'timeseriesforecastapi[arrow]'"
+        ) from e
+
+    try:
+        if file_format == "arrow_stream":
+            table = pa.ipc.open_stream(data).read_all()
+        elif file_format == "arrow_file":
+            table = pa.ipc.open_file(pa.BufferReader(data)).read_all()
+        else:
+            table = pa.parquet.read_table(pa.BufferReader(data))
+    except pa.ArrowInvalid as e:
+        raise ValueError(f"Invalid {file_format} data: {e}") from e
+
+    columns = {}
+    for name in table.column_names:
+        column = table.column(name)
+        if pa.types.is_timestamp(column.type):
+            # Метки с часовым поясом Arrow хранит в UTC — берём их как есть
+            column = column.cast(pa.timestamp("ns", tz=column.type.tz)).cast(pa.int64())
+            columns[name] = column.to_numpy().astype("datetime64[ns]")
+        else:
+            columns[name] = column.to_numpy()
+    return _columns_from_table(columns, table.column_names)
+
+
+def _columns_from_table(columns: dict, order: List[str]) -> Columns:
+    missing = [name for name in (TIMESTAMP_COLUMN, ENDOGENOUS_COLUMN) if name not in columns]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+    n = len(columns[TIMESTAMP_COLUMN])
+    if n == 0:
+        raise ValueError("Time series must contain at least one point")
+    names = sorted(name for name in order if name not in (TIMESTAMP_COLUMN, ENDOGENOUS_COLUMN))
+    try:
+        endogenous = np.asarray(columns[ENDOGENOUS_COLUMN], dtype=np.float64)
+        exogenous = np.empty((n, len(names)), dtype=np.float64)
+        for j, name in enumerate(names):
+            exogenous[:, j] = np.asarray(columns[name], dtype=np.float64)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Non-numeric value in series columns: {e}") from e
+    return parse_timestamps(columns[TIMESTAMP_COLUMN]), endogenous, exogenous, names
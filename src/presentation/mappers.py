@@ -1,21 +1,323 @@
-from src.presentation.schemas import FitRequestSchema
-from src.application.dto import FitModelRequest, TimePointDTO
+from typing import Any, Dict, List, Optional
+from src.presentation.schemas import (
+    FitRequestSchema,
+    FitUploadParamsSchema,
+    FitResponseSchema,
+    JobStatusSchema,
+    BatchFitItemSchema,
+    BatchFitRequestSchema,
+    BatchFitItemResultSchema,
+    ModelInfoSchema,
+    PredictRequestSchema,
+    BatchPredictRequestSchema,
+    BacktestRequestSchema,
+    BacktestFoldSchema,
+    BacktestResponseSchema,
+    ParamRangeSchema,
+    TuneRequestSchema,
+    TuneTrialSchema,
+    TuneResponseSchema,
+    RefitRequestSchema,
+    BatchPredictSeriesSchema,
+    PanelFitRequestSchema,
+    PanelFitResponseSchema,
+)
+from src.application.dto import (
+    FitModelRequest,
+    FitModelResponse,
+    BatchFitItemResult,
+    PredictRequest,
+    SeriesColumns,
+    BatchPredictRequest,
+    PanelFitRequest,
+    PanelFitResponse,
+    BacktestRequest,
+    BacktestResponse,
+    ParamRange,
+    TuneRequest,
+    TuneResponse,
+    RefitModelRequest,
+)
+from src.domain.entities import columns_from_points, ns_to_datetime, TrainingJob
+from src.presentation.ingestion import Columns
 
 def map_request_schema_to_dto(schema: FitRequestSchema) -> FitModelRequest:
-    points = [
-        TimePointDTO(
-            timestamp=p.timestamp,
-            endogenous=p.endogenous,
-            exogenous=p.exogenous
-        )
-        for p in schema.points
-    ]
+    timestamps, endogenous, exogenous, exogenous_names = columns_from_points(schema.points)
     return FitModelRequest(
         time_series_id=schema.time_series_id,
-        points=points,
+        timestamps=timestamps,
+        endogenous=endogenous,
+        exogenous=exogenous,
+        exogenous_names=exogenous_names,
         horizon=schema.horizon,
         strategy=schema.strategy,
         lags=schema.lags,
         catboost_params=schema.catboost_params,
         metrics=schema.metrics,
+        model_response=schema.model_response,
+    )
+
+def map_upload_to_dto(params: FitUploadParamsSchema, columns: Columns) -> FitModelRequest:
+    timestamps, endogenous, exogenous, exogenous_names = columns
+    return FitModelRequest(
+        time_series_id=params.time_series_id,
+        timestamps=timestamps,
+        endogenous=endogenous,
+        exogenous=exogenous,
+        exogenous_names=exogenous_names,
+        horizon=params.horizon,
+        strategy=params.strategy,
+        lags=params.lags,
+        catboost_params=params.catboost_params,
+        metrics=params.metrics,
+        model_response=params.model_response,
+    )
+
+def map_fit_response_to_schema(response: FitModelResponse, model_url: Optional[str] = None) -> FitResponseSchema:
+    return FitResponseSchema(
+        model_id=response.model_id,
+        model_base64=response.model_base64,
+        model_url=model_url,
+        model_format=response.model_format,
+        compression=response.compression,
+        metrics=response.metrics,
+        timings=response.timings,
+    )
+
+def map_fit_response_to_content(response: FitModelResponse, model_url: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Тело ответа FitResponseSchema словарём, без построения схемы: ответ с моделью
+    в model_base64 кодируется в JSON один раз (FastJSONResponse). Ключи совпадают
+    с полями FitResponseSchema.
+    """
+    return {
+        "model_id": response.model_id,
+        "model_base64": response.model_base64,
+        "model_url": model_url,
+        "model_format": response.model_format,
+        "compression": response.compression,
+        "metrics": response.metrics,
+        "timings": response.timings,
+    }
+
+def map_job_to_status_schema(job: TrainingJob) -> JobStatusSchema:
+    queued_seconds = run_seconds = None
+    if job.started_at is not None:
+        queued_seconds = (job.started_at - job.created_at).total_seconds()
+        if job.finished_at is not None:
+            run_seconds = (job.finished_at - job.started_at).total_seconds()
+    return JobStatusSchema(
+        job_id=job.job_id,
+        series_id=job.series_id,
+        status=job.status.value,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        queued_seconds=queued_seconds,
+        run_seconds=run_seconds,
+        error=job.error,
+    )
+
+def map_batch_item_to_dto(item: BatchFitItemSchema, batch: BatchFitRequestSchema) -> FitModelRequest:
+    """Объединяет параметры ряда с общими параметрами пакета; бросает ValueError, если чего-то не хватает."""
+    params = {
+        "horizon": item.horizon if item.horizon is not None else batch.horizon,
+        "strategy": item.strategy if item.strategy is not None else batch.strategy,
+        "lags": item.lags if item.lags is not None else batch.lags,
+        "metrics": item.metrics if item.metrics is not None else batch.metrics,
+    }
+    missing = [name for name, value in params.items() if value is None]
+    if missing:
+        raise ValueError(f"Missing parameters: {', '.join(missing)}")
+    timestamps, endogenous, exogenous, exogenous_names = columns_from_points(item.points)
+    return FitModelRequest(
+        time_series_id=item.time_series_id,
+        timestamps=timestamps,
+        endogenous=endogenous,
+        exogenous=exogenous,
+        exogenous_names=exogenous_names,
+        catboost_params={**batch.catboost_params, **item.catboost_params},
+        model_response=batch.model_response,
+        **params,
+    )
+
+def map_batch_item_result_to_schema(
+    result: BatchFitItemResult, model_url: Optional[str] = None
+) -> BatchFitItemResultSchema:
+    return BatchFitItemResultSchema(
+        index=result.index,
+        time_series_id=result.time_series_id,
+        status="error" if result.error is not None else "ok",
+        model_id=result.model_id,
+        model_base64=result.model_base64,
+        model_url=model_url,
+        model_format=result.model_format,
+        compression=result.compression,
+        metrics=result.metrics,
+        error=result.error,
+    )
+
+def map_model_metadata_to_schema(model_id: str, metadata: Dict[str, Any]) -> ModelInfoSchema:
+    return ModelInfoSchema(
+        model_id=model_id,
+        series_id=metadata.get("series_id"),
+        horizon=metadata.get("horizon"),
+        lags=metadata.get("lags"),
+        strategy=metadata.get("strategy"),
+        metrics=metadata.get("metrics", {}),
+        created_at=metadata.get("created_at"),
+        model_format=metadata.get("model_format", "pickle"),
+        compression=metadata.get("compression", "none"),
+        parent_model_id=metadata.get("parent_model_id"),
+        panel=metadata.get("panel", False),
+    )
+
+def map_predict_schema_to_dto(schema: PredictRequestSchema) -> PredictRequest:
+    timestamps, endogenous, exogenous, exogenous_names = columns_from_points(schema.points)
+    return PredictRequest(
+        model_id=schema.model_id,
+        timestamps=timestamps,
+        endogenous=endogenous,
+        exogenous=exogenous,
+        exogenous_names=exogenous_names,
+    )
+
+def _series_columns(items: List[BatchPredictSeriesSchema]) -> List[SeriesColumns]:
+    series = []
+    for item in items:
+        timestamps, endogenous, exogenous, exogenous_names = columns_from_points(item.points)
+        series.append(SeriesColumns(
+            series_id=item.series_id,
+            timestamps=timestamps,
+            endogenous=endogenous,
+            exogenous=exogenous,
+            exogenous_names=exogenous_names,
+        ))
+    return series
+
+def map_batch_predict_schema_to_dto(schema: BatchPredictRequestSchema) -> BatchPredictRequest:
+    return BatchPredictRequest(model_id=schema.model_id, series=_series_columns(schema.series))
+
+def map_panel_schema_to_dto(schema: PanelFitRequestSchema) -> PanelFitRequest:
+    series = _series_columns(schema.series)
+    return PanelFitRequest(
+        time_series_id=schema.panel_id,
+        series=series,
+        exogenous_names=series[0].exogenous_names,
+        horizon=schema.horizon,
+        strategy=schema.strategy,
+        lags=schema.lags,
+        catboost_params=schema.catboost_params,
+        metrics=schema.metrics,
+        model_response=schema.model_response,
+    )
+
+def map_panel_response_to_schema(
+    response: PanelFitResponse, model_url: Optional[str] = None
+) -> PanelFitResponseSchema:
+    return PanelFitResponseSchema(
+        **map_fit_response_to_schema(response.fit, model_url).model_dump(),
+        series_metrics=response.series_metrics,
+    )
+
+def map_panel_response_to_content(response: PanelFitResponse, model_url: Optional[str] = None) -> Dict[str, Any]:
+    """Тело ответа PanelFitResponseSchema словарём (см. map_fit_response_to_content)."""
+    return {
+        **map_fit_response_to_content(response.fit, model_url),
+        "series_metrics": response.series_metrics,
+    }
+
+def map_backtest_schema_to_dto(schema: BacktestRequestSchema) -> BacktestRequest:
+    timestamps, endogenous, exogenous, exogenous_names = columns_from_points(schema.points)
+    return BacktestRequest(
+        time_series_id=schema.time_series_id,
+        timestamps=timestamps,
+        endogenous=endogenous,
+        exogenous=exogenous,
+        exogenous_names=exogenous_names,
+        horizon=schema.horizon,
+        strategy=schema.strategy,
+        lags=schema.lags,
+        catboost_params=schema.catboost_params,
+        metrics=schema.metrics,
+        n_folds=schema.n_folds,
+        step=schema.step,
+        window=schema.window,
+    )
+
+def map_backtest_response_to_schema(response: BacktestResponse) -> BacktestResponseSchema:
+    return BacktestResponseSchema(
+        time_series_id=response.time_series_id,
+        folds=[
+            BacktestFoldSchema(
+                fold=fold.index,
+                cutoff=ns_to_datetime(fold.cutoff),
+                train_size=fold.train_size,
+                metrics=fold.metrics,
+            )
+            for fold in response.folds
+        ],
+        metrics=response.metrics,
+        metrics_std=response.metrics_std,
+        metrics_by_step=response.metrics_by_step,
+    )
+
+def map_tune_schema_to_dto(schema: TuneRequestSchema) -> TuneRequest:
+    timestamps, endogenous, exogenous, exogenous_names = columns_from_points(schema.points)
+    search_space = {}
+    for name, spec in schema.search_space:
+        if isinstance(spec, ParamRangeSchema):
+            search_space[name] = ParamRange(low=spec.low, high=spec.high, log=spec.log)
+        elif spec is not None:
+            if not spec:
+                raise ValueError(f"Search space for {name} must not be empty")
+            search_space[name] = list(spec)
+    return TuneRequest(
+        time_series_id=schema.time_series_id,
+        timestamps=timestamps,
+        endogenous=endogenous,
+        exogenous=exogenous,
+        exogenous_names=exogenous_names,
+        horizon=schema.horizon,
+        strategy=schema.strategy,
+        lags=schema.lags,
+        catboost_params=schema.catboost_params,
+        metrics=schema.metrics,
+        search_space=search_space,
+        n_trials=schema.n_trials,
+        reduction_factor=schema.reduction_factor,
+        validation_fraction=schema.validation_fraction,
+        early_stopping_rounds=schema.early_stopping_rounds,
+        seed=schema.seed,
+        model_response=schema.model_response,
+    )
+
+def map_tune_response_to_schema(response: TuneResponse, model_url: Optional[str] = None) -> TuneResponseSchema:
+    return TuneResponseSchema(
+        **map_fit_response_to_schema(response.fit, model_url).model_dump(),
+        best_params=response.best_params,
+        best_score=response.best_score,
+        trials=[
+            TuneTrialSchema(
+                trial=trial.index,
+                params=trial.params,
+                score=trial.score,
+                best_iteration=trial.best_iteration,
+                rounds=trial.rounds,
+            )
+            for trial in response.trials
+        ],
+    )
+
+def map_refit_schema_to_dto(model_id: str, schema: RefitRequestSchema) -> RefitModelRequest:
+    timestamps, endogenous, exogenous, exogenous_names = columns_from_points(schema.points)
+    return RefitModelRequest(
+        model_id=model_id,
+        timestamps=timestamps,
+        endogenous=endogenous,
+        exogenous=exogenous,
+        exogenous_names=exogenous_names,
+        catboost_params=schema.catboost_params,
+        metrics=schema.metrics,
+        model_response=schema.model_response,
     )
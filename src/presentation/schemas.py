@@ -1,6 +1,6 @@
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, Json, model_validator
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Union
 
 class TimePointSchema(BaseModel):
     timestamp: datetime
@@ -15,16 +15,243 @@ class FitRequestSchema(BaseModel):
     lags: int = Field(..., ge=0)
     catboost_params: Dict[str, Any] = Field(default_factory=dict)
     metrics: List[str] = Field(..., min_items=1)
+    # Как вернуть модель: inline — base64 в ответе, omit — не возвращать, link — ссылка на /models/{id}/blob
+    model_response: str = Field("inline", pattern="^(inline|omit|link)$")
+    # Уникальность меток времени проверяет конструктор TimeSeries (400 при повторах)
 
-    @classmethod
-    @field_validator('points')
-    def unique_timestamps(cls, points: List[TimePointSchema]) -> List[TimePointSchema]:
-        timestamps = [p.timestamp for p in points]
-        if len(timestamps) != len(set(timestamps)):
-            raise ValueError('timestamps must be unique')
-        return points
+class FitUploadParamsSchema(BaseModel):
+    """Параметры обучения для /fit/upload: передаются в строке запроса, ряд — в теле."""
+    time_series_id: str
+    horizon: int = Field(..., gt=0)
+    strategy: str = Field(..., pattern="^(direct|recursive|multioutput)$")
+    lags: int = Field(..., ge=0)
+    # JSON-объект в строке запроса, например catboost_params={"iterations":100}
+    catboost_params: Json[Dict[str, Any]] = Field(default_factory=dict)
+    metrics: List[str] = Field(..., min_length=1)
+    model_response: str = Field("inline", pattern="^(inline|omit|link)$")
 
 class FitResponseSchema(BaseModel):
     model_id: str
-    model_base64: str
+    model_base64: Optional[str] = None
+    model_url: Optional[str] = None
+    model_format: str
+    compression: str
+    metrics: Dict[str, float]
+    # Длительности этапов обработки в секундах (map_request, build_series, prepare_train_data,
+    # train, forecast, metrics, serialize, save и др.); только для ответов, где они замерялись
+    timings: Optional[Dict[str, float]] = None
+
+class JobCreatedSchema(BaseModel):
+    job_id: str
+    status: str
+
+class TrainingCacheStatsSchema(BaseModel):
+    enabled: bool
+    hits: int
+    misses: int
+
+class ScheduledTaskSchema(BaseModel):
+    task_id: int
+    rows: Optional[int] = None  # None — задача без оценки ресурсов
+    features: Optional[int] = None
+    work: Optional[int] = None  # строки × признаки × итерации × число моделей
+    memory_bytes: int
+    threads: Optional[int] = None  # выделенный thread_count; None — ещё не запущена
+    waiting_seconds: float
+    running_seconds: Optional[float] = None
+
+class SchedulerStateSchema(BaseModel):
+    cpus: int
+    memory_bytes: Optional[int] = None  # None — память не ограничена
+    max_running: int
+    allocated_threads: int
+    allocated_memory_bytes: int
+    running: List[ScheduledTaskSchema]
+    queued: List[ScheduledTaskSchema]
+
+class StartupReportSchema(BaseModel):
+    # Этап запуска (imports, app, preload, lifespan) -> секунды
+    phases: Dict[str, float]
+    total_seconds: float
+    preloaded: bool
+    # Загружен ли тяжёлый модуль (catboost, pandas, ...) в процесс сервиса
+    modules: Dict[str, bool]
+
+class JobStatusSchema(BaseModel):
+    job_id: str
+    series_id: str
+    status: str
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    queued_seconds: Optional[float] = None
+    run_seconds: Optional[float] = None
+    error: Optional[str] = None
+
+class BatchFitItemSchema(BaseModel):
+    """Ряд в пакетном запросе; незаданные параметры берутся из общих полей запроса."""
+    time_series_id: str
+    points: List[TimePointSchema] = Field(..., min_length=1)
+    horizon: Optional[int] = Field(None, gt=0)
+    strategy: Optional[str] = Field(None, pattern="^(direct|recursive|multioutput)$")
+    lags: Optional[int] = Field(None, ge=0)
+    catboost_params: Dict[str, Any] = Field(default_factory=dict)
+    metrics: Optional[List[str]] = Field(None, min_length=1)
+
+class BatchFitRequestSchema(BaseModel):
+    items: List[BatchFitItemSchema] = Field(..., min_length=1)
+    horizon: Optional[int] = Field(None, gt=0)
+    strategy: Optional[str] = Field(None, pattern="^(direct|recursive|multioutput)$")
+    lags: Optional[int] = Field(None, ge=0)
+    # Общие параметры CatBoost; параметры ряда имеют приоритет
+    catboost_params: Dict[str, Any] = Field(default_factory=dict)
+    metrics: Optional[List[str]] = Field(None, min_length=1)
+    model_response: str = Field("inline", pattern="^(inline|omit|link)$")
+
+class BatchFitItemResultSchema(BaseModel):
+    index: int
+    time_series_id: str
+    status: str  # 'ok' или 'error'
+    model_id: Optional[str] = None
+    model_base64: Optional[str] = None
+    model_url: Optional[str] = None
+    model_format: Optional[str] = None
+    compression: Optional[str] = None
+    metrics: Optional[Dict[str, float]] = None
+    error: Optional[str] = None
+
+class ModelInfoSchema(BaseModel):
+    model_id: str
+    series_id: Optional[str] = None
+    horizon: Optional[int] = None
+    lags: Optional[int] = None
+    strategy: Optional[str] = None
+    metrics: Dict[str, float] = Field(default_factory=dict)
+    created_at: Optional[datetime] = None
+    model_format: Optional[str] = None
+    compression: Optional[str] = None
+    # Модель, от которой дообучена эта (POST /models/{id}/refit)
+    parent_model_id: Optional[str] = None
+    # Глобальная модель панели рядов (POST /fit/panel)
+    panel: bool = False
+
+class RefitRequestSchema(BaseModel):
+    # Только новые точки, идущие после последней точки, на которой обучалась модель
+    points: List[TimePointSchema] = Field(..., min_length=1)
+    # Поверх параметров исходной модели; iterations — число добавляемых деревьев (по умолчанию 100)
+    catboost_params: Dict[str, Any] = Field(default_factory=dict)
+    metrics: Optional[List[str]] = Field(None, min_length=1)
+    model_response: str = Field("inline", pattern="^(inline|omit|link)$")
+
+class PredictRequestSchema(BaseModel):
+    model_id: str
+    # Последние точки ряда; нужно не меньше lags точек модели
+    points: List[TimePointSchema] = Field(..., min_length=1)
+
+class PredictResponseSchema(BaseModel):
+    model_id: str
+    forecast: List[float]
+
+class BatchPredictSeriesSchema(BaseModel):
+    series_id: str
+    points: List[TimePointSchema] = Field(..., min_length=1)
+
+class BatchPredictRequestSchema(BaseModel):
+    model_id: str
+    series: List[BatchPredictSeriesSchema] = Field(..., min_length=1)
+
+class BatchPredictResponseSchema(BaseModel):
+    model_id: str
+    forecasts: Dict[str, List[float]]
+
+class PanelFitRequestSchema(BaseModel):
+    panel_id: str
+    # Ряды панели; экзогенные признаки у всех рядов должны совпадать
+    series: List[BatchPredictSeriesSchema] = Field(..., min_length=1)
+    horizon: int = Field(..., gt=0)
+    strategy: str = Field(..., pattern="^(direct|recursive|multioutput)$")
+    lags: int = Field(..., ge=0)
+    catboost_params: Dict[str, Any] = Field(default_factory=dict)
+    metrics: List[str] = Field(..., min_length=1)
+    model_response: str = Field("inline", pattern="^(inline|omit|link)$")
+
+class PanelFitResponseSchema(FitResponseSchema):
+    # Метрики по каждому ряду; metrics — среднее по рядам
+    series_metrics: Dict[str, Dict[str, float]]
+
+class BacktestRequestSchema(BaseModel):
+    time_series_id: str
+    points: List[TimePointSchema] = Field(..., min_length=1)
+    horizon: int = Field(..., gt=0)
+    strategy: str = Field(..., pattern="^(direct|recursive|multioutput)$")
+    lags: int = Field(..., ge=0)
+    catboost_params: Dict[str, Any] = Field(default_factory=dict)
+    metrics: List[str] = Field(..., min_length=1)
+    n_folds: int = Field(3, ge=1)
+    # Сдвиг точки отсечения между фолдами; по умолчанию horizon
+    step: Optional[int] = Field(None, gt=0)
+    # Длина скользящего окна обучения в точках; не задано — расширяющееся окно
+    window: Optional[int] = Field(None, gt=0)
+
+class BacktestFoldSchema(BaseModel):
+    fold: int
+    cutoff: datetime  # первая точка тестового периода
+    train_size: int
     metrics: Dict[str, float]
+
+class BacktestResponseSchema(BaseModel):
+    time_series_id: str
+    folds: List[BacktestFoldSchema]
+    metrics: Dict[str, float]
+    metrics_std: Dict[str, float]
+    # Значение метрики для каждого шага горизонта по всем фолдам
+    metrics_by_step: Dict[str, List[float]]
+
+class ParamRangeSchema(BaseModel):
+    low: float
+    high: float
+    # Выбирать равномерно в логарифмической шкале (удобно для learning_rate)
+    log: bool = False
+
+    @model_validator(mode="after")
+    def check_bounds(self) -> "ParamRangeSchema":
+        if self.low > self.high:
+            raise ValueError("low must not exceed high")
+        if self.log and self.low <= 0:
+            raise ValueError("log ranges require positive bounds")
+        return self
+
+class SearchSpaceSchema(BaseModel):
+    """Для каждого параметра — список значений или диапазон; незаданные берутся из catboost_params."""
+    iterations: Optional[Union[List[int], ParamRangeSchema]] = None
+    depth: Optional[Union[List[int], ParamRangeSchema]] = None
+    learning_rate: Optional[Union[List[float], ParamRangeSchema]] = None
+    l2_leaf_reg: Optional[Union[List[float], ParamRangeSchema]] = None
+
+class TuneRequestSchema(BaseModel):
+    time_series_id: str
+    points: List[TimePointSchema] = Field(..., min_length=1)
+    horizon: int = Field(..., gt=0)
+    strategy: str = Field(..., pattern="^(direct|recursive|multioutput)$")
+    lags: int = Field(..., ge=0)
+    catboost_params: Dict[str, Any] = Field(default_factory=dict)
+    metrics: List[str] = Field(..., min_length=1)
+    search_space: SearchSpaceSchema
+    n_trials: int = Field(9, ge=1)
+    reduction_factor: int = Field(3, ge=2)
+    validation_fraction: float = Field(0.2, gt=0, lt=1)
+    early_stopping_rounds: int = Field(20, ge=1)
+    seed: int = 0
+    model_response: str = Field("inline", pattern="^(inline|omit|link)$")
+
+class TuneTrialSchema(BaseModel):
+    trial: int
+    params: Dict[str, Any]
+    score: Optional[float] = None
+    best_iteration: Optional[int] = None
+    rounds: int
+
+class TuneResponseSchema(FitResponseSchema):
+    best_params: Dict[str, Any]
+    best_score: float
+    trials: List[TuneTrialSchema]
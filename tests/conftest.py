@@ -0,0 +1,86 @@
+import asyncio
+from concurrent.futures import Future
+import numpy as np
+import pytest
+from src.application.services.metrics import MAECalculator, RMSECalculator
+from src.application.services.training import ModelTrainingService
+from src.application.use_cases import FitModelUseCase
+from src.domain import ITrainingExecutor, MetricFactory, StrategyFactory
+from src.infrastructure.ml import CatBoostModelSerializer, CatBoostTrainer
+from src.infrastructure.repositories import InMemoryModelRepository
+from src.infrastructure.strategies import (
+    DirectForecastStrategy,
+    MultiOutputForecastStrategy,
+    RecursiveForecastStrategy,
+)
+
+# Небольшие модели в одном потоке: тесты проверяют поведение, а не качество
+CATBOOST_PARAMS = {"iterations": 20, "depth": 3, "random_seed": 0, "thread_count": 1, "verbose": False}
+DAY_NS = 86_400 * 10**9
+
+
+def make_columns(n, seed=0, level=100.0):
+    """Синтетический ряд с трендом, недельной сезонностью и одним экзогенным признаком."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(n)
+    timestamps = np.int64(1_700_000_000) * 10**9 + t.astype(np.int64) * DAY_NS
+    exogenous = rng.normal(size=(n, 1))
+    endogenous = level + 0.5 * t + 5 * np.sin(2 * np.pi * t / 7) + 2 * exogenous[:, 0] + rng.normal(size=n)
+    return timestamps, endogenous, exogenous
+
+
+class InlineExecutor(ITrainingExecutor):
+    """Исполнитель, выполняющий задачи сразу в текущем потоке; запоминает оценки ресурсов задач."""
+
+    def __init__(self):
+        self.costs = []
+
+    def submit(self, fn, *args, cost=None):
+        self.costs.append(cost)
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+    async def run(self, fn, *args, cost=None):
+        return await asyncio.wrap_future(self.submit(fn, *args, cost=cost))
+
+
+@pytest.fixture
+def strategy_factory():
+    return StrategyFactory({
+        "direct": DirectForecastStrategy(),
+        "multioutput": MultiOutputForecastStrategy(),
+        "recursive": RecursiveForecastStrategy(),
+    })
+
+
+@pytest.fixture
+def metric_factory():
+    return MetricFactory({"mae": MAECalculator(), "rmse": RMSECalculator()})
+
+
+@pytest.fixture
+def serializer():
+    return CatBoostModelSerializer()
+
+
+@pytest.fixture
+def model_repo():
+    return InMemoryModelRepository()
+
+
+@pytest.fixture
+def training_service(strategy_factory, metric_factory, serializer):
+    return ModelTrainingService(strategy_factory, CatBoostTrainer(), metric_factory, serializer)
+
+
+@pytest.fixture
+def fit_use_case(strategy_factory, metric_factory, serializer, model_repo, training_service):
+    return FitModelUseCase(
+        strategy_factory,
+        training_service.trainer,
+        model_repo,
+        metric_factory,
+        serializer,
+        training_service=training_service,
+    )
@@ -0,0 +1,94 @@
+import asyncio
+import numpy as np
+import pytest
+from conftest import CATBOOST_PARAMS, DAY_NS, InlineExecutor, make_columns
+from src.application.dto import BacktestRequest
+from src.application.services.training import training_params
+from src.application.use_cases import BacktestModelUseCase
+from src.domain import ForecastHorizon, LagCount, TimeSeries
+
+HORIZON, LAGS, N = 3, 7, 80
+
+
+def _backtest_request(strategy="direct", **overrides):
+    timestamps, endogenous, exogenous = make_columns(N)
+    fields = dict(
+        time_series_id="s",
+        timestamps=timestamps,
+        endogenous=endogenous,
+        exogenous=exogenous,
+        exogenous_names=["x"],
+        horizon=HORIZON,
+        strategy=strategy,
+        lags=LAGS,
+        catboost_params=dict(CATBOOST_PARAMS),
+        metrics=["mae", "rmse"],
+        n_folds=3,
+    )
+    fields.update(overrides)
+    return BacktestRequest(**fields)
+
+
+def _use_case(strategy_factory, training_service, metric_factory, executor=None):
+    return BacktestModelUseCase(strategy_factory, training_service.trainer, metric_factory, executor=executor)
+
+
+def _reference_forecast(request, training_service, cutoff):
+    """Прогноз модели, обученной только на точках до cutoff, без бэктеста."""
+    strategy = training_service.strategy_factory[request.strategy]
+    history = TimeSeries(
+        request.timestamps[:cutoff], request.endogenous[:cutoff], request.exogenous[:cutoff], ["x"]
+    )
+    # Все цели обучающих строк лежат до cutoff: у recursive цель — один следующий шаг
+    train_horizon = ForecastHorizon(1 if request.strategy == "recursive" else HORIZON)
+    x, y = strategy.prepare_train_data(history, train_horizon, LagCount(LAGS))
+    model = training_service.trainer.train(x, y, training_params(request.strategy, request.catboost_params))
+    return strategy.forecast(model, history, ForecastHorizon(HORIZON), LagCount(LAGS))
+
+
+@pytest.mark.parametrize("strategy", ["direct", "multioutput", "recursive"])
+def test_folds_match_model_trained_before_cutoff(strategy_factory, training_service, metric_factory, strategy):
+    request = _backtest_request(strategy)
+    response = asyncio.run(_use_case(strategy_factory, training_service, metric_factory).execute(request))
+
+    assert [fold.index for fold in response.folds] == [0, 1, 2]
+    for fold in response.folds:
+        cutoff = int(np.searchsorted(request.timestamps, fold.cutoff))
+        y_pred = _reference_forecast(request, training_service, cutoff)
+        y_true = request.endogenous[cutoff:cutoff + HORIZON]
+        assert fold.metrics["mae"] == pytest.approx(np.mean(np.abs(y_true - y_pred)), rel=1e-6)
+        assert fold.metrics["rmse"] == pytest.approx(np.sqrt(np.mean((y_true - y_pred) ** 2)), rel=1e-6)
+
+    # Точки отсечения сдвигаются на horizon, последний фолд проверяется на конце ряда
+    cutoffs = [fold.cutoff for fold in response.folds]
+    assert np.diff(cutoffs).tolist() == [HORIZON * DAY_NS] * 2
+    assert cutoffs[-1] == request.timestamps[N - HORIZON]
+    for name in ("mae", "rmse"):
+        values = [fold.metrics[name] for fold in response.folds]
+        assert response.metrics[name] == pytest.approx(np.mean(values))
+        assert response.metrics_std[name] == pytest.approx(np.std(values))
+        assert len(response.metrics_by_step[name]) == HORIZON
+
+
+def test_executor_gives_same_result_as_inline(strategy_factory, training_service, metric_factory):
+    request = _backtest_request(n_folds=4, step=5)
+    inline = asyncio.run(_use_case(strategy_factory, training_service, metric_factory).execute(request))
+    executor = InlineExecutor()
+    pooled = asyncio.run(_use_case(strategy_factory, training_service, metric_factory, executor).execute(request))
+
+    assert len(executor.costs) == 4
+    assert pooled == inline
+
+
+def test_sliding_window_limits_train_size(strategy_factory, training_service, metric_factory):
+    request = _backtest_request(window=30)
+    response = asyncio.run(_use_case(strategy_factory, training_service, metric_factory).execute(request))
+    sizes = [fold.train_size for fold in response.folds]
+    assert len(set(sizes)) == 1
+    assert sizes[0] <= 30
+
+
+def test_rejects_too_short_series(strategy_factory, training_service, metric_factory):
+    request = _backtest_request(n_folds=30)
+    with pytest.raises(ValueError):
+        asyncio.run(_use_case(strategy_factory, training_service, metric_factory).execute(request))
@@ -0,0 +1,68 @@
+import asyncio
+import numpy as np
+import pytest
+from conftest import CATBOOST_PARAMS, make_columns
+from src.application import BatchPredictRequest, PanelFitRequest, PredictRequest
+from src.application.dto import SeriesColumns
+from src.application.use_cases import FitPanelUseCase, PredictUseCase
+
+HORIZON, LAGS = 3, 7
+
+
+def _series(series_id, n, seed, level):
+    timestamps, endogenous, exogenous = make_columns(n, seed=seed, level=level)
+    return SeriesColumns(series_id, timestamps, endogenous, exogenous, ["x"])
+
+
+def _panel_request(series, strategy="direct"):
+    return PanelFitRequest(
+        time_series_id="panel",
+        series=series,
+        exogenous_names=["x"],
+        horizon=HORIZON,
+        strategy=strategy,
+        lags=LAGS,
+        catboost_params=dict(CATBOOST_PARAMS),
+        metrics=["mae", "rmse"],
+        model_response="omit",
+    )
+
+
+@pytest.mark.parametrize("strategy", ["direct", "multioutput", "recursive"])
+def test_panel_fit_and_batch_predict(fit_use_case, training_service, model_repo, strategy_factory, serializer, strategy):
+    series = [_series("s0", 60, 0, 100.0), _series("s1", 45, 1, 200.0), _series("s2", 70, 2, 300.0)]
+    response = asyncio.run(FitPanelUseCase(fit_use_case, training_service).execute(_panel_request(series, strategy)))
+
+    assert sorted(response.series_metrics) == ["s0", "s1", "s2"]
+    # Метрики панели — среднее по рядам
+    for name in ("mae", "rmse"):
+        expected = np.mean([metrics[name] for metrics in response.series_metrics.values()])
+        assert response.fit.metrics[name] == pytest.approx(expected)
+    _, metadata = model_repo.load(response.fit.model_id)
+    assert metadata["panel"] is True
+    assert metadata["n_series"] == 3
+
+    predict = PredictUseCase(strategy_factory, model_repo, serializer)
+    unseen = _series("unseen", 20, 3, 100.0)
+    batch = predict.execute_batch(BatchPredictRequest(response.fit.model_id, series + [unseen]))
+    assert list(batch.forecasts) == ["s0", "s1", "s2", "unseen"]
+    assert all(len(forecast) == HORIZON for forecast in batch.forecasts.values())
+    # Модель различает ряды по идентификатору: прогнозы рядов разного уровня отличаются
+    assert batch.forecasts["s0"][0] < batch.forecasts["s2"][0]
+
+    with pytest.raises(ValueError, match="panel model"):
+        predict.execute(PredictRequest(
+            response.fit.model_id, unseen.timestamps, unseen.endogenous, unseen.exogenous, ["x"]
+        ))
+
+
+def test_panel_rejects_duplicate_series_ids(fit_use_case, training_service):
+    series = [_series("s0", 60, 0, 100.0), _series("s0", 60, 1, 100.0)]
+    with pytest.raises(ValueError, match="Duplicate series ids"):
+        asyncio.run(FitPanelUseCase(fit_use_case, training_service).execute(_panel_request(series)))
+
+
+def test_panel_reports_failing_series(fit_use_case, training_service):
+    series = [_series("s0", 60, 0, 100.0), _series("short", LAGS, 1, 100.0)]
+    with pytest.raises(ValueError, match="Series short"):
+        asyncio.run(FitPanelUseCase(fit_use_case, training_service).execute(_panel_request(series)))
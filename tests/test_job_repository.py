@@ -0,0 +1,85 @@
+import time
+from src.domain import TrainingJob, JobStatus
+from src.domain.entities import utc_now
+from src.infrastructure.repositories import InMemoryTrainingJobRepository, SqliteTrainingJobRepository
+
+
+def _finished(repo, job_id):
+    job = TrainingJob(job_id=job_id, series_id="s")
+    repo.save(job)
+    job.status = JobStatus.DONE
+    repo.save(job)
+
+
+def test_in_memory_repository_keeps_at_most_max_finished_jobs():
+    repo = InMemoryTrainingJobRepository(max_finished=2, ttl_seconds=None)
+    repo.save(TrainingJob(job_id="queued", series_id="s"))
+    for job_id in ("a", "b", "c"):
+        _finished(repo, job_id)
+    assert repo.get("queued").status == JobStatus.QUEUED
+    assert repo.get("c").status == JobStatus.DONE
+    try:
+        repo.get("a")
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("the oldest finished job must be evicted")
+
+
+def test_in_memory_repository_expires_finished_jobs():
+    repo = InMemoryTrainingJobRepository(ttl_seconds=0.05)
+    _finished(repo, "a")
+    time.sleep(0.1)
+    try:
+        repo.get("a")
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("an expired job must be removed")
+
+
+def test_sqlite_repository_fails_unfinished_jobs_on_restart(tmp_path):
+    path = str(tmp_path / "jobs.sqlite3")
+    repo = SqliteTrainingJobRepository(path)
+    repo.save(TrainingJob(job_id="a", series_id="s", status=JobStatus.RUNNING))
+    repo.close()
+
+    repo = SqliteTrainingJobRepository(path)
+    job = repo.get("a")
+    repo.close()
+    assert job.status == JobStatus.FAILED
+    assert job.finished_at is not None
+
+
+def test_sqlite_repository_keeps_at_most_max_finished_jobs(tmp_path):
+    repo = SqliteTrainingJobRepository(str(tmp_path / "jobs.sqlite3"), max_finished=2, ttl_seconds=None)
+    repo.save(TrainingJob(job_id="queued", series_id="s"))
+    for job_id in ("a", "b", "c"):
+        job = TrainingJob(job_id=job_id, series_id="s", status=JobStatus.DONE)
+        job.finished_at = utc_now()
+        repo.save(job)
+        time.sleep(0.001)
+    assert repo.get("queued").status == JobStatus.QUEUED
+    assert repo.get("c").status == JobStatus.DONE
+    try:
+        repo.get("a")
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("the oldest finished job must be evicted")
+    repo.close()
+
+
+def test_sqlite_repository_expires_finished_jobs(tmp_path):
+    repo = SqliteTrainingJobRepository(str(tmp_path / "jobs.sqlite3"), ttl_seconds=0.05)
+    job = TrainingJob(job_id="a", series_id="s", status=JobStatus.DONE)
+    job.finished_at = utc_now()
+    repo.save(job)
+    time.sleep(0.1)
+    try:
+        repo.get("a")
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("an expired job must be removed")
+    repo.close()
@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta
+import numpy as np
+from src.domain import TimeSeries
+from src.domain.value_objects import ForecastHorizon, LagCount, TimePoint
+from src.infrastructure.strategies import (
+    DirectForecastStrategy,
+    MultiOutputForecastStrategy,
+    RecursiveForecastStrategy,
+)
+
+
+def _points(n, seed=0):
+    rng = np.random.default_rng(seed)
+    start = datetime(2024, 1, 1)
+    return [
+        TimePoint(
+            timestamp=start + timedelta(days=i),
+            endogenous=float(rng.normal() * 1e3),
+            exogenous={"b": float(rng.normal()), "a": float(rng.normal())},
+        )
+        for i in range(n)
+    ]
+
+
+def _direct_reference(points, horizon, lags):
+    # Построчная сборка до перехода на скользящие окна
+    x, y = [], []
+    for i in range(lags, len(points) - horizon + 1):
+        exog = points[i].exogenous
+        x.append([points[i - j - 1].endogenous for j in range(lags)] + [exog[k] for k in sorted(exog)])
+        y.append([points[i + k].endogenous for k in range(horizon)])
+    return np.array(x, dtype=np.float32), np.array(y, dtype=np.float32)
+
+
+def _recursive_reference(points, horizon, lags):
+    x, y = [], []
+    for i in range(lags, len(points) - horizon):
+        exog = points[i].exogenous
+        x.append([points[i - j - 1].endogenous for j in range(lags)] + [exog[k] for k in sorted(exog)])
+        y.append(points[i + 1].endogenous)
+    return np.array(x, dtype=np.float32), np.array(y, dtype=np.float32)
+
+
+def _assert_identical(actual, expected):
+    assert actual.dtype == expected.dtype
+    assert actual.shape == expected.shape
+    assert actual.tobytes() == expected.tobytes()
+
+
+def test_direct_matrices_match_reference():
+    points = _points(60)
+    series = TimeSeries.from_points(points)
+    for strategy in (DirectForecastStrategy(), MultiOutputForecastStrategy()):
+        for horizon, lags in ((1, 1), (3, 5), (7, 12)):
+            x, y = strategy.prepare_train_data(series, ForecastHorizon(horizon), LagCount(lags))
+            x_ref, y_ref = _direct_reference(points, horizon, lags)
+            _assert_identical(x, x_ref)
+            _assert_identical(y, y_ref)
+
+
+def test_recursive_matrices_match_reference():
+    points = _points(60, seed=1)
+    series = TimeSeries.from_points(points)
+    for horizon, lags in ((1, 1), (3, 5), (7, 12)):
+        x, y = RecursiveForecastStrategy().prepare_train_data(series, ForecastHorizon(horizon), LagCount(lags))
+        x_ref, y_ref = _recursive_reference(points, horizon, lags)
+        _assert_identical(x, x_ref)
+        _assert_identical(y, y_ref)
@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+from src.application.services.metrics import (
+    MAECalculator,
+    MAPECalculator,
+    MaxErrorCalculator,
+    MSECalculator,
+    R2Calculator,
+    RMSECalculator,
+    SMAPECalculator,
+)
+from src.application.services.metrics_engine import MetricsEngine
+from src.domain.interfaces import IMetricCalculator, MetricFactory
+
+
+def _reference(name, y_true, y_pred):
+    # Поэлементные формулы в том виде, как метрики считались до векторизации
+    error = y_true - y_pred
+    if name == "mae":
+        return np.mean(np.abs(error))
+    if name == "rmse":
+        return np.sqrt(np.mean(error ** 2))
+    if name == "mse":
+        return np.mean(error ** 2)
+    if name == "mape":
+        mask = y_true != 0
+        return np.mean(np.abs(error[mask] / y_true[mask])) * 100 if mask.any() else np.nan
+    if name == "smape":
+        denominator = (np.abs(y_true) + np.abs(y_pred)) / 2
+        mask = denominator != 0
+        return np.mean(np.abs(error[mask]) / denominator[mask]) * 100 if mask.any() else np.nan
+    if name == "r2":
+        ss_tot = np.sum((y_true - np.mean(y_true)) ** 2)
+        return 1.0 if ss_tot == 0 else 1 - np.sum(error ** 2) / ss_tot
+    if name == "max_error":
+        return np.max(np.abs(error))
+    raise AssertionError(name)
+
+
+CALCULATORS = {
+    "mae": MAECalculator(),
+    "rmse": RMSECalculator(),
+    "mse": MSECalculator(),
+    "mape": MAPECalculator(),
+    "smape": SMAPECalculator(),
+    "r2": R2Calculator(),
+    "max_error": MaxErrorCalculator(),
+}
+
+
+class _PlainMAE(IMetricCalculator):
+    """Калькулятор без calculate_many: движок вызывает его построчно."""
+    def calculate(self, y_true, y_pred):
+        return float(np.mean(np.abs(y_true - y_pred)))
+
+
+def _sample():
+    rng = np.random.default_rng(0)
+    y_true = rng.normal(10.0, 5.0, size=(6, 4))
+    y_pred = y_true + rng.normal(size=y_true.shape)
+    # Нули и постоянная строка проверяют ветви масок MAPE/SMAPE и R²
+    y_true[1, 2] = 0.0
+    y_true[2] = 0.0
+    y_pred[2, :2] = 0.0
+    y_true[3] = 7.0
+    return y_true, y_pred
+
+
+def test_calculate_matches_reference():
+    y_true, y_pred = _sample()
+    for name, calculator in CALCULATORS.items():
+        for t, p in zip(y_true, y_pred):
+            np.testing.assert_allclose(calculator.calculate(t, p), _reference(name, t, p), rtol=1e-12)
+
+
+def test_engine_per_series_and_per_step_match_calculators():
+    y_true, y_pred = _sample()
+    report = MetricsEngine(MetricFactory(CALCULATORS)).evaluate(y_true, y_pred, list(CALCULATORS), per_step=True)
+    for name in CALCULATORS:
+        per_series = [_reference(name, t, p) for t, p in zip(y_true, y_pred)]
+        per_step = [_reference(name, t, p) for t, p in zip(y_true.T, y_pred.T)]
+        np.testing.assert_allclose(report.per_series[name], per_series, rtol=1e-12)
+        np.testing.assert_allclose(report.per_step[name], per_step, rtol=1e-12)
+
+
+def test_engine_falls_back_to_row_by_row_calculate():
+    y_true, y_pred = _sample()
+    engine = MetricsEngine(MetricFactory({"mae": MAECalculator(), "plain": _PlainMAE()}))
+    report = engine.evaluate(y_true, y_pred, ["mae", "plain"], per_step=True)
+    np.testing.assert_allclose(report.per_series["plain"], report.per_series["mae"], rtol=1e-12)
+    np.testing.assert_allclose(report.per_step["plain"], report.per_step["mae"], rtol=1e-12)
+
+
+def test_engine_rejects_unknown_metric():
+    with pytest.raises(ValueError, match="Unknown metric"):
+        MetricsEngine(MetricFactory(CALCULATORS)).evaluate(np.ones(3), np.ones(3), ["nope"])
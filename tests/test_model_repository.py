@@ -0,0 +1,23 @@
+import os
+from src.infrastructure.repositories import InMemoryModelRepository, DiskModelRepository
+
+
+def test_in_memory_load_metadata():
+    repo = InMemoryModelRepository()
+    repo.save("m", b"model", {"series_id": "s"})
+    assert repo.load_metadata("m") == {"series_id": "s"}
+
+
+def test_disk_load_metadata_does_not_read_blob(tmp_path):
+    repo = DiskModelRepository(str(tmp_path))
+    repo.save("m", b"model", {"series_id": "s"})
+    path, _ = repo.blob_file("m")
+    os.unlink(path)
+    assert repo.load_metadata("m") == {"series_id": "s"}
+    try:
+        repo.load_metadata("missing")
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("a missing model must raise KeyError")
+    repo.close()
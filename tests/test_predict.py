@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from conftest import CATBOOST_PARAMS, make_columns
+from src.application import BatchPredictRequest, FitModelRequest, PredictRequest
+from src.application.dto import SeriesColumns
+from src.application.use_cases import PredictUseCase
+from src.domain import ModelNotFoundError
+from src.infrastructure.ml import InMemoryModelCache
+
+HORIZON, LAGS = 3, 7
+
+
+def _fit(fit_use_case, strategy):
+    timestamps, endogenous, exogenous = make_columns(80)
+    request = FitModelRequest(
+        time_series_id="s",
+        timestamps=timestamps,
+        endogenous=endogenous,
+        exogenous=exogenous,
+        exogenous_names=["x"],
+        horizon=HORIZON,
+        strategy=strategy,
+        lags=LAGS,
+        catboost_params=dict(CATBOOST_PARAMS),
+        metrics=["mae"],
+        model_response="omit",
+    )
+    return fit_use_case.execute(request).model_id
+
+
+def _series(series_id, n, seed):
+    timestamps, endogenous, exogenous = make_columns(n, seed=seed)
+    return SeriesColumns(series_id, timestamps, endogenous, exogenous, ["x"])
+
+
+def _predict_request(model_id, item):
+    return PredictRequest(model_id, item.timestamps, item.endogenous, item.exogenous, item.exogenous_names)
+
+
+@pytest.mark.parametrize("strategy", ["direct", "multioutput", "recursive"])
+def test_batch_matches_single_predictions(fit_use_case, strategy_factory, model_repo, serializer, strategy):
+    model_id = _fit(fit_use_case, strategy)
+    use_case = PredictUseCase(strategy_factory, model_repo, serializer)
+    items = [_series("a", 30, 1), _series("b", LAGS, 2), _series("c", 50, 3)]
+
+    batch = use_case.execute_batch(BatchPredictRequest(model_id, items))
+    assert list(batch.forecasts) == ["a", "b", "c"]
+    for item in items:
+        single = use_case.execute(_predict_request(model_id, item))
+        assert len(single.forecast) == HORIZON
+        assert all(np.isfinite(single.forecast))
+        np.testing.assert_allclose(batch.forecasts[item.series_id], single.forecast, rtol=1e-6)
+
+
+def test_cached_model_gives_same_forecast(fit_use_case, strategy_factory, model_repo, serializer):
+    model_id = _fit(fit_use_case, "direct")
+    cache = InMemoryModelCache(max_bytes=10**8, ttl_seconds=60)
+    use_case = PredictUseCase(strategy_factory, model_repo, serializer, model_cache=cache)
+    request = _predict_request(model_id, _series("a", 30, 1))
+
+    first = use_case.execute(request)
+    second = use_case.execute(request)
+    assert second.forecast == first.forecast
+    assert (cache.misses, cache.hits) == (1, 1)
+
+
+def test_missing_model(strategy_factory, model_repo, serializer):
+    use_case = PredictUseCase(strategy_factory, model_repo, serializer)
+    item = _series("a", 30, 1)
+    with pytest.raises(ModelNotFoundError):
+        use_case.execute(_predict_request("missing", item))
+    with pytest.raises(ModelNotFoundError):
+        use_case.execute_batch(BatchPredictRequest("missing", [item]))
+
+
+def test_rejects_series_not_fitting_the_model(fit_use_case, strategy_factory, model_repo, serializer):
+    model_id = _fit(fit_use_case, "direct")
+    use_case = PredictUseCase(strategy_factory, model_repo, serializer)
+    item = _series("a", 30, 1)
+
+    with pytest.raises(ValueError, match="Not enough points"):
+        use_case.execute(_predict_request(model_id, _series("a", LAGS - 1, 1)))
+    with pytest.raises(ValueError, match="Exogenous features"):
+        use_case.execute(PredictRequest(model_id, item.timestamps, item.endogenous, item.exogenous, ["y"]))
+    with pytest.raises(ValueError, match="Duplicate series ids"):
+        use_case.execute_batch(BatchPredictRequest(model_id, [item, item]))
@@ -0,0 +1,62 @@
+import asyncio
+import numpy as np
+from src.application.dto import RefitModelRequest
+from src.application.use_cases import RefitModelUseCase
+from src.application.use_cases.refit import REFIT_DEFAULT_ITERATIONS
+from src.domain import ModelNotFoundError
+from src.infrastructure.repositories import InMemoryModelRepository
+
+
+def test_missing_model_raises_model_not_found():
+    use_case = RefitModelUseCase(fit_use_case=None, training_service=None, model_repo=InMemoryModelRepository())
+    request = RefitModelRequest(
+        model_id="missing",
+        timestamps=np.array([1], dtype="datetime64[s]"),
+        endogenous=np.array([1.0]),
+        exogenous=np.empty((1, 0)),
+        exogenous_names=[],
+        catboost_params={},
+    )
+    try:
+        asyncio.run(use_case.execute(request))
+    except ModelNotFoundError:
+        pass
+    else:
+        raise AssertionError("a missing model must raise ModelNotFoundError")
+
+
+def _metadata(catboost_params):
+    return {
+        "snapshot": {"timestamps": [1, 2, 3], "endogenous": [1.0, 2.0, 3.0], "exogenous": [[], [], []]},
+        "exogenous_names": [],
+        "horizon": 1,
+        "strategy": "direct",
+        "lags": 2,
+        "catboost_params": catboost_params,
+    }
+
+
+def _refit_request(catboost_params):
+    return RefitModelRequest(
+        model_id="m",
+        timestamps=np.array([4, 5], dtype=np.int64),
+        endogenous=np.array([4.0, 5.0]),
+        exogenous=np.empty((2, 0)),
+        exogenous_names=[],
+        catboost_params=catboost_params,
+    )
+
+
+def test_refit_does_not_inherit_stored_iterations():
+    fit_request = RefitModelUseCase._build_request(
+        _refit_request({}), _metadata({"iterations": 1000, "depth": 4})
+    )
+    assert fit_request.catboost_params == {"iterations": REFIT_DEFAULT_ITERATIONS, "depth": 4}
+
+
+def test_refit_iterations_from_request():
+    fit_request = RefitModelUseCase._build_request(
+        _refit_request({"iterations": 20}), _metadata({"iterations": 1000})
+    )
+    assert fit_request.catboost_params["iterations"] == 20
+    assert list(fit_request.endogenous) == [1.0, 2.0, 3.0, 4.0, 5.0]
@@ -0,0 +1,52 @@
+import asyncio
+from types import SimpleNamespace
+from src.infrastructure.api.middleware import RequestMetricsMiddleware
+
+
+class _Metrics:
+    def __init__(self):
+        self.observed = []
+
+    def observe_request(self, method, path, status, seconds):
+        self.observed.append((method, path, status, seconds))
+
+
+async def _streaming_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"a", "more_body": True})
+    await asyncio.sleep(0.05)
+    await send({"type": "http.response.body", "body": b"b"})
+
+
+def _scope(metrics):
+    async def get(_):
+        return metrics
+
+    app = SimpleNamespace(state=SimpleNamespace(dishka_container=SimpleNamespace(get=get)))
+    return {"type": "http", "method": "GET", "app": app, "route": SimpleNamespace(path="/stream")}
+
+
+def test_duration_covers_whole_streaming_body():
+    metrics = _Metrics()
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(RequestMetricsMiddleware(_streaming_app)(_scope(metrics), None, send))
+    assert len(sent) == 3
+    [(method, path, status, seconds)] = metrics.observed
+    assert (method, path, status) == ("GET", "/stream", 200)
+    assert seconds >= 0.05
+
+
+def test_failed_request_is_observed_as_500():
+    async def failing_app(scope, receive, send):
+        raise RuntimeError("boom")
+
+    metrics = _Metrics()
+    try:
+        asyncio.run(RequestMetricsMiddleware(failing_app)(_scope(metrics), None, None))
+    except RuntimeError:
+        pass
+    assert [status for _, _, status, _ in metrics.observed] == [500]
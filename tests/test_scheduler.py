@@ -0,0 +1,46 @@
+from src.domain import TrainingCost
+from src.infrastructure.executors.scheduler import TrainingScheduler
+
+
+def _noop():
+    pass
+
+
+def test_lone_task_receives_all_cpus():
+    scheduler = TrainingScheduler(cpus=8, memory_bytes=None, max_running=8)
+    task = scheduler.create(_noop, (), TrainingCost(rows=100_000, features=50, work=10 ** 12))
+    scheduler.enqueue(task)
+    assert scheduler.next_ready() is task
+    assert task.threads == 8
+
+
+def test_queued_tasks_share_free_cpus():
+    scheduler = TrainingScheduler(cpus=8, memory_bytes=None, max_running=4)
+    long_task = scheduler.create(_noop, (), TrainingCost(rows=100_000, features=50, work=10 ** 12))
+    short_task = scheduler.create(_noop, (), TrainingCost(rows=100, features=5, work=10 ** 4))
+    scheduler.enqueue(long_task)
+    scheduler.enqueue(short_task)
+    assert scheduler.next_ready() is short_task
+    assert scheduler.next_ready() is long_task
+    assert (short_task.threads, long_task.threads) == (4, 4)
+    assert scheduler.allocated_threads == 8
+
+
+def test_freed_cpus_go_to_next_task():
+    scheduler = TrainingScheduler(cpus=4, memory_bytes=None, max_running=4)
+    first = scheduler.create(_noop, (), TrainingCost(rows=10, features=1, work=10))
+    scheduler.enqueue(first)
+    scheduler.next_ready()
+    second = scheduler.create(_noop, (), TrainingCost(rows=10, features=1, work=10))
+    scheduler.enqueue(second)
+    assert scheduler.next_ready() is None
+    scheduler.finish(first)
+    assert scheduler.next_ready() is second
+    assert second.threads == 4
+
+
+def test_client_thread_count_caps_allocation():
+    scheduler = TrainingScheduler(cpus=8, memory_bytes=None, max_running=2)
+    task = scheduler.create(_noop, (), TrainingCost(rows=10, features=1, work=10, threads=1))
+    scheduler.enqueue(task)
+    assert scheduler.next_ready().threads == 1
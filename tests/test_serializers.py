@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+from catboost import CatBoostRegressor
+from src.infrastructure.ml import CatBoostModelSerializer, PerStepModel
+from src.infrastructure.ml.serializers import PER_STEP_FORMAT
+
+CODEC_PACKAGES = {"none": None, "zstd": "zstandard", "lz4": "lz4.frame"}
+
+
+def _data():
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(64, 3)).astype(np.float32)
+    y = x @ np.array([1.0, -2.0, 0.5]) + rng.normal(scale=0.1, size=64)
+    return x, y
+
+
+def _model(x, y, seed=0):
+    model = CatBoostRegressor(
+        iterations=10, depth=3, random_seed=seed, thread_count=1, verbose=False, allow_writing_files=False
+    )
+    model.fit(x, y)
+    return model
+
+
+def _serializer(model_format, compression):
+    if CODEC_PACKAGES[compression]:
+        pytest.importorskip(CODEC_PACKAGES[compression])
+    return CatBoostModelSerializer(model_format=model_format, compression=compression)
+
+
+@pytest.mark.parametrize("compression", list(CODEC_PACKAGES))
+@pytest.mark.parametrize("model_format", ["cbm", "pickle"])
+def test_round_trip(model_format, compression):
+    x, y = _data()
+    model = _model(x, y)
+    serializer = _serializer(model_format, compression)
+
+    data = serializer.serialize(model)
+    assert serializer.format_of(model) == model_format
+    restored = serializer.deserialize(data, model_format, compression)
+    np.testing.assert_array_equal(restored.predict(x), model.predict(x))
+
+
+@pytest.mark.parametrize("compression", list(CODEC_PACKAGES))
+@pytest.mark.parametrize("model_format", ["cbm", "pickle"])
+def test_per_step_round_trip(model_format, compression):
+    x, y = _data()
+    model = PerStepModel([_model(x, y, seed=seed) for seed in range(3)])
+    serializer = _serializer(model_format, compression)
+
+    stored_format = serializer.format_of(model)
+    assert stored_format == (PER_STEP_FORMAT if model_format == "cbm" else "pickle")
+    restored = serializer.deserialize(serializer.serialize(model), stored_format, compression)
+    assert isinstance(restored, PerStepModel)
+    np.testing.assert_array_equal(restored.predict(x), model.predict(x))
+
+
+def test_per_step_container_stored_as_cbm_still_loads():
+    # Модели шагов, сохранённые до появления cbm-steps, помечены в метаданных как cbm
+    x, y = _data()
+    model = PerStepModel([_model(x, y, seed=seed) for seed in range(2)])
+    serializer = CatBoostModelSerializer()
+    restored = serializer.deserialize(serializer.serialize(model), "cbm", "none")
+    np.testing.assert_array_equal(restored.predict(x), model.predict(x))
+
+
+def test_deserialize_uses_stored_format_not_serializer_settings():
+    x, y = _data()
+    model = _model(x, y)
+    data = CatBoostModelSerializer(model_format="pickle").serialize(model)
+    restored = CatBoostModelSerializer(model_format="cbm").deserialize(data, "pickle", "none")
+    np.testing.assert_array_equal(restored.predict(x), model.predict(x))
+
+
+def test_rejects_unknown_settings():
+    with pytest.raises(ValueError):
+        CatBoostModelSerializer(model_format="onnx")
+    with pytest.raises(ValueError):
+        CatBoostModelSerializer(compression="gzip")
@@ -0,0 +1,42 @@
+import asyncio
+from concurrent.futures import Future
+from src.domain import ITrainingExecutor, TrainingQueueFullError
+
+
+class _OneSlotExecutor(ITrainingExecutor):
+    """Исполнитель с одним местом в очереди: выполняет задачу сразу, место освобождает следующий submit."""
+
+    def __init__(self):
+        self.busy = False
+        self.rejected = 0
+
+    def submit(self, fn, *args, cost=None):
+        if self.busy:
+            self.rejected += 1
+            self.busy = False
+            raise TrainingQueueFullError("full")
+        self.busy = True
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+    async def run(self, fn, *args, cost=None):
+        return await asyncio.wrap_future(self.submit(fn, *args, cost=cost))
+
+
+def test_as_completed_retries_when_queue_is_full():
+    executor = _OneSlotExecutor()
+
+    async def collect():
+        return [(index, future.result()) async for index, future in
+                executor.as_completed(pow, [(2, 1), (2, 2), (2, 3)], retry_delay=0.01)]
+
+    assert sorted(asyncio.run(collect())) == [(0, 2), (1, 4), (2, 8)]
+    assert executor.rejected > 0
+
+
+def test_run_queued_waits_for_free_slot():
+    executor = _OneSlotExecutor()
+    executor.busy = True
+    assert asyncio.run(executor.run_queued(pow, 3, 2, retry_delay=0.01)) == 9
+    assert executor.rejected == 1
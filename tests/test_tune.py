@@ -0,0 +1,67 @@
+import asyncio
+import pytest
+from conftest import CATBOOST_PARAMS, InlineExecutor, make_columns
+from src.application.dto import ParamRange, TuneRequest
+from src.application.services.tuning import TuningService
+from src.application.use_cases import TuneModelUseCase
+
+
+def _tune_request(**overrides):
+    timestamps, endogenous, exogenous = make_columns(90)
+    fields = dict(
+        time_series_id="s",
+        timestamps=timestamps,
+        endogenous=endogenous,
+        exogenous=exogenous,
+        exogenous_names=["x"],
+        horizon=3,
+        strategy="direct",
+        lags=7,
+        catboost_params={**CATBOOST_PARAMS, "iterations": 40},
+        metrics=["mae"],
+        search_space={"depth": [2, 3, 4], "learning_rate": ParamRange(0.03, 0.3, log=True)},
+        n_trials=4,
+        reduction_factor=2,
+        model_response="omit",
+    )
+    fields.update(overrides)
+    return TuneRequest(**fields)
+
+
+@pytest.fixture
+def tuning_service(strategy_factory, training_service, metric_factory, serializer):
+    return TuningService(strategy_factory, training_service.trainer, metric_factory, serializer)
+
+
+def test_successive_halving_saves_best_model(fit_use_case, tuning_service, model_repo):
+    response = asyncio.run(TuneModelUseCase(fit_use_case, tuning_service).execute(_tune_request()))
+
+    # 4 попытки, деление на 2: раунды 4 -> 2 -> 1
+    assert sorted(trial.rounds for trial in response.trials) == [1, 1, 2, 3]
+    [best] = [trial for trial in response.trials if trial.rounds == 3]
+    assert response.best_score == best.score
+    assert response.best_params["depth"] == best.params["depth"]
+    assert response.best_params["learning_rate"] == best.params["learning_rate"]
+    assert best.params["depth"] in (2, 3, 4)
+    assert 0.03 <= best.params["learning_rate"] <= 0.3
+
+    _, metadata = model_repo.load(response.fit.model_id)
+    assert metadata["catboost_params"] == response.best_params
+    assert set(response.fit.metrics) == {"mae"}
+
+
+def test_executor_gives_same_result_as_inline(fit_use_case, tuning_service):
+    request = _tune_request()
+    inline = asyncio.run(TuneModelUseCase(fit_use_case, tuning_service).execute(request))
+    executor = InlineExecutor()
+    pooled = asyncio.run(TuneModelUseCase(fit_use_case, tuning_service, executor=executor).execute(request))
+
+    assert len(executor.costs) == 4 + 2 + 1
+    assert pooled.best_params == inline.best_params
+    assert [trial.score for trial in pooled.trials] == [trial.score for trial in inline.trials]
+
+
+def test_rejects_untunable_parameter(fit_use_case, tuning_service):
+    request = _tune_request(search_space={"loss_function": ["RMSE"]})
+    with pytest.raises(ValueError, match="cannot be tuned"):
+        asyncio.run(TuneModelUseCase(fit_use_case, tuning_service).execute(request))